@@ -6,7 +6,7 @@ from .models import AccountState, Block
 @admin.register(Block)
 class BlockAdmin(admin.ModelAdmin):
     # TODO(dmu) MEDIUM: Improve representation of `body` field so it fits/wraps in the form nicely
-    fields = ('_id', 'body')
+    fields = ('_id', 'hash', 'body')
     readonly_fields = fields
 
 
@@ -1,17 +1,32 @@
+import functools
 import logging
 import math
-from typing import TYPE_CHECKING, Optional, Type, TypeVar  # noqa: I101
+import threading
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar  # noqa: I101
+
+from django.conf import settings
+from django.db import transaction
 
 from node.blockchain.constants import BLOCK_LOCK
 from node.blockchain.inner_models import Block, BlockMessage, Node, SignedChangeRequest
 from node.blockchain.mixins.crypto import HashableStringWrapper
 from node.blockchain.models import AccountState as ORMAccountState
 from node.blockchain.models import Node as ORMNode
-from node.blockchain.types import AccountLock, AccountNumber, BlockIdentifier, NodeRole, SigningKey
-from node.blockchain.utils.lock import lock
-from node.core.database import ensure_in_transaction
+from node.blockchain.repositories.archive import get_block_archive
+from node.blockchain.types import AccountLock, AccountNumber, BlockIdentifier, ChainTip, Hash, NodeRole, SigningKey
+from node.blockchain.utils.cache_invalidation import ensure_cache_invalidation_bus_started
+from node.blockchain.utils.checkpoint import validate_checkpoint
+from node.blockchain.utils.lock import add_lock_acquired_handler, get_site, hold_lock, lock, validate_fencing_token
+from node.blockchain.utils.schedule import ScheduleSnapshot
+from node.blockchain.utils.snapshot import get_blockchain_models, restore_snapshot, take_snapshot
+from node.core.database import (
+    bulk_upsert, ensure_in_transaction, get_session, is_in_transaction, is_mongo_connection, recreate_collection
+)
+from node.core.exceptions import CheckpointError, DatabaseTransactionError, SnapshotError
+from node.core.utils.collections import LRUCache
 from node.core.utils.cryptography import derive_public_key, get_node_identifier, get_signing_key
-from node.core.utils.misc import set_if_not_none
+from node.core.utils.misc import SENTINEL, apply_on_commit, set_if_not_none
 from node.core.utils.types import non_negative_intstr
 
 if TYPE_CHECKING:
@@ -28,11 +43,42 @@ def get_block_model():
     return Block
 
 
+class TransactionCache:
+    """
+    Blockchain state as seen by a single transaction: its snapshot along with its own changes.
+
+    The changes are published to process-wide cache of `BlockchainFacade` on commit, so other threads never see
+    uncommitted state.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        # Chain tip of the transaction snapshot (before the transaction changes)
+        self.base_chain_tip = SENTINEL
+        self.chain_tip = SENTINEL
+        # Values are (balance, account lock) tuples of accounts read or changed by the transaction
+        self.account_states: dict[AccountNumber, tuple[int, Optional[AccountLock]]] = {}
+        self.changed_account_numbers: set[AccountNumber] = set()
+        # Other blockchain state values (like schedule snapshot) read or changed by the transaction
+        self.values: dict[str, Any] = {}
+        self.changed_value_names: set[str] = set()
+        self.is_changed = False
+        # Blockchain was replaced (not just extended with blocks), so process-wide cache is dropped on commit
+        self.is_reset = False
+
+
 class BlockchainFacade:
     _instance = None
 
     def __init__(self, signing_key: SigningKey):
         self.signing_key = signing_key
+        # Values are (balance, account lock) tuples
+        self._account_state_cache = LRUCache(settings.ACCOUNT_STATE_CACHE_SIZE)
+        # Process-wide cache holds committed blockchain state only, version is incremented on every change
+        self._cache_lock = threading.RLock()
+        self._cache_version = 0
+        self._local = threading.local()
+        self.invalidate_cache()
 
     @classmethod
     def get_instance(cls: Type[T]) -> T:
@@ -41,6 +87,10 @@ class BlockchainFacade:
             instance = cls(signing_key=get_signing_key())
             cls.set_instance_cache(instance)
 
+        if settings.CACHE_INVALIDATION_ENABLED:
+            # Other processes add blocks too, so we need to invalidate in-memory cache
+            ensure_cache_invalidation_bus_started(cls.on_blockchain_change)
+
         return instance
 
     @classmethod
@@ -51,6 +101,130 @@ class BlockchainFacade:
     def clear_instance_cache(cls):
         cls._instance = None
 
+    def invalidate_cache(self):
+        # In-memory cache is dropped entirely, so it is lazily reloaded from the database on the next read
+        self.invalidate_process_cache()
+        self._local.transaction_cache = None
+
+    def invalidate_process_cache(self):
+        with self._cache_lock:
+            self._chain_tip = SENTINEL
+            self._values = {}
+            self._account_state_cache.clear()
+            self._cache_version += 1
+
+    @classmethod
+    def on_blockchain_change(cls, chain_tip=SENTINEL):
+        """
+        Invalidate in-memory cache on blockchain change committed by any process.
+
+        `chain_tip` is the committed chain tip if known. Changes made by this process are already reflected
+        in the cache, so it is kept as long as the chain tip is the same.
+        """
+        if (instance := cls._instance) and (chain_tip is SENTINEL or instance._chain_tip != chain_tip):
+            logger.debug('Invalidating blockchain facade cache on blockchain change: %s', chain_tip)
+            instance.invalidate_process_cache()
+
+    @classmethod
+    def on_block_lock_acquired(cls):
+        if instance := cls._instance:
+            instance.revalidate_process_cache()
+
+    def revalidate_process_cache(self):
+        """
+        Drop process-wide cache if its chain tip is not the committed one. It is called once BLOCK_LOCK is acquired
+        (blockchain cannot be changed by others then), because invalidation on changes made by other processes is
+        asynchronous and a notification could be late or lost.
+        """
+        chain_tip = get_block_model().objects.get_chain_tip(is_committed=True)
+        with self._cache_lock:
+            if (cached_chain_tip := self._chain_tip) is SENTINEL:
+                # Cache is empty, so we can reuse the read
+                self._chain_tip = chain_tip
+            elif cached_chain_tip != chain_tip:
+                logger.warning(
+                    'Invalidating outdated blockchain facade cache (cached chain tip: %s, committed chain tip: %s)',
+                    cached_chain_tip, chain_tip
+                )
+                self.invalidate_process_cache()
+
+    def get_transaction_cache(self) -> Optional[TransactionCache]:
+        """
+        Return cache of the active transaction (`None` outside transaction and in read-only mode when queries see
+        committed data)
+        """
+        if not is_in_transaction() or (session := get_session()) is None:
+            return None
+
+        # Transaction cache is bound to the session, so it is never shared by transactions
+        transaction_cache = getattr(self._local, 'transaction_cache', None)
+        if transaction_cache is None or transaction_cache.session is not session:
+            self._local.transaction_cache = transaction_cache = TransactionCache(session)
+
+        return transaction_cache
+
+    def get_changing_transaction_cache(self) -> TransactionCache:
+        """
+        Return cache of the active transaction to put its changes to (they are published on commit)
+        """
+        transaction_cache = self.get_transaction_cache()
+        assert transaction_cache, 'Blockchain is expected to be changed in a transaction'
+        if not transaction_cache.is_changed:
+            # Chain tip of the snapshot must be known before the changes are made
+            self.get_chain_tip()
+            transaction_cache.is_changed = True
+            transaction.on_commit(functools.partial(self.publish_transaction_cache, transaction_cache))
+
+        return transaction_cache
+
+    def reset_transaction_cache(self):
+        """
+        Make changes of the active transaction that replace blockchain (rather than add blocks to it) drop process-wide
+        cache on commit. Transaction cache is reloaded from the transaction snapshot on the next read
+        """
+        self.get_changing_transaction_cache().is_reset = True
+        self._local.transaction_cache = None
+
+    def publish_transaction_cache(self, transaction_cache: TransactionCache):
+        """
+        Apply changes of committed transaction to process-wide cache
+        """
+        with self._cache_lock:
+            if transaction_cache.is_reset or self._chain_tip not in (SENTINEL, transaction_cache.base_chain_tip):
+                # Process-wide cache does not reflect blockchain state the changes were made on
+                self.invalidate_process_cache()
+                return
+
+            self._chain_tip = transaction_cache.chain_tip
+            cache = self._account_state_cache
+            for account_number in transaction_cache.changed_account_numbers:
+                # Only cached accounts are updated, others are read on demand
+                if account_number in cache:
+                    if (account_state := transaction_cache.account_states.get(account_number)) is None:
+                        cache.pop(account_number)
+                    else:
+                        cache.set(account_number, account_state)
+
+            for name in transaction_cache.changed_value_names:
+                if (value := transaction_cache.values.get(name, SENTINEL)) is SENTINEL:
+                    self._values.pop(name, None)
+                else:
+                    self._values[name] = value
+
+            self._cache_version += 1
+
+    def get_usable_cache_version(self, transaction_cache: Optional[TransactionCache]) -> Optional[int]:
+        """
+        Return version of process-wide cache if it reflects blockchain state visible to the caller (`None` otherwise).
+        Chain tip must be loaded and `_cache_lock` must be held by the caller.
+        """
+        chain_tip = self._chain_tip
+        if chain_tip is SENTINEL or (transaction_cache and chain_tip != transaction_cache.base_chain_tip):
+            # Transaction snapshot is older or newer than the cached state
+            return None
+
+        return self._cache_version
+
     @ensure_in_transaction
     @lock(BLOCK_LOCK)
     def add_block_from_json(self, block_json: str) -> 'ORMBlock':
@@ -63,19 +237,28 @@ class BlockchainFacade:
 
     @ensure_in_transaction
     @lock(BLOCK_LOCK)
-    def add_block(self, block: Block, *, validate=True) -> 'ORMBlock':
+    def add_block(self, block: Block, *, validate=True, state_snapshot=None) -> 'ORMBlock':
         if validate:
             block.validate_business_logic()
 
         # Make blockchain state specific validations
         # We need `bypass_lock_validation=True` because we have already validated it
-        block.validate_blockchain_state_dependent(self, bypass_lock_validation=True)
+        state_snapshot = state_snapshot or BlockchainStateSnapshot(self)
+        block.validate_blockchain_state_dependent(state_snapshot, bypass_lock_validation=True)
 
         from node.blockchain.models import Block as ORMBlock
-        orm_block = ORMBlock(_id=block.get_block_number(), body=block.json())
+        body = block.json()
+        orm_block = ORMBlock(_id=block.get_block_number(), hash=HashableStringWrapper(body).make_hash(), body=body)
+        self.get_changing_transaction_cache()
         orm_block.save()
 
         self.update_write_through_cache(block)
+        self.set_chain_tip(ChainTip(number=orm_block._id, hash=orm_block.hash))
+
+        if settings.CHECKPOINT_PATH and orm_block._id % settings.CHECKPOINT_INTERVAL == 0:
+            from node.blockchain.tasks.make_checkpoint import start_make_checkpoint_task
+            apply_on_commit(functools.partial(start_make_checkpoint_task, orm_block._id))
+
         return orm_block
 
     @ensure_in_transaction
@@ -86,6 +269,7 @@ class BlockchainFacade:
         *,
         signing_key: Optional[SigningKey] = None,
         validate=True,
+        state_snapshot=None,
     ) -> Block:
         if validate:
             message.validate_business_logic()
@@ -96,7 +280,7 @@ class BlockchainFacade:
 
         block = Block(signer=signer, signature=signature, message=message)
         # No need to validate the block since we produced a valid one
-        self.add_block(block, validate=False, expect_locked=True)
+        self.add_block(block, validate=False, state_snapshot=state_snapshot, expect_locked=True)
         return block
 
     @ensure_in_transaction
@@ -111,10 +295,16 @@ class BlockchainFacade:
         if validate:
             signed_change_request.validate_business_logic()
 
-        block_message = BlockMessage.create_from_signed_change_request(signed_change_request, self)
+        # Blockchain state does not change until the block is added, so all reads are shared
+        state_snapshot = BlockchainStateSnapshot(self)
+        block_message = BlockMessage.create_from_signed_change_request(signed_change_request, state_snapshot)
         # no need to validate the block message since we produced a valid one
         return self.add_block_from_block_message(
-            block_message, signing_key=signing_key, validate=False, expect_locked=True
+            block_message,
+            signing_key=signing_key,
+            validate=False,
+            state_snapshot=state_snapshot,
+            expect_locked=True,
         )
 
     @staticmethod
@@ -129,37 +319,190 @@ class BlockchainFacade:
     def get_last_block():
         return get_block_model().objects.get_last_block()
 
-    @staticmethod
-    def get_next_block_number() -> int:
-        # TODO(dmu) HIGH: Implement method via write-through cache
-        #                 https://thenewboston.atlassian.net/browse/BC-175
-        return get_block_model().objects.get_next_block_number()
+    def get_chain_tip(self) -> Optional[ChainTip]:
+        """
+        Return number and hash of the last block (or `None` for empty blockchain) from in-memory cache.
+
+        In a transaction it is the chain tip of the transaction snapshot (including changes made by the transaction),
+        otherwise it is the last committed one.
+        """
+        if (transaction_cache := self.get_transaction_cache()) is None:
+            return self.get_committed_chain_tip()
+
+        if (chain_tip := transaction_cache.chain_tip) is SENTINEL:
+            chain_tip = get_block_model().objects.get_chain_tip()
+            transaction_cache.base_chain_tip = transaction_cache.chain_tip = chain_tip
+
+        return chain_tip
+
+    def get_committed_chain_tip(self) -> Optional[ChainTip]:
+        if (chain_tip := self._chain_tip) is SENTINEL:
+            # Chain tip is read outside any transaction, so an outdated transaction snapshot never gets into the cache
+            cache_version = self._cache_version
+            chain_tip = get_block_model().objects.get_chain_tip(is_committed=True)
+            with self._cache_lock:
+                if self._cache_version == cache_version:
+                    self._chain_tip = chain_tip
+
+        return chain_tip
+
+    def set_chain_tip(self, chain_tip: Optional[ChainTip]):
+        self.get_changing_transaction_cache().chain_tip = chain_tip
+
+    def get_next_block_number(self) -> int:
+        chain_tip = self.get_chain_tip()
+        return 0 if chain_tip is None else chain_tip.number + 1
 
     def get_next_block_identifier(self) -> Optional[BlockIdentifier]:
-        # TODO(dmu) HIGH: Implement method via write-through cache
-        #                 https://thenewboston.atlassian.net/browse/BC-175
-        last_block = self.get_last_block()
-        return HashableStringWrapper(last_block.body).make_hash() if last_block else None
+        chain_tip = self.get_chain_tip()
+        return None if chain_tip is None else BlockIdentifier(chain_tip.hash)
+
+    @staticmethod
+    def get_block_hash(number) -> Optional[Hash]:
+        block = get_block_model().objects.get_block_by_number(number)
+        return block.get_hash() if block else None
 
     @staticmethod
     def get_block_by_number(number) -> Block:
         block = get_block_model().objects.get_block_by_number(number)
         return block.get_block() if block else None
 
-    @staticmethod
-    def get_account_lock(account_number) -> AccountLock:
-        account_state = ORMAccountState.objects.get_or_none(_id=account_number)
-        return AccountLock(
-            account_state.account_lock
-        ) if account_state and account_state.account_lock else account_number
+    def get_cached_value(self, name, load, is_valid=None):
+        """
+        Return blockchain state value `name` from in-memory cache. Missing (or not valid according to `is_valid()`)
+        value is loaded with `load()` and cached.
+        """
+        transaction_cache = self.get_transaction_cache()
+        is_changed = bool(transaction_cache) and name in transaction_cache.changed_value_names
+        if transaction_cache and (value := transaction_cache.values.get(name, SENTINEL)) is not SENTINEL:
+            if is_valid is None or is_valid(value):
+                return value
+
+        self.get_chain_tip()  # it must be loaded to find out if process-wide cache can be used
+        with self._cache_lock:
+            cache_version = None if is_changed else self.get_usable_cache_version(transaction_cache)
+            if cache_version is not None and (value := self._values.get(name, SENTINEL)) is not SENTINEL:
+                if is_valid is None or is_valid(value):
+                    return value
+
+        value = load()
+        if transaction_cache:
+            transaction_cache.values[name] = value
+
+        if cache_version is not None:
+            with self._cache_lock:
+                # Cached state could have been changed while we were loading
+                if self._cache_version == cache_version:
+                    self._values[name] = value
+
+        return value
+
+    def set_cached_value(self, name, value):
+        """
+        Set blockchain state value `name` changed by the active transaction (`SENTINEL` means that it is to be
+        reloaded). It gets to process-wide cache on commit.
+        """
+        transaction_cache = self.get_changing_transaction_cache()
+        transaction_cache.changed_value_names.add(name)
+        if value is SENTINEL:
+            transaction_cache.values.pop(name, None)
+        else:
+            transaction_cache.values[name] = value
 
-    @staticmethod
-    def get_account_balance(account_number: AccountNumber) -> int:
-        account_state = ORMAccountState.objects.get_or_none(_id=account_number)
-        return account_state.balance if account_state else 0
+    def get_account_state_cache_info(self) -> dict[str, int]:
+        return self._account_state_cache.get_info()
 
-    @staticmethod
-    def update_write_through_cache_accounts(accounts):
+    def get_account_states(self, account_numbers) -> dict[AccountNumber, tuple[int, Optional[AccountLock]]]:
+        """
+        Return balance and account lock of the accounts from in-memory cache (missing ones are read with one query)
+        """
+        transaction_cache = self.get_transaction_cache()
+        local_account_states = transaction_cache.account_states if transaction_cache else {}
+        changed_account_numbers = transaction_cache.changed_account_numbers if transaction_cache else set()
+        cache = self._account_state_cache
+        account_states = {}
+        missing_account_numbers = []
+
+        self.get_chain_tip()  # it must be loaded to find out if process-wide cache can be used
+        with self._cache_lock:
+            cache_version = self.get_usable_cache_version(transaction_cache)
+            for account_number in dict.fromkeys(account_numbers):  # deduplicate preserving order
+                if account_state := local_account_states.get(account_number):
+                    account_states[account_number] = account_state
+                elif (
+                    cache_version is not None and account_number not in changed_account_numbers and
+                    (account_state := cache.get(account_number))
+                ):
+                    account_states[account_number] = account_state
+                else:
+                    missing_account_numbers.append(account_number)
+
+        if not missing_account_numbers:
+            return account_states
+
+        read_account_states: dict[AccountNumber,
+                                  tuple[int,
+                                        Optional[AccountLock]]] = dict.fromkeys(missing_account_numbers, (0, None))
+        for account_state in ORMAccountState.objects.filter(_id__in=missing_account_numbers):
+            read_account_states[account_state._id] = (account_state.balance, account_state.account_lock)
+
+        if transaction_cache:
+            local_account_states.update(read_account_states)
+
+        if cache_version is not None:
+            with self._cache_lock:
+                # Cached state could have been changed while we were reading
+                if self._cache_version == cache_version:
+                    for account_number, account_state in read_account_states.items():
+                        # Account states changed by the transaction are not committed yet
+                        if account_number not in changed_account_numbers:
+                            cache.set(account_number, account_state)
+
+        account_states.update(read_account_states)
+        return account_states
+
+    def get_account_state(self, account_number: AccountNumber) -> tuple[int, Optional[AccountLock]]:
+        return self.get_account_states((account_number,))[account_number]
+
+    def get_account_lock(self, account_number) -> AccountLock:
+        _, account_lock = self.get_account_state(account_number)
+        return AccountLock(account_lock) if account_lock else account_number
+
+    def get_account_balance(self, account_number: AccountNumber) -> int:
+        balance, _ = self.get_account_state(account_number)
+        return balance
+
+    def get_account_balances(self, account_numbers) -> dict[AccountNumber, int]:
+        return {
+            account_number: balance
+            for account_number, (balance, _) in self.get_account_states(account_numbers).items()
+        }
+
+    def update_account_state_cache(self, updates: dict[AccountNumber, dict[str, Any]]):
+        transaction_cache = self.get_changing_transaction_cache()
+        account_states = transaction_cache.account_states
+        cache = self._account_state_cache
+        with self._cache_lock:
+            cache_version = self.get_usable_cache_version(transaction_cache)
+            for account_number, fields_for_update in updates.items():
+                account_state = account_states.pop(account_number, None)
+                if (
+                    account_state is None and cache_version is not None and
+                    account_number not in transaction_cache.changed_account_numbers
+                ):
+                    account_state = cache.get(account_number)
+
+                transaction_cache.changed_account_numbers.add(account_number)
+                # Only cached accounts are updated, others are read on demand
+                if account_state:
+                    balance, account_lock = account_state
+                    account_states[account_number] = (
+                        fields_for_update.get('balance', balance),
+                        fields_for_update.get('account_lock', account_lock),
+                    )
+
+    def update_write_through_cache_accounts(self, accounts):
+        updates = {}
         for account_number, account_state in accounts.items():
             fields_for_update = {}
             set_if_not_none(fields_for_update, 'account_lock', account_state.account_lock)
@@ -167,7 +510,19 @@ class BlockchainFacade:
             node = None if account_state.node is None else account_state.node.dict()
             set_if_not_none(fields_for_update, 'node', node)
             assert fields_for_update
+            updates[account_number] = fields_for_update
+
+        self.update_account_state_cache(updates)
+        if any('node' in fields_for_update for fields_for_update in updates.values()):
+            # Node declaration affects the set of confirmation validators
+            self.set_cached_value('confirmation_validators', SENTINEL)
 
+        if is_mongo_connection():
+            bulk_upsert(ORMAccountState, updates)
+            return
+
+        # Fallback for database backends that do not support bulk upserts
+        for account_number, fields_for_update in updates.items():
             account_state, is_created = ORMAccountState.objects.get_or_create(
                 _id=account_number, defaults=fields_for_update
             )
@@ -176,8 +531,13 @@ class BlockchainFacade:
                     setattr(account_state, field, value)
                 account_state.save()
 
-    @staticmethod
-    def update_write_through_cache_schedule(schedule: dict[non_negative_intstr, AccountNumber]):
+    def get_schedule_snapshot(self) -> ScheduleSnapshot:
+        """
+        Return primary validator schedule from in-memory cache
+        """
+        return self.get_cached_value('schedule_snapshot', ScheduleSnapshot.from_database)
+
+    def update_write_through_cache_schedule(self, schedule: dict[non_negative_intstr, AccountNumber]):
         # TODO(dmu) HIGH: Add more unittests once PV schedule block is implemented
         #                 - Add PV
         #                 - Remove PV
@@ -185,21 +545,143 @@ class BlockchainFacade:
         #                 https://thenewboston.atlassian.net/browse/BC-193
         from node.blockchain.models import Schedule
 
-        Schedule.objects.exclude(_id__in=schedule.keys()).delete()
+        schedule = {int(block_number): node_identifier for block_number, node_identifier in schedule.items()}
+        existing_schedule = dict(Schedule.objects.values_list('_id', 'node_identifier'))
 
-        for block_number, node_identifier in schedule.items():
-            Schedule.objects.update_or_create(_id=block_number, defaults={'node_identifier': node_identifier})
+        self.set_cached_value('schedule_snapshot', ScheduleSnapshot(schedule))
+
+        deleted_block_numbers = existing_schedule.keys() - schedule.keys()
+        updates = {
+            block_number: {
+                'node_identifier': node_identifier
+            }
+            for block_number, node_identifier in schedule.items()
+            if existing_schedule.get(block_number) != node_identifier
+        }
+        if not deleted_block_numbers and not updates:
+            return
+
+        if is_mongo_connection():
+            bulk_upsert(Schedule, updates, delete_pks=deleted_block_numbers)
+            return
+
+        # Fallback for database backends that do not support bulk upserts
+        if deleted_block_numbers:
+            Schedule.objects.filter(_id__in=deleted_block_numbers).delete()
+
+        for block_number, fields_for_update in updates.items():
+            Schedule.objects.update_or_create(_id=block_number, defaults=fields_for_update)
 
-    @staticmethod
     @ensure_in_transaction
     @lock(BLOCK_LOCK)
-    def clear():
+    def clear(self):
         get_block_model().objects.all().delete()
 
         ORMAccountState.objects.all().delete()
         from node.blockchain.models import Schedule
         Schedule.objects.all().delete()
 
+        if archive := get_block_archive():
+            # Files cannot be rolled back, so we clear them after the transaction is committed
+            apply_on_commit(archive.clear)
+
+        self.reset_transaction_cache()
+
+    def fast_clear(self):
+        """
+        Same as `clear()`, but collections are dropped and recreated with their indexes. It is much faster for large
+        blockchains, but it is not atomic and must not be run in a transaction
+        """
+        with hold_lock(BLOCK_LOCK, get_site(self.fast_clear)):
+            for model in get_blockchain_models():
+                validate_fencing_token(BLOCK_LOCK)  # stop once the lock is taken over
+                recreate_collection(model)
+
+            if archive := get_block_archive():
+                validate_fencing_token(BLOCK_LOCK)
+                archive.clear()
+
+            self.invalidate_cache()
+
+    def take_snapshot(self, name):
+        """
+        Save blockchain collections under `name` to restore them later with `restore_snapshot()` (must not be run in
+        a transaction)
+        """
+        self.validate_snapshot_is_supported()
+        with hold_lock(BLOCK_LOCK, get_site(self.take_snapshot)):
+            take_snapshot(name)
+
+    def restore_snapshot(self, name):
+        """
+        Replace blockchain with the snapshot taken by `take_snapshot()` (must not be run in a transaction)
+        """
+        self.validate_snapshot_is_supported()
+        with hold_lock(BLOCK_LOCK, get_site(self.restore_snapshot)):
+            restore_snapshot(name)
+            self.invalidate_cache()
+
+    @staticmethod
+    def validate_snapshot_is_supported():
+        if is_in_transaction():
+            raise DatabaseTransactionError('Snapshots cannot be taken or restored in a transaction')
+
+        # Archived blocks are stored in files that are not the part of a snapshot
+        if (archive := get_block_archive()) and archive.get_archived_range():
+            raise SnapshotError('Snapshots are not supported for blockchain with archived blocks')
+
+    def load_checkpoint(self, checkpoint: dict, expected_hash: Hash) -> 'ORMBlock':
+        """
+        Bootstrap empty blockchain from checkpoint (see `node.blockchain.utils.checkpoint`): the checkpoint block
+        becomes the first block, so only the following blocks need to be synchronized.
+
+        There may be millions of accounts, so they are written in chunks outside transaction (it would exceed
+        transaction lifetime limit). The checkpoint block is written last, so interrupted loading leaves
+        the blockchain empty and it can be loaded again.
+        """
+        if is_in_transaction():
+            raise DatabaseTransactionError('Checkpoint cannot be loaded in a transaction')
+
+        validate_checkpoint(checkpoint, expected_hash)
+
+        from node.blockchain.models import Block as ORMBlock
+        from node.blockchain.models import Schedule
+        with hold_lock(BLOCK_LOCK, get_site(self.load_checkpoint)):
+            if self.has_blocks():
+                raise CheckpointError('Checkpoint can only be loaded into empty blockchain')
+
+            # Leftovers of interrupted loading
+            validate_fencing_token(BLOCK_LOCK)  # stop once the lock is taken over
+            ORMAccountState.objects.all().delete()
+            Schedule.objects.all().delete()
+
+            accounts = iter(checkpoint['accounts'].items())
+            while chunk := dict(islice(accounts, settings.BULK_WRITE_CHUNK_SIZE)):
+                validate_fencing_token(BLOCK_LOCK)
+                if is_mongo_connection():
+                    bulk_upsert(ORMAccountState, chunk)
+                else:
+                    ORMAccountState.objects.bulk_create(
+                        ORMAccountState(_id=account_number, **account_state)
+                        for account_number, account_state in chunk.items()
+                    )
+
+            validate_fencing_token(BLOCK_LOCK)
+            Schedule.objects.bulk_create(
+                Schedule(_id=int(block_number), node_identifier=node_identifier)
+                for block_number, node_identifier in checkpoint['schedule'].items()
+            )
+
+            validate_fencing_token(BLOCK_LOCK)
+            orm_block = ORMBlock(
+                _id=checkpoint['block_number'], hash=checkpoint['block_hash'], body=checkpoint['block']
+            )
+            # `bulk_create()` is used to bypass consecutive block number validation of `save()`
+            ORMBlock.objects.bulk_create([orm_block])
+            self.invalidate_cache()
+
+        return orm_block
+
     def update_write_through_cache(self, block):
         block_message_update = block.message.update
 
@@ -215,40 +697,22 @@ class BlockchainFacade:
         return node.get_node() if node else None
 
     def get_node_role(self) -> Optional[NodeRole]:
-        # TODO(dmu) MEDIUM: Should we optimize the implementation to make only one database request and
-        #                   process the response in Python?
-        from node.blockchain.models import Schedule
-
         node_identifier = get_node_identifier()
         node = self.get_node_by_identifier(node_identifier)
         if not node:
             return None
 
-        if not Schedule.objects.filter(node_identifier=node_identifier).exists():
-            return NodeRole.REGULAR_NODE
-
-        next_block_number = self.get_next_block_number()
-        schedule = Schedule.objects.filter(_id__lte=next_block_number).order_by('-_id').first()
-        if schedule and schedule.node_identifier == node_identifier:
-            return NodeRole.PRIMARY_VALIDATOR
-
-        if Schedule.objects.filter(_id__gt=next_block_number, node_identifier=node_identifier).exists():
-            return NodeRole.CONFIRMATION_VALIDATOR
-
-        return NodeRole.REGULAR_NODE
+        return self.get_schedule_snapshot().get_node_role(node_identifier, self.get_next_block_number())
 
     def get_primary_validator(self) -> Optional[Node]:
         """
         Return primary validator that should sign the next block
         """
-        from node.blockchain.models import Schedule
-
-        schedule = Schedule.objects.get_schedule_for_next_block()
-        if not schedule:
+        node_identifier = self.get_schedule_snapshot().get_primary_validator_identifier(self.get_next_block_number())
+        if not node_identifier:
             logger.warning('Schedule for the next block was not found')
             return None
 
-        node_identifier = schedule.node_identifier
         node = self.get_node_by_identifier(node_identifier)
         if not node:
             # TODO(dmu) HIGH: Implement workaround for the case when
@@ -263,14 +727,88 @@ class BlockchainFacade:
         for node in ORMNode.objects.filter_by_roles(roles):
             yield node.get_node()
 
-    @staticmethod
-    def get_confirmation_validator_identifiers():
-        return ORMNode.objects.filter_confirmation_validators().values_list('_id', flat=True)
+    def get_confirmation_validators(self) -> tuple[frozenset[AccountNumber], int]:
+        """
+        Return confirmation validator identifiers and minimum consensus from in-memory cache.
 
-    @staticmethod
-    def is_confirmation_validator(identifier):
-        return ORMNode.objects.is_confirmation_validator(identifier)
+        They are computed once per schedule epoch: until the schedule or primary validator for the next block
+        changes (or a node declaration block is added).
+        """
+        schedule_snapshot = self.get_schedule_snapshot()
+        epoch = (schedule_snapshot, schedule_snapshot.get_primary_validator_identifier(self.get_next_block_number()))
 
-    @staticmethod
-    def get_minimum_consensus():
-        return int(math.ceil(ORMNode.objects.filter_confirmation_validators().count() * 2 / 3))
+        def load():
+            identifiers_ = frozenset(ORMNode.objects.filter_confirmation_validators().values_list('_id', flat=True))
+            return epoch, identifiers_, int(math.ceil(len(identifiers_) * 2 / 3))
+
+        _, identifiers, minimum_consensus = self.get_cached_value(
+            'confirmation_validators', load, is_valid=lambda value: value[0] == epoch
+        )
+        return identifiers, minimum_consensus
+
+    def get_confirmation_validator_identifiers(self) -> frozenset[AccountNumber]:
+        identifiers, _ = self.get_confirmation_validators()
+        return identifiers
+
+    def is_confirmation_validator(self, identifier) -> bool:
+        return identifier in self.get_confirmation_validator_identifiers()
+
+    def get_minimum_consensus(self) -> int:
+        _, minimum_consensus = self.get_confirmation_validators()
+        return minimum_consensus
+
+
+add_lock_acquired_handler(BLOCK_LOCK, BlockchainFacade.on_block_lock_acquired)
+
+
+class BlockchainStateSnapshot:
+    """
+    Read-through wrapper around blockchain facade that memoizes blockchain state reads.
+
+    It is meant to be used instead of the facade for validation of a single block while blockchain is locked,
+    because blockchain state does not change until the block is added.
+    """
+
+    MEMOIZED_METHODS = frozenset((
+        'has_blocks',
+        'get_next_block_number',
+        'get_next_block_identifier',
+        'get_account_balance',
+        'get_account_lock',
+        'get_primary_validator',
+        'get_node_by_identifier',
+        'is_confirmation_validator',
+    ))
+
+    def __init__(self, blockchain_facade: BlockchainFacade):
+        self.blockchain_facade = blockchain_facade
+        self.cache: dict[tuple, Any] = {}
+        self.read_count = 0
+
+    def __getattr__(self, name):
+        attribute = getattr(self.blockchain_facade, name)
+        if name in self.MEMOIZED_METHODS:
+            return functools.partial(self.read_through, name, attribute)
+
+        return attribute
+
+    def get_account_balances(self, account_numbers) -> dict[AccountNumber, int]:
+        # Balances are memoized per account, so they are shared with `get_account_balance()`
+        keys = {account_number: ('get_account_balance', account_number) for account_number in account_numbers}
+        if missing_account_numbers := [
+            account_number for account_number, key in keys.items() if key not in self.cache
+        ]:
+            balances = self.blockchain_facade.get_account_balances(missing_account_numbers)
+            for account_number, balance in balances.items():
+                self.cache[keys[account_number]] = balance
+            self.read_count += 1
+
+        return {account_number: self.cache[key] for account_number, key in keys.items()}
+
+    def read_through(self, name, method, *args):
+        key = (name, *args)
+        if (value := self.cache.get(key, SENTINEL)) is SENTINEL:
+            self.cache[key] = value = method(*args)
+            self.read_count += 1
+
+        return value
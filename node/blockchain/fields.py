@@ -0,0 +1,21 @@
+from djongo import models
+
+from node.blockchain.utils.compression import compress_body, decompress_body, get_configured_body_format
+
+
+class BodyField(models.BinaryField):
+    """
+    JSON body stored either uncompressed or compressed according to `BODY_COMPRESSION` setting.
+
+    Bodies are always decompressed on read, so model instances have them as JSON strings regardless of the
+    stored format (rows of different formats may coexist).
+    """
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is not None and not prepared:
+            value = compress_body(value, get_configured_body_format())
+
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        return decompress_body(value)
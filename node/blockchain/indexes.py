@@ -0,0 +1,39 @@
+from node.core.indexes import HotQuery, Index
+
+from .models import AccountState, Block, BlockConfirmation, PendingBlock, Schedule
+
+SAMPLE_NUMBER = 0
+SAMPLE_IDENTIFIER = '0' * 64
+SAMPLE_HASH = '0' * 128
+UP_TO_SAMPLE_NUMBER = {'$lte': SAMPLE_NUMBER}
+
+# Indexes required by hot queries (primary key indexes are always there)
+INDEXES = {
+    Block: (Index(('hash',)),),
+    BlockConfirmation: (Index(('number', 'signer'), unique=True),),
+    PendingBlock: (
+        Index(('number', 'signer'), unique=True),
+        Index(('number', 'hash')),
+    ),
+    Schedule: (Index(('node_identifier',)),),
+    # `Node.objects` filters on `node` not being null
+    AccountState: (Index(('node',)),),
+}
+
+# Sample values do not matter: query planner chooses the plan by query shape
+HOT_QUERIES = (
+    HotQuery('Block by hash', Block, dict(hash=SAMPLE_HASH)),
+    HotQuery('BlockConfirmation by number', BlockConfirmation, dict(number=SAMPLE_NUMBER)),
+    HotQuery(
+        'BlockConfirmation by number and signers',
+        BlockConfirmation,
+        dict(number=SAMPLE_NUMBER, signer={'$in': [SAMPLE_IDENTIFIER]}),
+    ),
+    HotQuery('BlockConfirmation up to number', BlockConfirmation, dict(number=UP_TO_SAMPLE_NUMBER)),
+    HotQuery('PendingBlock by number and signer', PendingBlock, dict(number=SAMPLE_NUMBER, signer=SAMPLE_IDENTIFIER)),
+    HotQuery('PendingBlock by number and hash', PendingBlock, dict(number=SAMPLE_NUMBER, hash=SAMPLE_HASH)),
+    HotQuery('PendingBlock up to number', PendingBlock, dict(number=UP_TO_SAMPLE_NUMBER)),
+    HotQuery('Schedule by node identifier', Schedule, dict(node_identifier=SAMPLE_IDENTIFIER)),
+    HotQuery('Schedule up to block number', Schedule, dict(_id=UP_TO_SAMPLE_NUMBER), sort=[('_id', -1)]),
+    HotQuery('Node accounts', AccountState, dict(node={'$ne': None})),
+)
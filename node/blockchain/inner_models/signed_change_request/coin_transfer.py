@@ -22,6 +22,14 @@ class CoinTransferSignedChangeRequest(SignedChangeRequest):
         if self.signer in (tx.recipient for tx in self.message.txs):
             raise ValidationError('Circular transactions detected')
 
+    def get_account_numbers(self):
+        """
+        Return numbers of all accounts involved (sender first)
+        """
+        return list(dict.fromkeys((self.signer, *(tx.recipient for tx in self.message.txs))))
+
     def validate_amount(self, blockchain_facade):
-        if blockchain_facade.get_account_balance(self.signer) < self.message.get_total_amount():
+        # Balances of recipients are read along with the sender one, since they are needed for block message update
+        balances = blockchain_facade.get_account_balances(self.get_account_numbers())
+        if balances[self.signer] < self.message.get_total_amount():
             raise ValidationError('Signer balance mast be greater than total amount')
@@ -0,0 +1,79 @@
+import sys
+
+from django.conf import settings
+
+from node.blockchain.constants import BLOCK_LOCK
+from node.blockchain.models import Block
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.utils.lock import get_site, hold_lock, validate_fencing_token
+from node.core.commands import CustomCommand
+from node.core.database import get_collection, get_session
+
+
+class Command(CustomCommand):
+    help = 'Move finalized blocks from the database to block archive keeping the recent ones'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-k',
+            '--keep',
+            type=int,
+            default=settings.BLOCK_ARCHIVE_RECENT_BLOCK_COUNT,
+            help='Number of the latest blocks to keep in the database',
+        )
+        parser.add_argument('-b', '--batch-size', type=int, default=1000, help='Blocks per archive append')
+        parser.add_argument('--no-delete', action='store_true', help='Do not delete archived blocks from the database')
+
+    def handle(self, keep, batch_size, no_delete, *args, **options):
+        repository = BlockRepository()
+        if not (archive := repository.archive):
+            self.write_error('Block archive is not enabled (see `BLOCK_ARCHIVE_PATH` setting)')
+            sys.exit(1)
+
+        if keep < 1:
+            self.write_error('At least one block must be kept in the database')
+            sys.exit(1)
+
+        if (last_block_number := repository.get_last_block_number()) is None:
+            self.write_info('Blockchain is empty')
+            return
+
+        max_number = last_block_number - keep
+        deleted_count = 0
+        # Blockchain must not be cleared or replaced while its blocks are being moved
+        with hold_lock(BLOCK_LOCK, get_site(self.handle)):
+            if (next_block_number := archive.get_next_block_number()) is None:
+                # Blockchain bootstrapped from a checkpoint does not start with the genesis block
+                next_block_number = repository.get_first_block_number()
+            elif not no_delete:
+                # Blocks archived by interrupted or `--no-delete` runs
+                deleted_count += self.delete_blocks(max_number=next_block_number - 1)
+
+            while next_block_number <= max_number:
+                validate_fencing_token(BLOCK_LOCK)  # stop once the lock is taken over
+                blocks = repository.get_blocks(
+                    min_number=next_block_number, max_number=min(next_block_number + batch_size - 1, max_number)
+                )
+                if not blocks or blocks[0]._id != next_block_number:
+                    self.write_error(f'Block number {next_block_number} is not found in the database')
+                    sys.exit(1)
+
+                bodies = [block.body for block in blocks]
+                archive.append(next_block_number, bodies)
+                next_block_number += len(bodies)
+                self.write_info(f'Archived blocks up to block number {next_block_number - 1}')
+
+                if not no_delete:
+                    # Each batch is deleted on its own (not in a transaction that would exceed lifetime limit for
+                    # millions of blocks), archived blocks are read from the archive anyway
+                    validate_fencing_token(BLOCK_LOCK)
+                    deleted_count += self.delete_blocks(max_number=next_block_number - 1)
+
+        if not no_delete:
+            self.write_info(f'Deleted {deleted_count} archived block(s) from the database')
+
+        self.write_success(f'Blocks up to block number {next_block_number - 1} are archived')
+
+    @staticmethod
+    def delete_blocks(max_number) -> int:
+        return get_collection(Block).delete_many({'_id': {'$lte': max_number}}, session=get_session()).deleted_count
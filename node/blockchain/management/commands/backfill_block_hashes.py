@@ -0,0 +1,27 @@
+from django.db import transaction
+
+from node.blockchain.models import Block
+from node.core.commands import CustomCommand
+
+
+class Command(CustomCommand):
+    help = 'Fill in hashes of blocks added before `hash` field was introduced'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('-b', '--batch-size', type=int, default=1000, help='Blocks per transaction')
+
+    def handle(self, batch_size, *args, **options):
+        total = 0
+        while True:
+            with transaction.atomic():
+                blocks = list(Block.objects.filter(hash__isnull=True).order_by('_id')[:batch_size])
+                if not blocks:
+                    break
+
+                for block in blocks:
+                    Block.objects.filter(_id=block._id).update(hash=block.make_hash())
+
+            total += len(blocks)
+            self.write_info(f'Filled in hashes up to block number {blocks[-1]._id}')
+
+        self.write_success(f'Filled in {total} block hash(es)')
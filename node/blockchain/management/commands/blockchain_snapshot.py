@@ -0,0 +1,39 @@
+import sys
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.utils.snapshot import delete_snapshot, get_snapshot_names
+from node.core.commands import CustomCommand
+from node.core.exceptions import SnapshotError
+
+
+class Command(CustomCommand):
+    help = 'Take, restore, delete or list named snapshots of blockchain collections'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=('take', 'restore', 'delete', 'list'))
+        parser.add_argument('name', nargs='?', help='Snapshot name (required for all actions except list)')
+
+    def handle(self, action, name, *args, **options):
+        if action == 'list':
+            for snapshot_name in get_snapshot_names():
+                self.write_info(snapshot_name)
+            return
+
+        if not name:
+            self.write_error(f'Snapshot name is required to {action} a snapshot')
+            sys.exit(1)
+
+        facade = BlockchainFacade.get_instance()
+        try:
+            if action == 'take':
+                facade.take_snapshot(name)
+            elif action == 'restore':
+                facade.restore_snapshot(name)
+            else:
+                delete_snapshot(name)
+        except SnapshotError as ex:
+            self.write_error(str(ex))
+            sys.exit(1)
+
+        past_participle = {'take': 'taken', 'restore': 'restored', 'delete': 'deleted'}[action]
+        self.write_success(f'Snapshot {name!r} is {past_participle}')
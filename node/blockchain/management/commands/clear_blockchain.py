@@ -5,6 +5,7 @@ from django.db import transaction
 
 from node.blockchain.facade import BlockchainFacade
 from node.blockchain.utils.lock import delete_all_locks
+from node.core.database import is_mongo_connection
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,19 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Clears local blockchain'  # noqa: A003
 
-    def handle(self, *args, **options):
-        with transaction.atomic():
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--transactional',
+            action='store_true',
+            help='Delete documents in a transaction instead of dropping collections (slow for large blockchains)',
+        )
+
+    def handle(self, transactional, *args, **options):
+        facade = BlockchainFacade.get_instance()
+        if transactional or not is_mongo_connection():
+            with transaction.atomic():
+                delete_all_locks()
+                facade.clear()
+        else:
             delete_all_locks()
-            BlockchainFacade.get_instance().clear()
+            facade.fast_clear()
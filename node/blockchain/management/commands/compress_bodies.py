@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.db import transaction
+from pymongo import ASCENDING, UpdateOne
+
+from node.blockchain.models import Block, BlockConfirmation, PendingBlock
+from node.blockchain.utils.compression import BodyFormat, compress_body, decompress_body, get_body_format
+from node.core.commands import CustomCommand
+from node.core.database import get_collection, get_session
+
+MODELS = (Block, PendingBlock, BlockConfirmation)
+UNCOMPRESSED = 'none'
+BODY_PROJECTION = {'body': 1}
+
+
+class Command(CustomCommand):
+    help = 'Convert stored bodies to the given storage format (`BODY_COMPRESSION` setting by default)'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-f',
+            '--format',
+            choices=[UNCOMPRESSED] + [body_format.name.lower() for body_format in BodyFormat],
+            default=settings.BODY_COMPRESSION or UNCOMPRESSED,
+        )
+        parser.add_argument('-b', '--batch-size', type=int, default=1000, help='Documents per transaction')
+
+    def handle(self, format, batch_size, *args, **options):  # noqa: A002
+        body_format = None if format == UNCOMPRESSED else BodyFormat[format.upper()]
+        for model in MODELS:
+            total = self.convert(model, body_format, batch_size)
+            self.write_info(f'Converted {total} {model.__name__} bod(y/ies)')
+
+        self.write_success(f'Bodies are stored in {format} format')
+
+    @staticmethod
+    def make_request(document, body_format):
+        stored_body = document['body']
+        # Body is expected to be intact (otherwise it was updated concurrently, so it is in the configured format)
+        filter_ = {'_id': document['_id'], 'body': stored_body}
+        return UpdateOne(filter_, {'$set': {'body': compress_body(decompress_body(stored_body), body_format)}})
+
+    def convert(self, model, body_format, batch_size):
+        total = 0
+        filter_ = {}
+        while True:
+            with transaction.atomic():
+                collection = get_collection(model)
+                cursor = collection.find(filter_, BODY_PROJECTION, session=get_session())
+                documents = list(cursor.sort('_id', ASCENDING).limit(batch_size))
+                if not documents:
+                    break
+
+                requests = [
+                    self.make_request(document, body_format)
+                    for document in documents
+                    if get_body_format(document['body']) != body_format
+                ]
+                if requests:
+                    collection.bulk_write(requests, ordered=False, session=get_session())
+
+            total += len(requests)
+            filter_ = {'_id': {'$gt': documents[-1]['_id']}}
+
+        return total
@@ -0,0 +1,45 @@
+import sys
+
+from node.blockchain.indexes import HOT_QUERIES, INDEXES
+from node.core.commands import CustomCommand
+from node.core.indexes import IndexStatus, ensure_index, is_collection_scan
+
+
+class Command(CustomCommand):
+    help = 'Create indexes required by hot queries and report queries that use collection scan'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('-c', '--check', action='store_true', help='Report missing indexes without creating them')
+        parser.add_argument(
+            '-s',
+            '--strict',
+            action='store_true',
+            help='Exit with error if any index is not in place or any hot query uses collection scan (for CI)'
+        )
+
+    def handle(self, check, strict, *args, **options):
+        # The command is run on node startup, so problems are only warned about unless strict mode is requested
+        write_problem = self.write_error if strict else self.write_warning
+        is_ok = True
+        for model, indexes in INDEXES.items():
+            for index in indexes:
+                status = ensure_index(model, index, create=not check)
+                message = f'{model.__name__} {index.fields} index: {status.value}'
+                if status in (IndexStatus.EXISTS, IndexStatus.CREATED):
+                    self.write_info(message)
+                else:
+                    is_ok = False
+                    write_problem(message)
+
+        for query in HOT_QUERIES:
+            if is_collection_scan(query):
+                is_ok = False
+                write_problem(f'{query.title} query uses collection scan')
+
+        if not is_ok:
+            if strict:
+                sys.exit(1)
+
+            return
+
+        self.write_success('All hot queries are covered by indexes')
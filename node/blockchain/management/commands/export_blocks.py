@@ -0,0 +1,31 @@
+import sys
+
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.utils.compression import iter_body_chunks
+from node.core.commands import CustomCommand
+
+
+class Command(CustomCommand):
+    help = 'Export block bodies as JSON lines (archived ones are read from memory mapped segment files)'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('-o', '--output', help='Output file path (standard output by default)')
+        parser.add_argument('--min', dest='min_number', type=int, help='First block number')
+        parser.add_argument('--max', dest='max_number', type=int, help='Last block number')
+
+    def handle(self, output, min_number, max_number, *args, **options):
+        output_file = open(output, 'wb') if output else sys.stdout.buffer
+        count = 0
+        try:
+            for body in BlockRepository().iter_stored_block_bodies(min_number=min_number, max_number=max_number):
+                for chunk in iter_body_chunks(body):
+                    output_file.write(chunk.encode() if isinstance(chunk, str) else chunk)
+
+                output_file.write(b'\n')
+                count += 1
+        finally:
+            if output:
+                output_file.close()
+
+        if output:
+            self.write_success(f'Exported {count} block(s) to {output}')
@@ -0,0 +1,22 @@
+import sys
+
+from node.blockchain.utils.checkpoint import make_checkpoint, write_checkpoint
+from node.core.commands import CustomCommand
+
+
+class Command(CustomCommand):
+    help = 'Export account state checkpoint at the last block (gzipped if the path ends with .gz)'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Checkpoint file path')
+
+    def handle(self, path, *args, **options):
+        if (checkpoint := make_checkpoint()) is None:
+            self.write_error('Blockchain is empty')
+            sys.exit(1)
+
+        write_checkpoint(checkpoint, path)
+        self.write_success(
+            f'Checkpoint at block number {checkpoint["block_number"]} (hash {checkpoint["hash"]}) '
+            f'is exported to {path}'
+        )
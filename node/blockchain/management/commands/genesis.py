@@ -5,12 +5,12 @@ from django.db import transaction
 
 from node.blockchain.facade import BlockchainFacade
 from node.blockchain.inner_models import (
-    GenesisBlockMessage, GenesisSignedChangeRequest, GenesisSignedChangeRequestMessage
+    Block, GenesisBlockMessage, GenesisSignedChangeRequest, GenesisSignedChangeRequestMessage
 )
-from node.blockchain.models.block import Block
+from node.blockchain.models.block import Block as ORMBlock
 from node.blockchain.types import AccountLock
 from node.core.commands import CustomCommand
-from node.core.utils.cryptography import get_signing_key
+from node.core.utils.cryptography import derive_public_key, get_signing_key
 from node.core.utils.network import make_own_node, read_source
 
 logger = logging.getLogger(__name__)
@@ -23,14 +23,19 @@ class Command(CustomCommand):
         # TODO(dmu) MEDIUM: We may need simpler blockchains and with known private key for local testing. Implement
         parser.add_argument('source', help='file path or URL to alpha account root file')
         parser.add_argument('-f', '--force', action='store_true', help='remove existing blockchain if any')
+        parser.add_argument(
+            '--fast-clear',
+            action='store_true',
+            help='remove existing blockchain by dropping collections (faster for large blockchains, but not atomic)',
+        )
         parser.add_argument('-e', '--extra-account')
         parser.add_argument(
             '--extra-account-balance', type=int, default=100000, help='Balance amount for extra account'
         )
 
-    def handle(self, source, force, extra_account, **options):
+    def handle(self, source, force, fast_clear, extra_account, **options):
         # TODO(dmu) MEDIUM: Cover this method with unittests
-        does_exist = Block.objects.exists()
+        does_exist = ORMBlock.objects.exists()
         if does_exist and not force:
             self.write_error('Blockchain already exists')
             sys.exit(1)
@@ -59,14 +64,26 @@ class Command(CustomCommand):
 
         request = GenesisSignedChangeRequest.create_from_signed_change_request_message(request_message, signing_key)
         block_message = GenesisBlockMessage.create_from_signed_change_request(request, primary_validator_node)
-        self.write_info('Made genesis block message')
+        # Genesis block is made and validated before the existing blockchain is removed, so it is not removed in vain
+        block_message.validate_business_logic()
+        block = Block(
+            signer=derive_public_key(signing_key),
+            signature=block_message.make_signature(signing_key),
+            message=block_message,
+        )
+        self.write_info('Made genesis block')
 
         blockchain_facade = BlockchainFacade.get_instance()
+        if does_exist and fast_clear:
+            # Dropping collections cannot be done in a transaction, so the blockchain stays empty if genesis block
+            # is not added
+            blockchain_facade.fast_clear()
+            self.write_info('Removed existing blockchain')
 
         with transaction.atomic():
-            if does_exist:
+            if does_exist and not fast_clear:
                 blockchain_facade.clear()
 
-            blockchain_facade.add_block_from_block_message(block_message, signing_key=signing_key, validate=False)
+            blockchain_facade.add_block(block, validate=False)
 
         self.write_success('Blockchain genesis complete')
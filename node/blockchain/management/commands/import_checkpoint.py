@@ -0,0 +1,27 @@
+import sys
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.utils.checkpoint import read_checkpoint
+from node.core.commands import CustomCommand
+from node.core.exceptions import CheckpointError
+
+
+class Command(CustomCommand):
+    help = 'Bootstrap empty blockchain from account state checkpoint'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Checkpoint file path (gzipped if it ends with .gz)')
+        parser.add_argument('--expected-hash', required=True, help='Checkpoint hash obtained from a trusted source')
+
+    def handle(self, path, expected_hash, *args, **options):
+        checkpoint = read_checkpoint(path)
+        try:
+            BlockchainFacade.get_instance().load_checkpoint(checkpoint, expected_hash)
+        except CheckpointError as ex:
+            self.write_error(str(ex))
+            sys.exit(1)
+
+        self.write_success(
+            f'Loaded checkpoint at block number {checkpoint["block_number"]} with {len(checkpoint["accounts"])} '
+            f'account(s)'
+        )
@@ -0,0 +1,55 @@
+import json
+
+from node.blockchain.utils.lock_metrics import get_lock_metrics, reset_lock_metrics
+from node.core.commands import CustomCommand
+
+HEADER = (
+    'lock', 'site', 'acquired', 'wait p50, ms', 'wait p95, ms', 'wait max, ms', 'hold p50, ms', 'hold p95, ms',
+    'hold max, ms', 'hold total, ms', 'failures', 'blocked by'
+)
+
+
+def format_ms(value):
+    return '-' if value is None else f'{value:.1f}'
+
+
+class Command(CustomCommand):
+    help = 'Show lock wait and hold time histograms and locking failures collected by all processes'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', dest='as_json', action='store_true', help='Output metrics as JSON')
+        parser.add_argument('--reset', action='store_true', help='Delete collected metrics')
+
+    def handle(self, as_json, reset, *args, **options):
+        if reset:
+            reset_lock_metrics()
+            self.write_success('Lock metrics are reset')
+            return
+
+        metrics = get_lock_metrics()
+        if as_json:
+            self.write(json.dumps(metrics, indent=2))
+            return
+
+        rows = [HEADER]
+        for item in metrics:
+            wait, hold = item['wait'], item['hold']
+            blocked_by = ', '.join(f'{site} ({count})' for site, count in item['blocked_by'].items())
+            rows.append((
+                item['lock'],
+                item['site'],
+                str(hold['count']),
+                format_ms(wait['p50_ms']),
+                format_ms(wait['p95_ms']),
+                format_ms(wait['max_ms']),
+                format_ms(hold['p50_ms']),
+                format_ms(hold['p95_ms']),
+                format_ms(hold['max_ms']),
+                format_ms(hold['total_ms']),
+                str(item['failures']),
+                blocked_by or '-',
+            ))
+
+        widths = [max(len(row[index]) for row in rows) for index in range(len(HEADER))]
+        for row in rows:
+            self.write('  '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip())
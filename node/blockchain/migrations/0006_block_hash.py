@@ -0,0 +1,18 @@
+# Generated by Django 3.2.12 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blockchain', '0005_blockconfirmation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='block',
+            name='hash',
+            field=models.CharField(db_index=True, max_length=128, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.12 on 2026-10-18 10:05
+
+from django.db import migrations
+
+import node.blockchain.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blockchain', '0006_block_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='block',
+            name='body',
+            field=node.blockchain.fields.BodyField(),
+        ),
+        migrations.AlterField(
+            model_name='blockconfirmation',
+            name='body',
+            field=node.blockchain.fields.BodyField(),
+        ),
+        migrations.AlterField(
+            model_name='pendingblock',
+            name='body',
+            field=node.blockchain.fields.BodyField(),
+        ),
+    ]
@@ -0,0 +1,37 @@
+import logging
+
+from django.db import migrations
+
+from node.core.indexes import Index, IndexStatus, delete_duplicates, ensure_index
+
+logger = logging.getLogger(__name__)
+
+UNIQUE_INDEX = Index(('number', 'signer'), unique=True)
+
+
+def create_unique_indexes(apps, schema_editor):
+    # Duplicates may have been stored before the index was required, so they are deleted for the index to be built
+    for model_name in ('BlockConfirmation', 'PendingBlock'):
+        model = apps.get_model('blockchain', model_name)
+        if deleted_ids := delete_duplicates(model, UNIQUE_INDEX.fields):
+            logger.warning(
+                'Deleted %s %s duplicates by %s (the newest ones are kept): %s', len(deleted_ids), model_name,
+                UNIQUE_INDEX.fields, deleted_ids
+            )
+
+        status = ensure_index(model, UNIQUE_INDEX, replace=True)
+        if status not in (IndexStatus.EXISTS, IndexStatus.CREATED):
+            # It is not fatal: the index is created by `ensure_indexes` command later
+            logger.warning('%s %s index: %s', model_name, UNIQUE_INDEX.fields, status.value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blockchain', '0007_body_field'),
+    ]
+
+    operations = [
+        # Index creation is not allowed in multi-document transaction for existing collections
+        migrations.RunPython(create_unique_indexes, migrations.RunPython.noop, atomic=False),
+    ]
@@ -1,7 +1,8 @@
 import logging
 
 from node.blockchain.types import Hash, SigningKey
-from node.core.utils.cryptography import generate_signature, hash_binary_data, is_signature_valid
+from node.core.utils.cryptography import generate_signature, hash_binary_data
+from node.core.utils.signature_verification import verify_signature
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,7 @@ def validate_signature_helper(values: dict):
     if (
         # TODO(dmu) MEDIUM: How is it possible that signer, signature, message can be empty?
         not signer or not signature or not message or
-        not is_signature_valid(signer, message.make_binary_representation_for_cryptography(), signature)
+        not verify_signature(signer, message.make_binary_representation_for_cryptography(), signature)
     ):
         # TODO(dmu) LOW: Pydantic does not recognize custom ValidationError. Fix?
         raise ValueError('Invalid signature')
@@ -1,30 +1,69 @@
+from typing import Optional
+
 from djongo import models
 
+from node.blockchain.fields import BodyField
 from node.blockchain.inner_models import Block as PydanticBlock
+from node.blockchain.mixins.crypto import HashableStringWrapper
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.types import ChainTip, Hash
+from node.core.database import is_mongo_connection
 from node.core.managers import CustomManager
 from node.core.models import CustomModel
 
 
 class BlockManager(CustomManager):
 
+    _repository: Optional[BlockRepository] = None
+
     def create(self, *args, **kwargs):
         # This method is blocked intentionally to prohibit adding of invalid blocks
         raise NotImplementedError('One of the `BlockchainFacade.add_block*() methods must be used')
 
+    @property
+    def repository(self):
+        # Raw pymongo queries are used for performance reasons (we do not need SQL translation for them)
+        if not is_mongo_connection():
+            return None
+
+        if (repository := self._repository) is None:
+            # Repository is stateless, so it is created once
+            self._repository = repository = BlockRepository()
+
+        return repository
+
     def get_last_block(self):
+        if repository := self.repository:
+            return repository.get_last_block()
+
         return self.order_by('-_id').first()
 
+    def get_chain_tip(self, is_committed=False) -> Optional[ChainTip]:
+        if repository := self.repository:
+            return repository.get_chain_tip(is_committed)
+
+        last_block = self.get_last_block()
+        return ChainTip(number=last_block._id, hash=last_block.get_hash()) if last_block else None
+
     def get_block_by_number(self, number):
+        if repository := self.repository:
+            return repository.get_block_by_number(number)
+
         return self.get_or_none(_id=number)
 
     def get_next_block_number(self):
+        if repository := self.repository:
+            return repository.get_next_block_number()
+
         last_block = self.get_last_block()
         return last_block._id + 1 if last_block else 0
 
 
 class Block(CustomModel):
     _id = models.PositiveBigIntegerField('Block number', primary_key=True)
-    body = models.BinaryField()
+    # Blocks added before `hash` was introduced have it empty until `backfill_block_hashes` command is run
+    hash = models.CharField(max_length=128, db_index=True, null=True)  # noqa: A003
+    body = BodyField()
 
     objects = BlockManager()
 
@@ -37,12 +76,16 @@ class Block(CustomModel):
 
         return block
 
+    def get_hash(self) -> Hash:
+        return self.hash or self.make_hash()
+
+    def make_hash(self) -> Hash:
+        return HashableStringWrapper(self.body).make_hash()
+
     def save(self, *args, force_insert=True, **kwargs):
         assert force_insert  # must be true for database consistency validation
 
-        # TODO(dmu) LOW: Optimize by querying last block number instead of the entire block
-        last_block = Block.objects.get_last_block()
-        expected_block_id = 0 if last_block is None else last_block._id + 1
+        expected_block_id = Block.objects.get_next_block_number()
         if expected_block_id != self._id:
             raise ValueError(f'Expected block_id is {expected_block_id}')
 
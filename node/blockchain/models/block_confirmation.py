@@ -2,6 +2,7 @@ import uuid
 
 from djongo import models
 
+from node.blockchain.fields import BodyField
 from node.blockchain.inner_models import BlockConfirmation as PydanticBlockConfirmation
 from node.core.managers import CustomManager
 from node.core.models import CustomModel
@@ -34,7 +35,7 @@ class BlockConfirmation(CustomModel):
     number = models.PositiveBigIntegerField()
     hash = models.CharField(max_length=128)  # noqa: A003
     signer = models.CharField(max_length=64)
-    body = models.BinaryField()
+    body = BodyField()
 
     objects = BlockConfirmationManager()
 
@@ -24,13 +24,16 @@ class NodeQuerySet(CustomQuerySet):
 
         assert not (roles - NODE_ROLES)
 
-        from node.blockchain.models import Schedule
+        from node.blockchain.facade import BlockchainFacade
 
         assert {NodeRole.REGULAR_NODE, NodeRole.CONFIRMATION_VALIDATOR, NodeRole.PRIMARY_VALIDATOR} == NODE_ROLES
 
-        next_block_schedule = Schedule.objects.get_schedule_for_next_block()
-        primary_validator_identifier = next_block_schedule.node_identifier if next_block_schedule else None
-        validator_identifiers = {item.node_identifier for item in Schedule.objects.all().order_by('_id')}
+        facade = BlockchainFacade.get_instance()
+        schedule_snapshot = facade.get_schedule_snapshot()
+        primary_validator_identifier = schedule_snapshot.get_primary_validator_identifier(
+            facade.get_next_block_number()
+        )
+        validator_identifiers = set(schedule_snapshot.get_validator_identifiers())
         if NodeRole.REGULAR_NODE in roles:
             if NodeRole.PRIMARY_VALIDATOR in roles:
                 if NodeRole.CONFIRMATION_VALIDATOR in roles:
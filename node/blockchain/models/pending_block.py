@@ -2,6 +2,7 @@ import uuid
 
 from djongo import models
 
+from node.blockchain.fields import BodyField
 from node.blockchain.inner_models import Block as PydanticBlock
 from node.core.models import CustomModel
 
@@ -12,7 +13,7 @@ class PendingBlock(CustomModel):
     number = models.PositiveBigIntegerField()
     hash = models.CharField(max_length=128)  # noqa: A003
     signer = models.CharField(max_length=64)
-    body = models.BinaryField()
+    body = BodyField()
 
     def get_block(self) -> PydanticBlock:
         return PydanticBlock.parse_raw(self.body)
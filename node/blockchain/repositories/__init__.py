@@ -0,0 +1 @@
+from .block import BlockRepository  # noqa: F401
@@ -0,0 +1,273 @@
+import mmap
+import os
+import shutil
+import struct
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+
+from django.conf import settings
+
+# Index entry is the end offset of block body in the data file (start offset is the end offset of previous block)
+INDEX_ENTRY = struct.Struct('<Q')
+
+_archive: Optional['BlockArchive'] = None
+_archive_lock = threading.Lock()
+
+
+class Segment:
+    """
+    Pair of append-only files holding bodies of `BlockArchive.segment_size` consecutive blocks: data file with
+    concatenated bodies and index file with end offset of each body.
+    """
+
+    def __init__(self, directory: Path, first_block_number: int):
+        self.first_block_number = first_block_number
+        self.data_path = directory / f'{first_block_number:020d}.data'
+        self.index_path = directory / f'{first_block_number:020d}.index'
+
+        # Memory maps are replaced (not closed) when the segment files change, because returned memory views may
+        # still refer to them (they are closed by garbage collector)
+        self._index_map = None
+        self._data_map = None
+        self._mapped_file_key = None
+        self._map_lock = threading.Lock()
+
+    def get_count(self) -> int:
+        try:
+            return self.index_path.stat().st_size // INDEX_ENTRY.size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def get_file_key(stat_result):
+        # Files are appended to or replaced (archive may be cleared and filled again by another process), so
+        # the key changes on every change, even if the inode number is reused
+        return stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns
+
+    def ensure_mapped(self):
+        file_key = self.get_file_key(os.stat(self.index_path))
+        if self._mapped_file_key == file_key:
+            return
+
+        with self._map_lock:
+            if self._mapped_file_key == file_key:
+                return
+
+            with open(self.index_path, 'rb') as index_file, open(self.data_path, 'rb') as data_file:
+                # Key of the file that is actually mapped (it could have been changed since `stat()`)
+                mapped_file_key = self.get_file_key(os.fstat(index_file.fileno()))
+                index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+                mapped_count = len(index_map) // INDEX_ENTRY.size
+                data_size = INDEX_ENTRY.unpack_from(index_map, (mapped_count - 1) * INDEX_ENTRY.size)[0]
+                data_map = mmap.mmap(data_file.fileno(), data_size, access=mmap.ACCESS_READ) if data_size else b''
+
+            self._index_map, self._data_map, self._mapped_file_key = index_map, data_map, mapped_file_key
+
+    def get_offsets(self, index):
+        start = INDEX_ENTRY.unpack_from(self._index_map, (index - 1) * INDEX_ENTRY.size)[0] if index else 0
+        end = INDEX_ENTRY.unpack_from(self._index_map, index * INDEX_ENTRY.size)[0]
+        return start, end
+
+    def iter_bodies(self, start_index, stop_index) -> Iterator[memoryview]:
+        """
+        Yield zero-copy views of bodies with indexes from `start_index` up to (excluding) `stop_index`
+        """
+        self.ensure_mapped()
+        data = memoryview(self._data_map)
+        for index in range(start_index, stop_index):
+            start, end = self.get_offsets(index)
+            yield data[start:end]
+
+    def append(self, bodies):
+        """
+        Append bodies making sure that index file never refers to partially written data
+        """
+        count = self.get_count()
+        with open(self.index_path, 'ab') as index_file, open(self.data_path, 'ab') as data_file:
+            offset = self.get_data_size(count)
+            # Discard partial index entry and data left by interrupted append
+            index_file.truncate(count * INDEX_ENTRY.size)
+            data_file.truncate(offset)
+            data_file.seek(offset)
+
+            index_entries = []
+            for body in bodies:
+                data = body.encode() if isinstance(body, str) else body
+                data_file.write(data)
+                offset += len(data)
+                index_entries.append(INDEX_ENTRY.pack(offset))
+
+            data_file.flush()
+            os.fsync(data_file.fileno())
+
+            index_file.write(b''.join(index_entries))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+
+    def get_data_size(self, count):
+        if not count:
+            return 0
+
+        with open(self.index_path, 'rb') as index_file:
+            index_file.seek((count - 1) * INDEX_ENTRY.size)
+            return INDEX_ENTRY.unpack(index_file.read(INDEX_ENTRY.size))[0]
+
+
+class BlockArchive:
+    """
+    Archive of finalized block bodies in append-only segment files (see `Segment`).
+
+    Blocks are archived consecutively starting from the first block in the database (it is not the genesis block
+    for blockchain bootstrapped from a checkpoint). Segments are aligned to the first archived block, so block
+    number maps to segment and index within it arithmetically. Reads are served from memory maps without database
+    requests.
+    """
+
+    def __init__(self, path, segment_size):
+        self.path = Path(path)
+        self.segment_size = segment_size
+        self._segments: dict[int, Segment] = {}
+        self._segments_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # (directory key, first block numbers of the first and the last segments), so the directory is listed only
+        # when segments are added or removed
+        self._segment_bounds = None
+
+    def get_segment(self, block_number, archive_first_block_number=None) -> Segment:
+        if archive_first_block_number is None:
+            archive_first_block_number = self.get_first_block_number()
+
+        first_block_number = block_number - (block_number - archive_first_block_number) % self.segment_size
+        if (segment := self._segments.get(first_block_number)) is None:
+            with self._segments_lock:
+                if (segment := self._segments.get(first_block_number)) is None:
+                    self._segments[first_block_number] = segment = Segment(self.path, first_block_number)
+
+        return segment
+
+    def get_segment_first_block_numbers(self) -> list[int]:
+        if not self.path.exists():
+            return []
+
+        return sorted(int(path.stem) for path in self.path.glob('*.index'))
+
+    def get_segment_bounds(self) -> Optional[tuple[int, int]]:
+        """
+        Return first block numbers of the first and the last segments (`None` if there are no segments)
+        """
+        try:
+            # Directory modification time changes when segment files are created or deleted
+            directory_key = Segment.get_file_key(self.path.stat())
+        except FileNotFoundError:
+            return None
+
+        if (segment_bounds := self._segment_bounds) is None or segment_bounds[0] != directory_key:
+            first_block_numbers = self.get_segment_first_block_numbers()
+            bounds = (first_block_numbers[0], first_block_numbers[-1]) if first_block_numbers else None
+            self._segment_bounds = segment_bounds = (directory_key, bounds)
+
+        return segment_bounds[1]
+
+    def get_first_block_number(self) -> Optional[int]:
+        """
+        Return number of the first archived block (`None` if the archive is empty)
+        """
+        return None if (bounds := self.get_segment_bounds()) is None else bounds[0]
+
+    def get_next_block_number(self) -> Optional[int]:
+        """
+        Return number of the first block that is not archived yet (`None` if the archive is empty)
+        """
+        if (bounds := self.get_segment_bounds()) is None:
+            return None
+
+        first_block_number, last_first_block_number = bounds
+        return last_first_block_number + self.get_segment(last_first_block_number, first_block_number).get_count()
+
+    def get_archived_range(self) -> Optional[tuple[int, int]]:
+        """
+        Return numbers of the first archived block and the first block that is not archived yet (`None` if nothing
+        is archived)
+        """
+        if (first_block_number := self.get_first_block_number()) is None:
+            return None
+
+        next_block_number = self.get_next_block_number()
+        return (first_block_number, next_block_number) if next_block_number > first_block_number else None
+
+    def has_block(self, block_number) -> bool:
+        if (archived_range := self.get_archived_range()) is None:
+            return False
+
+        first_block_number, next_block_number = archived_range
+        return first_block_number <= block_number < next_block_number
+
+    def get_body(self, block_number) -> Optional[memoryview]:
+        if not self.has_block(block_number):
+            return None
+
+        return next(self.iter_bodies(block_number, block_number))
+
+    def iter_bodies(self, min_number, max_number) -> Iterator[memoryview]:
+        """
+        Yield bodies of archived blocks from `min_number` to `max_number` inclusive
+        """
+        if (archived_range := self.get_archived_range()) is None:
+            return
+
+        first_block_number, next_block_number = archived_range
+        max_number = min(max_number, next_block_number - 1)
+        block_number = max(min_number, first_block_number)
+        while block_number <= max_number:
+            segment = self.get_segment(block_number, first_block_number)
+            start_index = block_number - segment.first_block_number
+            stop_index = min(max_number - segment.first_block_number + 1, self.segment_size)
+            yield from segment.iter_bodies(start_index, stop_index)
+            block_number = segment.first_block_number + stop_index
+
+    def append(self, first_block_number, bodies):
+        """
+        Append bodies of consecutive blocks starting from `first_block_number` (any block number can be the first one
+        for empty archive)
+        """
+        with self._write_lock:
+            if (expected_block_number := self.get_next_block_number()) is None:
+                archive_first_block_number = first_block_number
+            elif first_block_number != expected_block_number:
+                raise ValueError(f'Expected block number {expected_block_number} to be archived next')
+            else:
+                archive_first_block_number = self.get_first_block_number()
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            block_number = first_block_number
+            bodies = list(bodies)
+            while bodies:
+                segment = self.get_segment(block_number, archive_first_block_number)
+                count = min(len(bodies), segment.first_block_number + self.segment_size - block_number)
+                segment.append(bodies[:count])
+                bodies = bodies[count:]
+                block_number += count
+
+    def clear(self):
+        with self._write_lock, self._segments_lock:
+            self._segments = {}
+            shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_block_archive() -> Optional[BlockArchive]:
+    """
+    Return block archive if it is enabled with `BLOCK_ARCHIVE_PATH` setting
+    """
+    global _archive
+
+    if not (path := settings.BLOCK_ARCHIVE_PATH):
+        return None
+
+    segment_size = settings.BLOCK_ARCHIVE_SEGMENT_SIZE
+    if (archive := _archive) is None or archive.path != Path(path) or archive.segment_size != segment_size:
+        with _archive_lock:
+            if (archive := _archive) is None or archive.path != Path(path) or archive.segment_size != segment_size:
+                _archive = archive = BlockArchive(path, segment_size)
+
+    return archive
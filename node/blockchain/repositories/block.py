@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Optional
+
+from django.db import DEFAULT_DB_ALIAS
+from pymongo import ASCENDING, DESCENDING
+
+from node.blockchain.mixins.crypto import HashableStringWrapper
+from node.blockchain.repositories.archive import BlockArchive, get_block_archive
+from node.blockchain.types import ChainTip
+from node.blockchain.utils.compression import decompress_body
+from node.core.database import get_collection, get_session
+from node.core.utils.misc import SENTINEL
+
+if TYPE_CHECKING:
+    from node.blockchain.models import Block
+
+FIELD_NAMES = ('_id', 'hash', 'body')
+ID_PROJECTION = {'_id': 1}
+CHAIN_TIP_PROJECTION = {'_id': 1, 'hash': 1}
+BODY_PROJECTION = {'_id': 0, 'body': 1}
+
+
+class BlockRepository:
+    """
+    Block reads with raw pymongo queries (bypassing djongo SQL translation).
+
+    Queries are run in the session of the active transaction (if any), so they see the same data as ORM queries,
+    unless another `session` is given.
+    Bodies of blocks moved to block archive (if enabled) are read from it (see `archive_blocks` command).
+    """
+
+    def __init__(self, archive=SENTINEL, session=SENTINEL):
+        # Block archive is looked up on use unless it is given explicitly (`None` to read from the database only),
+        # so long-living repository follows settings changes
+        self._archive = archive
+        self._session = session
+
+    @property
+    def archive(self) -> Optional[BlockArchive]:
+        return get_block_archive() if (archive := self._archive) is SENTINEL else archive
+
+    def get_archived_range(self) -> Optional[tuple[int, int]]:
+        return archive.get_archived_range() if (archive := self.archive) else None
+
+    @staticmethod
+    def get_model():
+        from node.blockchain.models import Block
+        return Block
+
+    def get_collection(self):
+        return get_collection(self.get_model())
+
+    def get_session(self):
+        return get_session() if (session := self._session) is SENTINEL else session
+
+    def make_block(self, document) -> 'Block':
+        # `from_db()` does not apply field converters, so we decompress body here
+        document['body'] = decompress_body(document.get('body'))
+        return self.get_model().from_db(DEFAULT_DB_ALIAS, FIELD_NAMES, [document.get(name) for name in FIELD_NAMES])
+
+    def find_one(self, filter_, projection=None, sort=None):
+        return self.get_collection().find_one(filter_, projection, sort=sort, session=self.get_session())
+
+    def get_last_block(self) -> Optional['Block']:
+        document = self.find_one({}, sort=[('_id', DESCENDING)])
+        return None if document is None else self.make_block(document)
+
+    def get_first_block_number(self) -> Optional[int]:
+        document = self.find_one({}, ID_PROJECTION, sort=[('_id', ASCENDING)])
+        return None if document is None else document['_id']
+
+    def get_last_block_number(self) -> Optional[int]:
+        document = self.find_one({}, ID_PROJECTION, sort=[('_id', DESCENDING)])
+        return None if document is None else document['_id']
+
+    def get_chain_tip(self, is_committed=False) -> Optional[ChainTip]:
+        """
+        Return number and hash of the last block. If `is_committed` is true it is read outside the active transaction,
+        so it is the last committed block regardless of the transaction snapshot
+        """
+        session = None if is_committed else self.get_session()
+        collection = self.get_collection()
+        document = collection.find_one({}, CHAIN_TIP_PROJECTION, sort=[('_id', DESCENDING)], session=session)
+        if document is None:
+            return None
+
+        if (hash_ := document.get('hash')) is None:
+            # Blocks added before `hash` was introduced
+            body_document = collection.find_one({'_id': document['_id']}, BODY_PROJECTION, session=session)
+            hash_ = HashableStringWrapper(decompress_body(body_document['body'])).make_hash()
+
+        return ChainTip(number=document['_id'], hash=hash_)
+
+    def get_next_block_number(self) -> int:
+        last_block_number = self.get_last_block_number()
+        return 0 if last_block_number is None else last_block_number + 1
+
+    def get_block_by_number(self, number) -> Optional['Block']:
+        if (archive := self.archive) and archive.has_block(number):
+            return self.make_block({'_id': number, 'body': archive.get_body(number)})
+
+        document = self.find_one({'_id': number})
+        return None if document is None else self.make_block(document)
+
+    def get_stored_block_body(self, number):
+        """
+        Return body as it is stored (it may be compressed, see `node.blockchain.utils.compression`)
+        """
+        if (archive := self.archive) and archive.has_block(number):
+            return archive.get_body(number)
+
+        document = self.find_one({'_id': number}, BODY_PROJECTION)
+        return None if document is None else document['body']
+
+    def get_block_body(self, number) -> Optional[str]:
+        return decompress_body(self.get_stored_block_body(number))
+
+    def find(self, min_number=None, max_number=None, offset=0, limit=None, projection=None):
+        if limit == 0:
+            return []  # pymongo treats zero limit as no limit
+
+        number_filter = {}
+        if min_number is not None:
+            number_filter['$gte'] = min_number
+        if max_number is not None:
+            number_filter['$lte'] = max_number
+
+        filter_ = {'_id': number_filter} if number_filter else {}
+        cursor = self.get_collection().find(filter_, projection, session=self.get_session())
+        cursor = cursor.sort('_id', ASCENDING).skip(offset)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+
+        return cursor
+
+    def iter_documents(self, min_number=None, max_number=None, offset=0, limit=None, projection=None):
+        """
+        Same as `find()`, but archived blocks are read from the archive (as documents with `_id` and `body` only)
+        """
+        if (archived_range := self.get_archived_range()) is None:
+            yield from self.find(min_number, max_number, offset, limit, projection)
+            return
+
+        # Block numbers are consecutive, so we can turn offset into block number (archived blocks may be deleted
+        # from the database, so we cannot rely on database offset)
+        archive_first_block_number, archive_next_block_number = archived_range
+        min_number = max(min_number or 0, archive_first_block_number) + offset
+        if min_number < archive_next_block_number:
+            max_archived_number = archive_next_block_number - 1
+            if max_number is not None:
+                max_archived_number = min(max_archived_number, max_number)
+            if limit is not None:
+                max_archived_number = min(max_archived_number, min_number + limit - 1)
+
+            for number, body in enumerate(self.archive.iter_bodies(min_number, max_archived_number), min_number):
+                yield {'_id': number, 'body': body}
+
+            if limit is not None:
+                limit -= max(max_archived_number - min_number + 1, 0)
+
+            min_number = archive_next_block_number
+
+        if max_number is None or min_number <= max_number:
+            yield from self.find(min_number, max_number, 0, limit, projection)
+
+    def get_blocks(self, min_number=None, max_number=None, offset=0, limit=None) -> list['Block']:
+        return [self.make_block(document) for document in self.iter_documents(min_number, max_number, offset, limit)]
+
+    def iter_stored_block_bodies(self, min_number=None, max_number=None, offset=0, limit=None):
+        documents = self.iter_documents(min_number, max_number, offset, limit, BODY_PROJECTION)
+        return (document['body'] for document in documents)
+
+    def get_block_bodies(self, min_number=None, max_number=None, offset=0, limit=None) -> list[str]:
+        return [decompress_body(body) for body in self.iter_stored_block_bodies(min_number, max_number, offset, limit)]
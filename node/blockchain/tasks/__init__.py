@@ -1,3 +1,4 @@
+from .make_checkpoint import *  # noqa: F401
 from .process_block_confirmations import *  # noqa: F401
 from .process_pending_blocks import *  # noqa: F401
 from .send_new_block import *  # noqa: F401
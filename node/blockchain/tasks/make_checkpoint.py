@@ -0,0 +1,22 @@
+import logging
+
+from celery import shared_task
+
+from node.blockchain.utils.checkpoint import get_checkpoint_path, make_checkpoint, write_checkpoint
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def make_checkpoint_task(block_number):
+    # More blocks may have been added since `block_number`, so the checkpoint is made for the actual last block
+    if (checkpoint := make_checkpoint()) is None:
+        return
+
+    path = get_checkpoint_path(checkpoint['block_number'])
+    write_checkpoint(checkpoint, path)
+    logger.info('Checkpoint requested at block number %s is written to %s', block_number, path)
+
+
+def start_make_checkpoint_task(block_number):
+    make_checkpoint_task.delay(block_number)
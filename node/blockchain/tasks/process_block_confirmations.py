@@ -8,11 +8,11 @@ from django.db import transaction
 
 from node.blockchain.constants import BLOCK_LOCK
 from node.blockchain.facade import BlockchainFacade
-from node.blockchain.mixins.crypto import HashableStringWrapper
 from node.blockchain.models import BlockConfirmation, PendingBlock
 from node.blockchain.types import Hash
 from node.blockchain.utils.lock import lock
 from node.core.exceptions import ValidationError
+from node.core.utils.signature_verification import parse_with_batch_signature_verification
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +58,20 @@ def is_valid_consensus(confirmations: list[BlockConfirmation], minimum_consensus
     assert len(set(confirmation.signer for confirmation in confirmations)) == len(confirmations)
     facade = BlockchainFacade.get_instance()
 
+    # Signatures of all confirmations are verified at once in parallel
+    parsed_confirmations = parse_with_batch_signature_verification(
+        BlockConfirmation.get_block_confirmation, confirmations
+    )
     confirmations_left = minimum_consensus
-    for confirmation in confirmations:
+    for confirmation, (block_confirmation, is_signature_valid) in zip(confirmations, parsed_confirmations):
         try:
-            confirmation.get_block_confirmation().validate_all(facade)
+            if isinstance(block_confirmation, Exception):
+                raise block_confirmation
+
+            if not is_signature_valid:
+                raise ValidationError('Invalid signature')
+
+            block_confirmation.validate_all(facade)
         except ValidationError:
             logger.warning('Invalid confirmation detected: %s', confirmation)
             continue
@@ -91,12 +101,12 @@ def process_block(block_number) -> bool:
         # TODO(dmu) CRITICAL: https://thenewboston.atlassian.net/browse/BC-283
         raise NotImplementedError('Edge case of processing confirmed missing pending block is not implemented')
 
-    block_body = pending_block.body
-    if HashableStringWrapper(block_body).make_hash() != block_hash:
-        raise ValidationError('Pending block body hash is not valid')  # we should never get here
-
     with transaction.atomic():
-        orm_block = facade.add_block_from_json(block_body, expect_locked=True)
+        orm_block = facade.add_block_from_json(pending_block.body, expect_locked=True)
+        # Block hash is calculated once on adding, so we validate it afterwards instead of hashing the body twice
+        if orm_block.hash != block_hash:
+            raise ValidationError('Pending block body hash is not valid')  # we should never get here
+
         # There may be blocks with other hashes therefore we delete all of them
         block_number = orm_block._id
         PendingBlock.objects.filter(number__lte=block_number).delete()
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
+from django.db import connection
+
 from node.blockchain.facade import BlockchainFacade
 from node.blockchain.models import Schedule
 from node.blockchain.types import NodeRole
@@ -18,8 +21,26 @@ def make_node_as_role(node_identifier, node_role):
         assert node_role == NodeRole.REGULAR_NODE
         Schedule.objects.filter(node_identifier=node_identifier).delete()
 
+    # Schedule is changed bypassing blockchain facade
+    BlockchainFacade.get_instance().invalidate_cache()
+
 
 @contextmanager
 def as_role(node_role: NodeRole):
     make_node_as_role(get_node_identifier(), node_role)
     yield
+
+
+def run_in_thread(func, *args, **kwargs):
+    """
+    Run `func` in a separate thread (it has its own database connection and transaction) and return the result
+    """
+
+    def run():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run).result()
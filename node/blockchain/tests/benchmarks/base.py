@@ -0,0 +1,30 @@
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class Measurement:
+
+    def __init__(self):
+        self.duration = None
+        self.query_count = None
+
+
+@contextmanager
+def measure():
+    measurement = Measurement()
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        yield measurement
+        measurement.duration = time.perf_counter() - start
+
+    measurement.query_count = len(context.captured_queries)
+
+
+def report(title, header, rows):
+    widths = [max(len(str(value)) for value in column) for column in zip(header, *rows)]
+    print(f'\n{title}')
+    for row in (header, *rows):
+        print('  '.join(str(value).rjust(width) for value, width in zip(row, widths)))
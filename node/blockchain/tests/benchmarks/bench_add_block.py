@@ -0,0 +1,58 @@
+"""
+Database queries made while adding a block from a signed change request.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_add_block.py`
+"""
+import pytest
+
+from node.blockchain.facade import BlockchainFacade, BlockchainStateSnapshot
+from node.blockchain.inner_models import BlockMessage
+from node.blockchain.tests.benchmarks.base import measure, report
+from node.blockchain.tests.factories.block import make_block
+from node.blockchain.tests.factories.signed_change_request.coin_transfer import (
+    make_coin_transfer_signed_change_request
+)
+
+BLOCK_COUNT = 20
+
+
+def validate_block(request, blockchain_facade, signing_key):
+    block_message = BlockMessage.create_from_signed_change_request(request, blockchain_facade)
+    block = make_block(block_message, signing_key)
+    block.validate_blockchain_state_dependent(blockchain_facade, bypass_lock_validation=True)
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_add_block_query_count(treasury_account_key_pair, user_key_pair, regular_node, primary_validator_key_pair):
+    facade = BlockchainFacade.get_instance()
+
+    rows = []
+    for _ in range(BLOCK_COUNT):
+        request = make_coin_transfer_signed_change_request(
+            treasury_account_key_pair, user_key_pair.public, regular_node.identifier
+        )
+
+        with measure() as direct:
+            validate_block(request, facade, primary_validator_key_pair.private)
+
+        state_snapshot = BlockchainStateSnapshot(facade)
+        with measure() as snapshot:
+            validate_block(request, state_snapshot, primary_validator_key_pair.private)
+
+        with measure() as add_block:
+            facade.add_block_from_signed_change_request(request, signing_key=primary_validator_key_pair.private)
+
+        rows.append((
+            facade.get_next_block_number() - 1,
+            direct.query_count,
+            snapshot.query_count,
+            state_snapshot.read_count,
+            add_block.query_count,
+            f'{add_block.duration * 1000:.1f}',
+        ))
+
+    report(
+        'Queries per block',
+        ('block', 'validation (facade)', 'validation (snapshot)', 'snapshot reads', 'add_block', 'add_block, ms'),
+        rows,
+    )
@@ -0,0 +1,48 @@
+"""
+Duration of block page reads from the database versus block archive segment files.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_block_archive.py`
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.tests.benchmarks.base import measure, report
+
+ITERATION_COUNT = 200
+PAGE_SIZES = (1, 10, 20)
+
+
+@pytest.mark.usefixtures('bloated_blockchain')
+def test_block_archive_reads(settings, tmp_path):
+    database_repository = BlockRepository(archive=None)
+    settings.BLOCK_ARCHIVE_PATH = str(tmp_path / 'archive')
+    call_command('archive_blocks', keep=1, no_delete=True, stdout=StringIO())
+    archive_repository = BlockRepository()
+    assert archive_repository.archive.get_next_block_number() > max(PAGE_SIZES)
+
+    rows = []
+    for page_size in PAGE_SIZES:
+        durations = []
+        for repository in (database_repository, archive_repository):
+            with measure() as measurement:
+                for _ in range(ITERATION_COUNT):
+                    list(repository.iter_stored_block_bodies(min_number=1, limit=page_size))
+
+            durations.append(measurement.duration)
+
+        database_duration, archive_duration = durations
+        rows.append((
+            page_size,
+            f'{database_duration / ITERATION_COUNT * 1000:.3f}',
+            f'{archive_duration / ITERATION_COUNT * 1000:.3f}',
+            f'{database_duration / archive_duration:.1f}x',
+        ))
+
+    report(
+        f'Block page reads (average of {ITERATION_COUNT})',
+        ('page size', 'database, ms', 'archive, ms', 'speedup'),
+        rows,
+    )
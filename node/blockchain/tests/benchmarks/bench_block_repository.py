@@ -0,0 +1,62 @@
+"""
+Duration of block reads with ORM (djongo SQL translation) versus raw pymongo queries of `BlockRepository`.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_block_repository.py`
+"""
+import pytest
+
+from node.blockchain.models import Block
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.tests.benchmarks.base import measure, report
+
+ITERATION_COUNT = 200
+PAGE_SIZE = 20
+
+
+@pytest.mark.usefixtures('bloated_blockchain')
+def test_block_reads():
+    repository = BlockRepository()
+    last_block_number = repository.get_last_block_number()
+    assert last_block_number
+
+    cases = (
+        (
+            'last block',
+            lambda: Block.objects.order_by('-_id').first(),
+            repository.get_last_block,
+        ),
+        (
+            'next block number',
+            lambda: Block.objects.order_by('-_id').values('_id').first(),
+            repository.get_next_block_number,
+        ),
+        (
+            'block by number',
+            lambda: Block.objects.get_or_none(_id=last_block_number // 2),
+            lambda: repository.get_block_by_number(last_block_number // 2),
+        ),
+        (
+            f'{PAGE_SIZE} block bodies',
+            lambda: [block.body for block in Block.objects.filter(_id__gte=1).order_by('_id')[:PAGE_SIZE]],
+            lambda: repository.get_block_bodies(min_number=1, limit=PAGE_SIZE),
+        ),
+    )
+
+    rows = []
+    for title, orm_read, repository_read in cases:
+        with measure() as orm:
+            for _ in range(ITERATION_COUNT):
+                orm_read()
+
+        with measure() as raw:
+            for _ in range(ITERATION_COUNT):
+                repository_read()
+
+        rows.append((
+            title,
+            f'{orm.duration / ITERATION_COUNT * 1000:.3f}',
+            f'{raw.duration / ITERATION_COUNT * 1000:.3f}',
+            f'{orm.duration / raw.duration:.1f}x',
+        ))
+
+    report(f'Block reads (average of {ITERATION_COUNT})', ('read', 'ORM, ms', 'repository, ms', 'speedup'), rows)
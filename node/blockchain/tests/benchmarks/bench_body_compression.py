@@ -0,0 +1,123 @@
+"""
+Storage size and read throughput of block bodies stored in each `BodyFormat` versus uncompressed JSON.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_body_compression.py`
+"""
+import importlib.util
+import json
+import time
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from node.blockchain.models import Block
+from node.blockchain.tests.benchmarks.base import measure, report
+from node.blockchain.utils.compression import BodyFormat, compress_body, decompress_body, iter_body_chunks
+from node.core.database import get_collection, get_session
+
+ITERATION_COUNT = 20
+GENESIS_ACCOUNT_COUNT = 10_000
+
+
+def get_formats():
+    formats = [None, BodyFormat.ZLIB]
+    if importlib.util.find_spec('zstandard'):
+        formats.append(BodyFormat.ZSTD)
+
+    return formats
+
+
+def get_format_name(body_format):
+    return 'none' if body_format is None else body_format.name.lower()
+
+
+def make_genesis_like_body():
+    accounts = {
+        f'{index:064x}': {
+            'account_lock': f'{index:064x}',
+            'balance': index + 1,
+            'node': None
+        } for index in range(GENESIS_ACCOUNT_COUNT)
+    }
+    message = {'number': 0, 'type': 0, 'update': {'accounts': accounts, 'schedule': {'0': '0' * 64}}}
+    return json.dumps({'message': message, 'signature': '0' * 128, 'signer': '0' * 64}, separators=(',', ':'))
+
+
+@pytest.mark.usefixtures('bloated_blockchain')
+def test_body_compression():
+    bodies = [block.body for block in Block.objects.order_by('_id')]
+    cases = (('blockchain blocks', bodies),
+             (f'genesis with {GENESIS_ACCOUNT_COUNT} accounts', [make_genesis_like_body()]))
+
+    rows = []
+    for title, case_bodies in cases:
+        size = sum(len(body) for body in case_bodies)
+        for body_format in get_formats():
+            start = time.perf_counter()
+            stored_bodies = [compress_body(body, body_format) for body in case_bodies]
+            compress_duration = time.perf_counter() - start
+            stored_size = sum(len(body) for body in stored_bodies)
+
+            start = time.perf_counter()
+            for _ in range(ITERATION_COUNT):
+                for body in stored_bodies:
+                    decompress_body(body)
+            decompress_duration = (time.perf_counter() - start) / ITERATION_COUNT
+
+            start = time.perf_counter()
+            for _ in range(ITERATION_COUNT):
+                for body in stored_bodies:
+                    for _ in iter_body_chunks(body):
+                        pass
+            stream_duration = (time.perf_counter() - start) / ITERATION_COUNT
+
+            rows.append((
+                title,
+                get_format_name(body_format),
+                stored_size,
+                f'{stored_size / size:.2f}',
+                f'{compress_duration * 1000:.3f}',
+                f'{size / decompress_duration / 1024 / 1024:.1f}',
+                f'{size / stream_duration / 1024 / 1024:.1f}',
+            ))
+
+    report(
+        'Body storage (throughputs are in MB of JSON per second)',
+        ('bodies', 'format', 'stored bytes', 'ratio', 'compress, ms', 'decompress', 'stream'),
+        rows,
+    )
+
+
+@pytest.mark.usefixtures('bloated_blockchain')
+def test_block_reads_by_body_format():
+    repository = Block.objects.repository
+    collection = get_collection(Block)
+
+    rows = []
+    for body_format in get_formats():
+        call_command('compress_bodies', format=get_format_name(body_format), stdout=StringIO())
+        stored_size = sum(
+            len(document['body']) for document in collection.find({}, {'body': 1}, session=get_session())
+        )
+
+        with measure() as stored_reads:
+            for _ in range(ITERATION_COUNT):
+                list(repository.iter_stored_block_bodies())
+
+        with measure() as decompressed_reads:
+            for _ in range(ITERATION_COUNT):
+                repository.get_block_bodies()
+
+        rows.append((
+            get_format_name(body_format),
+            stored_size,
+            f'{stored_reads.duration / ITERATION_COUNT * 1000:.3f}',
+            f'{decompressed_reads.duration / ITERATION_COUNT * 1000:.3f}',
+        ))
+
+    report(
+        f'Reading all blocks from the database (average of {ITERATION_COUNT})',
+        ('format', 'stored bytes', 'stored, ms', 'decompressed, ms'),
+        rows,
+    )
@@ -0,0 +1,45 @@
+"""
+Duration of blockchain clearing by deleting documents in a transaction versus dropping collections.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_clear_blockchain.py`
+"""
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import AccountState
+from node.blockchain.tests.benchmarks.base import measure, report
+from node.core.database import bulk_upsert
+
+ACCOUNT_COUNTS = (1000, 10_000, 50_000)
+ACCOUNT_LOCK = '0' * 64
+
+
+def make_accounts(count):
+    updates = {f'{number:064x}': dict(balance=number, account_lock=ACCOUNT_LOCK) for number in range(count)}
+    with transaction.atomic():
+        bulk_upsert(AccountState, updates)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_clear_blockchain():
+    facade = BlockchainFacade.get_instance()
+    rows = []
+    for account_count in ACCOUNT_COUNTS:
+        make_accounts(account_count)
+        with measure() as delete_measurement:
+            with transaction.atomic():
+                facade.clear()
+
+        make_accounts(account_count)
+        with measure() as drop_measurement:
+            facade.fast_clear()
+
+        rows.append((
+            account_count,
+            f'{delete_measurement.duration * 1000:.1f}',
+            f'{drop_measurement.duration * 1000:.1f}',
+            f'{delete_measurement.duration / drop_measurement.duration:.1f}x',
+        ))
+
+    report('Blockchain clearing', ('accounts', 'delete, ms', 'drop, ms', 'speedup'), rows)
@@ -0,0 +1,49 @@
+"""
+Latency of contended lock hand-off: time from lock release by one thread to lock acquisition by a waiting one.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_lock.py`
+"""
+import statistics
+import threading
+import time
+
+import pytest
+
+from node.blockchain.tests.benchmarks.base import report
+from node.blockchain.utils.lock import create_lock, delete_lock
+
+LOCK_NAME = 'benchmark'
+ITERATION_COUNT = 50
+
+
+def measure_hand_off_seconds():
+    lease = create_lock(LOCK_NAME)
+    acquired_event = threading.Event()
+    results = {}
+
+    def wait_for_lock():
+        results['lease'] = create_lock(LOCK_NAME, timeout_seconds=5)
+        results['acquired_at'] = time.perf_counter()
+        acquired_event.set()
+
+    waiter = threading.Thread(target=wait_for_lock)
+    waiter.start()
+    time.sleep(0.02)  # let the waiter start waiting
+
+    released_at = time.perf_counter()
+    delete_lock(LOCK_NAME, lease.owner)
+    acquired_event.wait()
+    waiter.join()
+    delete_lock(LOCK_NAME, results['lease'].owner)
+    return results['acquired_at'] - released_at
+
+
+@pytest.mark.django_db
+def test_lock_hand_off():
+    durations = [measure_hand_off_seconds() * 1000 for _ in range(ITERATION_COUNT)]
+    row = (
+        f'{statistics.median(durations):.2f}',
+        f'{statistics.quantiles(durations, n=20)[-1]:.2f}',
+        f'{max(durations):.2f}',
+    )
+    report(f'Contended lock hand-off ({ITERATION_COUNT} iterations)', ('median, ms', 'p95, ms', 'max, ms'), [row])
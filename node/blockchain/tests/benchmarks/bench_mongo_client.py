@@ -0,0 +1,85 @@
+"""
+Connection count and latency of concurrent reads with per-thread MongoDB clients (previous behavior) versus
+single process-wide pooled client returned by `get_pymongo_client()`.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_mongo_client.py`
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from pymongo import MongoClient
+
+from node.blockchain.models import Block
+from node.blockchain.tests.benchmarks.base import report
+from node.core.database import get_pymongo_client
+
+THREAD_COUNT = 32
+READ_COUNT = 50
+
+
+def get_current_connection_count():
+    return get_pymongo_client().admin.command('serverStatus')['connections']['current']
+
+
+def run_reads(get_client):
+    database_name = connection.settings_dict['NAME']
+    collection_name = Block._meta.db_table
+    latencies = []
+    latencies_lock = threading.Lock()
+
+    def read(_):
+        collection = get_client()[database_name][collection_name]
+        thread_latencies = []
+        for _ in range(READ_COUNT):
+            start = time.perf_counter()
+            collection.find_one({}, {'_id': 1}, sort=[('_id', -1)])
+            thread_latencies.append(time.perf_counter() - start)
+
+        with latencies_lock:
+            latencies.extend(thread_latencies)
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        list(executor.map(read, range(THREAD_COUNT)))
+        connection_count = get_current_connection_count()
+
+    latencies.sort()
+    return connection_count, latencies
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('base_blockchain')
+def test_concurrent_reads():
+    thread_storage = threading.local()
+    thread_clients = []
+
+    def get_thread_local_client():
+        if (client := getattr(thread_storage, 'client', None)) is None:
+            thread_storage.client = client = MongoClient(**settings.DATABASES['default']['CLIENT'])
+            thread_clients.append(client)
+
+        return client
+
+    rows = []
+    baseline_connection_count = get_current_connection_count()
+    for title, get_client in (('thread-local clients', get_thread_local_client), ('shared client',
+                                                                                  get_pymongo_client)):
+        connection_count, latencies = run_reads(get_client)
+        rows.append((
+            title,
+            connection_count - baseline_connection_count,
+            f'{latencies[len(latencies) // 2] * 1000:.3f}',
+            f'{latencies[int(len(latencies) * 0.99)] * 1000:.3f}',
+        ))
+
+    for client in thread_clients:
+        client.close()
+
+    report(
+        f'Concurrent reads ({THREAD_COUNT} threads, {READ_COUNT} reads each)',
+        ('clients', 'extra connections', 'p50, ms', 'p99, ms'),
+        rows,
+    )
@@ -0,0 +1,46 @@
+"""
+Duration of serial signature verification versus parallel batch verification.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_signature_verification.py`
+"""
+from node.blockchain.tests.benchmarks.base import measure, report
+from node.core.utils.cryptography import generate_key_pair, generate_signature, is_signature_valid
+from node.core.utils.signature_verification import get_worker_count, verify_signatures
+
+BATCH_SIZES = (10, 100, 1000, 5000)
+SIGNER_COUNT = 20
+
+
+def make_items(count):
+    key_pairs = [generate_key_pair() for _ in range(SIGNER_COUNT)]
+    items = []
+    for number in range(count):
+        key_pair = key_pairs[number % SIGNER_COUNT]
+        message = f'{{"number":{number}}}'.encode()
+        items.append((key_pair.public, message, generate_signature(key_pair.private, message)))
+
+    return items
+
+
+def test_signature_verification():
+    rows = []
+    for batch_size in BATCH_SIZES:
+        items = make_items(batch_size)
+        with measure() as serial_measurement:
+            assert all([is_signature_valid(*item) for item in items])
+
+        with measure() as batch_measurement:
+            assert all(verify_signatures(items))
+
+        rows.append((
+            batch_size,
+            f'{serial_measurement.duration * 1000:.1f}',
+            f'{batch_measurement.duration * 1000:.1f}',
+            f'{serial_measurement.duration / batch_measurement.duration:.1f}x',
+        ))
+
+    report(
+        f'Signature verification ({get_worker_count()} worker(s))',
+        ('signatures', 'serial, ms', 'batch, ms', 'speedup'),
+        rows,
+    )
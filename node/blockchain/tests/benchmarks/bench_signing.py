@@ -0,0 +1,48 @@
+"""
+Signatures per second made with signing key decoded on every call versus node signer.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_signing.py`
+"""
+from nacl.signing import SigningKey as NaClSigningKey
+
+from node.blockchain.tests.benchmarks.base import measure, report
+from node.core.utils.cryptography import get_node_signer, get_signing_key
+from node.core.utils.misc import hex_to_bytes
+
+SIGNATURE_COUNT = 5000
+MESSAGE = b'{"message":{"number":1},"signer":"' + b'0' * 64 + b'"}'
+
+
+def sign_decoding_key(signing_key, message):
+    # How signatures were made before the signing key was cached
+    return NaClSigningKey(hex_to_bytes(signing_key)).sign(message).signature.hex()
+
+
+def test_signing():
+    signing_key = get_signing_key()
+    signer = get_node_signer()
+    messages = [MESSAGE] * SIGNATURE_COUNT
+
+    with measure() as decoding_measurement:
+        for message in messages:
+            sign_decoding_key(signing_key, message)
+
+    with measure() as sign_measurement:
+        for message in messages:
+            signer.sign(message)
+
+    with measure() as sign_many_measurement:
+        signer.sign_many(messages)
+
+    with measure() as identifier_measurement:
+        for _ in range(SIGNATURE_COUNT):
+            get_node_signer().identifier
+
+    measurements = (
+        ('decoding key on every call', decoding_measurement),
+        ('NodeSigner.sign()', sign_measurement),
+        ('NodeSigner.sign_many()', sign_many_measurement),
+        ('get_node_signer().identifier', identifier_measurement),
+    )
+    rows = [(name, f'{SIGNATURE_COUNT / measurement.duration:,.0f}') for name, measurement in measurements]
+    report('Node signing', ('method', 'calls per second'), rows)
@@ -0,0 +1,53 @@
+"""
+Duration of writing account states of a single block (like genesis block with alpha accounts) to the database.
+
+Run with `make benchmark` or `poetry run pytest -s node/blockchain/tests/benchmarks/bench_update_accounts.py`
+"""
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.inner_models import AccountState
+from node.blockchain.tests.benchmarks.base import measure, report
+
+ACCOUNT_COUNTS = (10_000, 100_000, 1_000_000)
+ORM_ACCOUNT_COUNTS = (10_000,)  # ORM is too slow for larger numbers
+
+
+def make_accounts(count):
+    return {f'{index:064x}': AccountState(balance=index + 1, account_lock=f'{index:064x}') for index in range(count)}
+
+
+def update_accounts(accounts):
+    # Each write is committed like a block is, so the benchmark is not bound by the lifetime of a single transaction
+    with transaction.atomic():
+        BlockchainFacade.get_instance().update_write_through_cache_accounts(accounts)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_accounts():
+    facade = BlockchainFacade.get_instance()
+
+    rows = []
+    for count in ACCOUNT_COUNTS:
+        accounts = make_accounts(count)
+        with measure() as bulk_insert:
+            update_accounts(accounts)
+        with measure() as bulk_update:
+            update_accounts(accounts)
+
+        if count in ORM_ACCOUNT_COUNTS:
+            with patch('node.blockchain.facade.is_mongo_connection', return_value=False):
+                with measure() as orm_update:
+                    update_accounts(accounts)
+            orm_duration = f'{orm_update.duration:.2f}'
+        else:
+            orm_duration = 'n/a'
+
+        rows.append((count, f'{bulk_insert.duration:.2f}', f'{bulk_update.duration:.2f}', orm_duration))
+        # Dropping collections is not limited by transaction lifetime unlike deleting a million documents
+        facade.fast_clear()
+
+    report('Account states update', ('accounts', 'bulk insert, s', 'bulk update, s', 'ORM update, s'), rows)
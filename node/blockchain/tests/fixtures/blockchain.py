@@ -1,4 +1,5 @@
 import pytest
+from django.db import transaction
 
 from node.blockchain.facade import BlockchainFacade
 from node.blockchain.tests.factories.node import make_node
@@ -23,6 +24,21 @@ def base_blockchain(genesis_block_message, primary_validator_key_pair, db):
     )
 
 
+@pytest.fixture
+def committed_blockchain(genesis_block_message, primary_validator_key_pair):
+    # For tests with `transaction=True` (blockchain is visible to other transactions)
+    with transaction.atomic():
+        BlockchainFacade.get_instance().add_block_from_block_message(
+            message=genesis_block_message,
+            signing_key=primary_validator_key_pair.private,
+            validate=False,
+        )
+
+    yield
+    with transaction.atomic():
+        BlockchainFacade.get_instance().clear()
+
+
 @pytest.fixture
 def rich_blockchain(
     base_blockchain, primary_validator_key_pair, confirmation_validator_key_pair, confirmation_validator_key_pair_2,
@@ -1,6 +1,7 @@
 import pytest
 from django.test import override_settings
 
+from node.blockchain.facade import BlockchainFacade
 from node.core.database import get_database
 
 
@@ -32,3 +33,11 @@ def clean_up_block_lock(lock_collection):
 def blockchain_test_settings(settings):
     with override_settings(LOCK_DEFAULT_TIMEOUT_SECONDS=0.001,):
         yield
+
+
+@pytest.fixture(autouse=True)
+def clean_up_blockchain_facade_instance():
+    # Blockchain facade holds in-memory cache, so we need a fresh instance for every test
+    BlockchainFacade.clear_instance_cache()
+    yield
+    BlockchainFacade.clear_instance_cache()
@@ -0,0 +1,177 @@
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.inner_models import AccountState
+from node.blockchain.models import AccountState as ORMAccountState
+from node.blockchain.tests.base import run_in_thread
+from node.blockchain.tests.factories.signed_change_request.coin_transfer import (
+    make_coin_transfer_signed_change_request
+)
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_account_state_is_read_from_memory(treasury_account_key_pair, django_assert_num_queries):
+    account_number = treasury_account_key_pair.public
+    account_state = ORMAccountState.objects.get(_id=account_number)
+
+    facade = BlockchainFacade.get_instance()
+    facade.get_next_block_number()  # load chain tip
+    with django_assert_num_queries(1):
+        assert facade.get_account_balance(account_number) == account_state.balance
+
+    with django_assert_num_queries(0):
+        assert facade.get_account_balance(account_number) == account_state.balance
+        assert facade.get_account_lock(account_number) == account_state.account_lock
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_account_state_of_missing_account_is_cached(django_assert_num_queries):
+    facade = BlockchainFacade.get_instance()
+    facade.get_next_block_number()  # load chain tip
+    with django_assert_num_queries(1):
+        assert facade.get_account_balance('0' * 64) == 0
+        assert facade.get_account_lock('0' * 64) == '0' * 64
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_account_state_cache_is_updated(treasury_account_key_pair, django_assert_num_queries):
+    account_number = treasury_account_key_pair.public
+    facade = BlockchainFacade.get_instance()
+    balance = facade.get_account_balance(account_number)
+
+    facade.update_write_through_cache_accounts({account_number: AccountState(balance=balance - 10)})
+    with django_assert_num_queries(0):
+        assert facade.get_account_balance(account_number) == balance - 10
+        assert facade.get_account_lock(account_number) == ORMAccountState.objects.get(_id=account_number).account_lock
+
+
+@pytest.fixture
+def cleanup_blockchain():
+    yield
+    with transaction.atomic():
+        BlockchainFacade.get_instance().clear()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_blockchain')
+def test_account_state_cache_is_invalidated_on_rollback(
+    genesis_block_message, primary_validator_key_pair, treasury_account_key_pair
+):
+
+    class TestError(Exception):
+        pass
+
+    account_number = treasury_account_key_pair.public
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_account_balance(account_number) == 0
+
+    try:
+        with transaction.atomic():
+            facade.add_block_from_block_message(
+                message=genesis_block_message,
+                signing_key=primary_validator_key_pair.private,
+                validate=False,
+            )
+            assert facade.get_account_balance(account_number) > 0
+            raise TestError
+    except TestError:
+        pass
+
+    assert facade.get_account_balance(account_number) == 0
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_get_account_balances(treasury_account_key_pair, primary_validator_key_pair, django_assert_num_queries):
+    facade = BlockchainFacade.get_instance()
+    facade.get_next_block_number()  # load chain tip
+    expected = {
+        treasury_account_key_pair.public: ORMAccountState.objects.get(_id=treasury_account_key_pair.public).balance,
+        primary_validator_key_pair.public: ORMAccountState.objects.get(_id=primary_validator_key_pair.public).balance,
+        '0' * 64: 0,
+    }
+
+    with django_assert_num_queries(1):
+        assert facade.get_account_balances(list(expected)) == expected
+
+    with django_assert_num_queries(0):
+        assert facade.get_account_balances(list(expected)) == expected
+        assert facade.get_account_balance('0' * 64) == 0
+
+
+def add_coin_transfer_block(sender_key_pair, primary_validator_key_pair):
+    with transaction.atomic():
+        BlockchainFacade.get_instance().add_block_from_signed_change_request(
+            make_coin_transfer_signed_change_request(sender_key_pair, '0' * 64, primary_validator_key_pair.public),
+            signing_key=primary_validator_key_pair.private,
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_account_state_cache_is_shared_by_transactions(treasury_account_key_pair, django_assert_num_queries):
+    account_number = treasury_account_key_pair.public
+    balance = ORMAccountState.objects.get(_id=account_number).balance
+
+    # We use a fresh instance to count cache hits and misses of this test only
+    facade = BlockchainFacade(signing_key=BlockchainFacade.get_instance().signing_key)
+    assert facade.get_account_balance(account_number) == balance
+    with django_assert_num_queries(0):
+        assert facade.get_account_balance(account_number) == balance
+        with transaction.atomic():
+            assert facade.get_account_balance(account_number) == balance
+
+    assert facade.get_account_state_cache_info() == {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 10_000}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_account_state_cache_size(settings, treasury_account_key_pair):
+    settings.ACCOUNT_STATE_CACHE_SIZE = 1
+    facade = BlockchainFacade(signing_key=BlockchainFacade.get_instance().signing_key)
+
+    facade.get_account_balance('0' * 64)
+    facade.get_account_balance(treasury_account_key_pair.public)
+    assert facade.get_account_state_cache_info()['size'] == 1
+
+    facade.get_account_balance('0' * 64)
+    assert facade.get_account_state_cache_info() == {'hits': 0, 'misses': 3, 'size': 1, 'maxsize': 1}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_account_state_read_from_outdated_snapshot_is_not_cached(
+    treasury_account_key_pair, primary_validator_key_pair
+):
+    account_number = treasury_account_key_pair.public
+    facade = BlockchainFacade.get_instance()
+    old_balance = ORMAccountState.objects.get(_id=account_number).balance
+
+    with transaction.atomic():
+        # Transaction snapshot is taken before the block is committed by the other thread
+        assert facade.get_next_block_number() == 1
+        run_in_thread(add_coin_transfer_block, treasury_account_key_pair, primary_validator_key_pair)
+        assert facade.get_account_balance(account_number) == old_balance
+
+    new_balance = ORMAccountState.objects.get(_id=account_number).balance
+    assert new_balance < old_balance
+    assert facade.get_next_block_number() == 2
+    assert facade.get_account_balance(account_number) == new_balance
+    assert run_in_thread(facade.get_account_balance, account_number) == new_balance
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_uncommitted_account_state_is_not_shared(treasury_account_key_pair, primary_validator_key_pair):
+    account_number = treasury_account_key_pair.public
+    facade = BlockchainFacade.get_instance()
+    old_balance = facade.get_account_balance(account_number)
+
+    with transaction.atomic():
+        add_coin_transfer_block(treasury_account_key_pair, primary_validator_key_pair)
+        new_balance = facade.get_account_balance(account_number)
+        assert new_balance < old_balance
+        assert run_in_thread(facade.get_account_balance, account_number) == old_balance
+
+    assert facade.get_account_balance(account_number) == new_balance
+    assert run_in_thread(facade.get_account_balance, account_number) == new_balance
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.mixins.crypto import HashableStringWrapper
+from node.blockchain.models import Block as ORMBlock
+from node.blockchain.tests.base import run_in_thread
+from node.blockchain.tests.factories.signed_change_request.node_declaration import (
+    make_node_declaration_signed_change_request
+)
+
+
+@pytest.mark.django_db
+def test_chain_tip_for_empty_blockchain():
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_chain_tip() is None
+    assert facade.get_next_block_number() == 0
+    assert facade.get_next_block_identifier() is None
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_chain_tip_is_read_from_memory():
+    last_block = ORMBlock.objects.get_last_block()
+    expected_identifier = HashableStringWrapper(last_block.body).make_hash()
+
+    # We use a fresh instance to make sure the cache is loaded from the database
+    facade = BlockchainFacade(signing_key=BlockchainFacade.get_instance().signing_key)
+    with patch.object(ORMBlock.objects, 'get_chain_tip', wraps=ORMBlock.objects.get_chain_tip) as get_chain_tip_mock:
+        assert facade.get_next_block_number() == last_block._id + 1
+        assert facade.get_next_block_number() == last_block._id + 1
+        assert facade.get_next_block_identifier() == expected_identifier
+
+    get_chain_tip_mock.assert_called_once_with()
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_chain_tip_is_updated_on_add_block(regular_node, regular_node_key_pair, primary_validator_key_pair):
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_next_block_number() == 1
+
+    block = facade.add_block_from_signed_change_request(
+        make_node_declaration_signed_change_request(regular_node, regular_node_key_pair),
+        signing_key=primary_validator_key_pair.private,
+    )
+    assert facade.get_next_block_number() == 2
+    assert facade.get_next_block_identifier() == block.make_hash()
+
+    # Make sure cached values are the same as the ones read from the database
+    facade.invalidate_cache()
+    assert facade.get_next_block_number() == 2
+    assert facade.get_next_block_identifier() == block.make_hash()
+
+
+@pytest.fixture
+def cleanup_blockchain():
+    yield
+    with transaction.atomic():
+        BlockchainFacade.get_instance().clear()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_blockchain')
+def test_chain_tip_is_invalidated_on_rollback(genesis_block_message, primary_validator_key_pair):
+
+    class TestError(Exception):
+        pass
+
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_next_block_number() == 0
+
+    try:
+        with transaction.atomic():
+            facade.add_block_from_block_message(
+                message=genesis_block_message,
+                signing_key=primary_validator_key_pair.private,
+                validate=False,
+            )
+            assert facade.get_next_block_number() == 1
+            raise TestError
+    except TestError:
+        pass
+
+    assert facade.get_next_block_number() == 0
+    assert facade.get_next_block_identifier() is None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_blockchain')
+def test_chain_tip_is_published_on_commit(genesis_block_message, primary_validator_key_pair):
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_chain_tip() is None
+
+    with transaction.atomic():
+        block = facade.add_block_from_block_message(
+            message=genesis_block_message,
+            signing_key=primary_validator_key_pair.private,
+            validate=False,
+        )
+        assert facade.get_next_block_number() == 1
+        # Other threads do not see uncommitted chain tip
+        assert run_in_thread(facade.get_chain_tip) is None
+
+    assert run_in_thread(facade.get_chain_tip) == (0, block.make_hash())
+    assert facade.get_chain_tip() == (0, block.make_hash())
@@ -0,0 +1,83 @@
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.inner_models import AccountState
+from node.blockchain.tests.base import run_in_thread
+
+
+@pytest.fixture
+def facade():
+    facade = BlockchainFacade.get_instance()
+    # Load chain tip and schedule to count confirmation validators related queries only
+    facade.get_next_block_number()
+    facade.get_schedule_snapshot()
+    return facade
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_confirmation_validators_are_cached(
+    facade, confirmation_validator_key_pair, confirmation_validator_key_pair_2, primary_validator_key_pair,
+    django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        assert facade.get_confirmation_validator_identifiers() == {
+            confirmation_validator_key_pair.public, confirmation_validator_key_pair_2.public
+        }
+
+    with django_assert_num_queries(0):
+        assert facade.get_minimum_consensus() == 2
+        assert facade.is_confirmation_validator(confirmation_validator_key_pair.public)
+        assert not facade.is_confirmation_validator(primary_validator_key_pair.public)
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_confirmation_validators_are_updated_on_schedule_change(
+    facade, confirmation_validator_key_pair, primary_validator_key_pair, regular_node, django_assert_num_queries
+):
+    assert facade.get_minimum_consensus() == 2
+
+    facade.update_write_through_cache_schedule({
+        '0': primary_validator_key_pair.public,
+        '10000': confirmation_validator_key_pair.public,
+        '20000': regular_node.identifier,
+    })
+    with django_assert_num_queries(1):
+        assert facade.get_confirmation_validator_identifiers() == {
+            confirmation_validator_key_pair.public, regular_node.identifier
+        }
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_confirmation_validators_are_updated_on_node_declaration(
+    facade, confirmation_validator_key_pair, regular_node, django_assert_num_queries
+):
+    assert facade.get_minimum_consensus() == 2
+
+    # Balance update does not affect confirmation validators
+    facade.update_write_through_cache_accounts({confirmation_validator_key_pair.public: AccountState(balance=1)})
+    with django_assert_num_queries(0):
+        assert facade.get_minimum_consensus() == 2
+
+    facade.update_write_through_cache_accounts({regular_node.identifier: AccountState(node=regular_node)})
+    with django_assert_num_queries(1):
+        assert facade.get_minimum_consensus() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_uncommitted_confirmation_validators_are_not_shared(primary_validator_key_pair, regular_node):
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_confirmation_validator_identifiers() == frozenset()
+
+    with transaction.atomic():
+        facade.update_write_through_cache_accounts({regular_node.identifier: AccountState(node=regular_node)})
+        facade.update_write_through_cache_schedule({
+            '0': primary_validator_key_pair.public,
+            '10000': regular_node.identifier,
+        })
+        assert facade.get_confirmation_validator_identifiers() == {regular_node.identifier}
+        assert run_in_thread(facade.get_confirmation_validator_identifiers) == frozenset()
+
+    assert facade.get_confirmation_validator_identifiers() == {regular_node.identifier}
+    assert run_in_thread(facade.get_confirmation_validator_identifiers) == {regular_node.identifier}
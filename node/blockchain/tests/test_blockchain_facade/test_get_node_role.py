@@ -42,4 +42,5 @@ def test_get_node_role_used_to_be_primary_validator(primary_validator_key_pair):
     assert block_number >= 0
     Schedule.objects.create(_id=block_number, node_identifier=node_identifier)
     Schedule.objects.create(_id=next_block_number, node_identifier=primary_validator_key_pair.public)
+    facade.invalidate_cache()
     assert facade.get_node_role() == NodeRole.REGULAR_NODE
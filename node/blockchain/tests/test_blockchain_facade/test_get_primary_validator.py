@@ -34,6 +34,7 @@ def test_get_primary_validator_exactly_next_block(primary_validator_node, regula
 
     Schedule.objects.create(_id=1, node_identifier=regular_node.identifier)
     AccountState.objects.create(_id=regular_node.identifier, node=regular_node.dict())
+    facade.invalidate_cache()
     assert facade.get_primary_validator() == regular_node
 
 
@@ -49,4 +50,5 @@ def test_get_primary_validator_with_queue(primary_validator_node, regular_node):
 
     Schedule.objects.create(_id=2, node_identifier=regular_node.identifier)
     AccountState.objects.create(_id=regular_node.identifier, node=regular_node.dict())
+    facade.invalidate_cache()
     assert facade.get_primary_validator() == primary_validator_node
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+
+from node.blockchain.facade import BlockchainFacade, BlockchainStateSnapshot
+from node.blockchain.tests.factories.signed_change_request.coin_transfer import (
+    make_coin_transfer_signed_change_request
+)
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_state_snapshot_memoizes_reads(treasury_account_key_pair, user_key_pair):
+    facade = BlockchainFacade.get_instance()
+    state_snapshot = BlockchainStateSnapshot(facade)
+    balance = facade.get_account_balance(treasury_account_key_pair.public)
+
+    with patch.object(facade, 'get_account_balance', wraps=facade.get_account_balance) as mock:
+        assert state_snapshot.get_account_balance(treasury_account_key_pair.public) == balance
+        assert state_snapshot.get_account_balance(treasury_account_key_pair.public) == balance
+        assert state_snapshot.get_account_balance(user_key_pair.public) == 0
+        assert state_snapshot.get_account_balance(user_key_pair.public) == 0
+
+    assert mock.call_count == 2
+    assert state_snapshot.read_count == 2
+    assert state_snapshot.signing_key == facade.signing_key  # not memoized attributes are proxied
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_add_block_reads_blockchain_state_once(
+    treasury_account_key_pair, user_key_pair, regular_node, primary_validator_key_pair
+):
+    facade = BlockchainFacade.get_instance()
+    request = make_coin_transfer_signed_change_request(
+        treasury_account_key_pair, user_key_pair.public, regular_node.identifier
+    )
+
+    with patch.object(facade, 'get_account_balances', wraps=facade.get_account_balances) as get_account_balances_mock:
+        with patch.object(facade, 'get_primary_validator', wraps=facade.get_primary_validator) as pv_mock:
+            facade.add_block_from_signed_change_request(request, signing_key=primary_validator_key_pair.private)
+
+    get_account_balances_mock.assert_called_once()
+    assert set(get_account_balances_mock.call_args.args[0]
+               ) == {treasury_account_key_pair.public, user_key_pair.public, regular_node.identifier}
+    assert pv_mock.call_count == 1
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_state_snapshot_memoizes_batch_reads(treasury_account_key_pair, user_key_pair):
+    facade = BlockchainFacade.get_instance()
+    state_snapshot = BlockchainStateSnapshot(facade)
+    balance = facade.get_account_balance(treasury_account_key_pair.public)
+
+    assert state_snapshot.get_account_balance(treasury_account_key_pair.public) == balance
+    with patch.object(facade, 'get_account_balances', wraps=facade.get_account_balances) as mock:
+        expected = {treasury_account_key_pair.public: balance, user_key_pair.public: 0}
+        assert state_snapshot.get_account_balances([treasury_account_key_pair.public,
+                                                    user_key_pair.public]) == expected
+        assert state_snapshot.get_account_balances([treasury_account_key_pair.public,
+                                                    user_key_pair.public]) == expected
+        assert state_snapshot.get_account_balance(user_key_pair.public) == 0
+
+    mock.assert_called_once_with([user_key_pair.public])
+    assert state_snapshot.read_count == 2
@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
 import pytest
+from pymongo.collection import Collection
 
 from node.blockchain.facade import BlockchainFacade
+from node.blockchain.inner_models import AccountState
+from node.blockchain.models import AccountState as ORMAccountState
 from node.blockchain.models import Schedule
 from node.blockchain.types import AccountNumber
 from node.core.utils.types import non_negative_intstr
@@ -74,3 +79,87 @@ def test_add_delete_update(first_schedule, second_schedule):
         assert Schedule.objects.count() == len(schedule)
         assert Schedule.objects.filter(_id__in=schedule.keys()).count() == len(schedule)
         assert Schedule.objects.filter(node_identifier__in=schedule.values()).count() == len(schedule)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('is_mongo_connection', (True, False))
+@pytest.mark.parametrize(
+    'first_schedule, second_schedule', (
+        (SCHEDULE_0, SCHEDULE_EMPTY),
+        (SCHEDULE_0, SCHEDULE_0_WITH_PARTIALLY_UPDATED_NODE_IDENTIFIERS),
+        (SCHEDULE_100, SCHEDULE_130),
+        (SCHEDULE_0, SCHEDULE_500),
+    )
+)
+def test_update_schedule(first_schedule, second_schedule, is_mongo_connection):
+    blockchain_facade = BlockchainFacade.get_instance()
+
+    with patch('node.blockchain.facade.is_mongo_connection', return_value=is_mongo_connection):
+        for schedule in [first_schedule, second_schedule]:
+            blockchain_facade.update_write_through_cache_schedule(schedule)
+            assert {item._id: item.node_identifier for item in Schedule.objects.all()
+                    } == {int(block_number): node_identifier for block_number, node_identifier in schedule.items()}
+
+
+@pytest.mark.django_db
+def test_update_schedule_writes_changed_entries_only():
+    blockchain_facade = BlockchainFacade.get_instance()
+    blockchain_facade.update_write_through_cache_schedule(SCHEDULE_0)
+
+    with patch('node.blockchain.facade.bulk_upsert') as bulk_upsert_mock:
+        blockchain_facade.update_write_through_cache_schedule(SCHEDULE_0)
+    bulk_upsert_mock.assert_not_called()
+
+    with patch('node.blockchain.facade.bulk_upsert') as bulk_upsert_mock:
+        blockchain_facade.update_write_through_cache_schedule(SCHEDULE_130)
+    bulk_upsert_mock.assert_called_once_with(
+        Schedule,
+        {
+            130: {
+                'node_identifier': '1' * 64
+            },
+            300: {
+                'node_identifier': '3' * 64
+            }
+        },
+        delete_pks={0, 100},
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('is_mongo_connection', (True, False))
+def test_update_accounts(is_mongo_connection, regular_node):
+    ORMAccountState.objects.create(_id='1' * 64, balance=10, account_lock='1' * 64)
+    ORMAccountState.objects.create(_id='2' * 64, balance=20, account_lock='2' * 64)
+
+    accounts = {
+        '1' * 64: AccountState(balance=11),
+        '2' * 64: AccountState(balance=21, account_lock='a' * 64),
+        '3' * 64: AccountState(balance=30),
+        regular_node.identifier: AccountState(account_lock='b' * 64, node=regular_node),
+    }
+    with patch('node.blockchain.facade.is_mongo_connection', return_value=is_mongo_connection):
+        BlockchainFacade.get_instance().update_write_through_cache_accounts(accounts)
+
+    assert {
+        account_state._id: (account_state.balance, account_state.account_lock, account_state.node)
+        for account_state in ORMAccountState.objects.all()
+    } == {
+        '1' * 64: (11, '1' * 64, None),
+        '2' * 64: (21, 'a' * 64, None),
+        '3' * 64: (30, '', None),
+        regular_node.identifier: (0, 'b' * 64, regular_node.dict()),
+    }
+
+
+@pytest.mark.django_db
+def test_update_accounts_writes_in_chunks(settings):
+    settings.BULK_WRITE_CHUNK_SIZE = 2
+    accounts = {f'{index:064x}': AccountState(balance=index + 1) for index in range(5)}
+
+    with patch('pymongo.collection.Collection.bulk_write', autospec=True, side_effect=Collection.bulk_write) as mock:
+        BlockchainFacade.get_instance().update_write_through_cache_accounts(accounts)
+
+    assert [len(call.args[1]) for call in mock.call_args_list] == [2, 2, 1]
+    balances = dict(ORMAccountState.objects.filter(_id__in=accounts).values_list('_id', 'balance'))
+    assert balances == {account_number: account_state.balance for account_number, account_state in accounts.items()}
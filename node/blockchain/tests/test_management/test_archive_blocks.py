@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import Block
+from node.blockchain.repositories import BlockRepository
+from node.core.database import get_collection, get_session
+
+
+@pytest.fixture
+def block_archive_settings(settings, tmp_path):
+    settings.BLOCK_ARCHIVE_PATH = str(tmp_path / 'archive')
+    settings.BLOCK_ARCHIVE_SEGMENT_SIZE = 4
+
+
+@pytest.mark.usefixtures('bloated_blockchain', 'block_archive_settings')
+def test_archive_blocks(api_client, tmp_path):
+    expected_bodies = BlockRepository().get_block_bodies()
+    block_count = len(expected_bodies)
+    assert block_count > 10
+
+    out = StringIO()
+    call_command('archive_blocks', keep=5, batch_size=3, stdout=out)
+    assert f'Blocks up to block number {block_count - 6} are archived' in out.getvalue()
+    assert f'Deleted {block_count - 5} archived block(s) from the database' in out.getvalue()
+
+    repository = BlockRepository()
+    assert repository.archive.get_next_block_number() == block_count - 5
+    assert sorted(get_collection(Block).distinct('_id',
+                                                 session=get_session())) == list(range(block_count - 5, block_count))
+
+    # Blocks are read from both archive and database
+    assert repository.get_block_bodies() == expected_bodies
+    assert repository.get_block_bodies(min_number=3, max_number=block_count - 3) == expected_bodies[3:-2]
+    assert repository.get_block_bodies(min_number=1, offset=2, limit=block_count) == expected_bodies[3:]
+    assert repository.get_block_bodies(offset=block_count - 7, limit=4) == expected_bodies[-7:-3]
+    assert [block._id for block in repository.get_blocks(limit=3)] == [0, 1, 2]
+
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_block_by_number(1).json() == expected_bodies[1]
+    assert facade.get_block_hash(1) == Block(body=expected_bodies[1]).make_hash()
+    assert facade.get_next_block_number() == block_count
+
+    response = api_client.get('/api/blocks/?limit=100')
+    assert response.status_code == 200
+    assert response.json() == {'results': [json.loads(body) for body in expected_bodies]}
+
+    response = api_client.get('/api/blocks/2/')
+    assert response.status_code == 200
+    assert response.json() == json.loads(expected_bodies[2])
+
+    output_path = tmp_path / 'blocks.jsonl'
+    call_command('export_blocks', output=str(output_path), stdout=StringIO())
+    assert output_path.read_text().splitlines() == expected_bodies
+
+    # Nothing to archive
+    out = StringIO()
+    call_command('archive_blocks', keep=5, stdout=out)
+    assert 'Deleted 0 archived block(s) from the database' in out.getvalue()
+
+    with transaction.atomic():
+        facade.clear()
+
+    assert BlockRepository().archive.get_next_block_number() is None
+
+
+@pytest.mark.usefixtures('rich_blockchain', 'block_archive_settings')
+def test_archive_blocks_without_deletion():
+    block_count = Block.objects.count()
+    call_command('archive_blocks', keep=1, no_delete=True, stdout=StringIO())
+    assert Block.objects.count() == block_count
+    assert BlockRepository().archive.get_next_block_number() == block_count - 1
+
+
+@pytest.mark.usefixtures('bloated_blockchain', 'block_archive_settings')
+def test_archive_blocks_of_blockchain_not_starting_with_genesis_block():
+    expected_bodies = BlockRepository().get_block_bodies()
+    block_count = len(expected_bodies)
+    # Blockchain bootstrapped from a checkpoint does not have the first blocks
+    get_collection(Block).delete_many({'_id': {'$lt': 3}}, session=get_session())
+
+    out = StringIO()
+    call_command('archive_blocks', keep=2, batch_size=3, stdout=out)
+    assert f'Deleted {block_count - 5} archived block(s) from the database' in out.getvalue()
+
+    repository = BlockRepository()
+    assert repository.archive.get_first_block_number() == 3
+    assert repository.archive.get_next_block_number() == block_count - 2
+    assert repository.get_block_bodies() == expected_bodies[3:]
+    assert repository.get_block_bodies(offset=1, limit=2) == expected_bodies[4:6]
+    assert [block._id for block in repository.get_blocks(limit=2)] == [3, 4]
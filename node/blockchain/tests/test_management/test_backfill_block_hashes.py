@@ -0,0 +1,34 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.mixins.crypto import HashableStringWrapper
+from node.blockchain.models import Block
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_backfill_block_hashes():
+    expected_hashes = {block._id: block.hash for block in Block.objects.all()}
+    assert all(expected_hashes.values())
+
+    Block.objects.filter(_id__in=(0, 2, 3)).update(hash=None)
+    assert Block.objects.filter(hash__isnull=True).count() == 3
+
+    out = StringIO()
+    call_command('backfill_block_hashes', batch_size=2, stdout=out)
+    assert 'Filled in 3 block hash(es)' in out.getvalue()
+    assert not Block.objects.filter(hash__isnull=True).exists()
+    assert {block._id: block.hash for block in Block.objects.all()} == expected_hashes
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_block_hash_is_stored_on_add_block():
+    facade = BlockchainFacade.get_instance()
+    for block in Block.objects.all():
+        assert block.hash == HashableStringWrapper(block.body).make_hash()
+        assert block.hash == block.get_block().make_hash()
+        assert facade.get_block_hash(block._id) == block.hash
+
+    assert facade.get_block_hash(facade.get_next_block_number()) is None
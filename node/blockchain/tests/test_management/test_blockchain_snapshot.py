@@ -0,0 +1,87 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import AccountState, Block, Schedule
+from node.blockchain.utils.snapshot import delete_snapshot, get_snapshot_names
+from node.core.database import get_collection
+
+
+@pytest.fixture
+def committed_blockchain(genesis_block_message, primary_validator_key_pair):
+    facade = BlockchainFacade.get_instance()
+    with transaction.atomic():
+        facade.add_block_from_block_message(
+            message=genesis_block_message,
+            signing_key=primary_validator_key_pair.private,
+            validate=False,
+        )
+
+    yield
+
+    for name in get_snapshot_names():
+        delete_snapshot(name)
+
+    with transaction.atomic():
+        facade.clear()
+
+
+def get_index_keys(model):
+    return sorted(tuple(info['key']) for info in get_collection(model).index_information().values())
+
+
+def get_counts():
+    return {model: get_collection(model).count_documents({}) for model in (Block, AccountState, Schedule)}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_clear_blockchain_drops_collections():
+    models = (Block, AccountState, Schedule)
+    expected_index_keys = {model: get_index_keys(model) for model in models}
+    assert all(get_counts().values())
+
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_next_block_number() == 1
+
+    call_command('clear_blockchain')
+    assert set(get_counts().values()) == {0}
+    assert {model: get_index_keys(model) for model in models} == expected_index_keys
+    assert facade.get_next_block_number() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_take_and_restore_snapshot():
+    expected_counts = get_counts()
+    expected_last_block_body = Block.objects.get_last_block().body
+    expected_index_keys = get_index_keys(Block)
+
+    out = StringIO()
+    call_command('blockchain_snapshot', 'take', 'before-clear', stdout=out)
+    assert "Snapshot 'before-clear' is taken" in out.getvalue()
+
+    call_command('clear_blockchain')
+    facade = BlockchainFacade.get_instance()
+    assert facade.get_next_block_number() == 0
+
+    out = StringIO()
+    call_command('blockchain_snapshot', 'list', stdout=out)
+    assert out.getvalue().split() == ['before-clear']
+
+    call_command('blockchain_snapshot', 'restore', 'before-clear', stdout=StringIO())
+    assert get_counts() == expected_counts
+    assert Block.objects.get_last_block().body == expected_last_block_body
+    assert get_index_keys(Block) == expected_index_keys
+    assert facade.get_next_block_number() == 1
+
+    call_command('blockchain_snapshot', 'delete', 'before-clear', stdout=StringIO())
+    assert get_snapshot_names() == []
+
+    out = StringIO()
+    with pytest.raises(SystemExit):
+        call_command('blockchain_snapshot', 'restore', 'before-clear', stdout=out)
+    assert "Snapshot 'before-clear' is not found" in out.getvalue()
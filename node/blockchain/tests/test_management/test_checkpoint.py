@@ -0,0 +1,168 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import AccountState, Block, Schedule
+from node.blockchain.tests.factories.signed_change_request.coin_transfer import (
+    make_coin_transfer_signed_change_request
+)
+from node.blockchain.utils.checkpoint import make_checkpoint, make_checkpoint_hash, read_checkpoint, write_checkpoint
+from node.core.exceptions import BlockchainIsNotLockedError, CheckpointError, DatabaseTransactionError
+
+
+def get_account_states():
+    values = AccountState.objects.values_list('_id', 'balance', 'account_lock', 'node')
+    return {account_number: tuple(account_state) for account_number, *account_state in values}
+
+
+def add_coin_transfer_block(sender_key_pair, primary_validator_key_pair, recipient, node):
+    with transaction.atomic():
+        BlockchainFacade.get_instance().add_block_from_signed_change_request(
+            signed_change_request=make_coin_transfer_signed_change_request(sender_key_pair, recipient, node),
+            signing_key=primary_validator_key_pair.private,
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_export_and_import_checkpoint(
+    tmp_path, primary_validator_key_pair, treasury_account_key_pair, regular_node, self_node
+):
+    add_coin_transfer_block(
+        treasury_account_key_pair, primary_validator_key_pair, regular_node.identifier, self_node.identifier
+    )
+    facade = BlockchainFacade.get_instance()
+    last_block = facade.get_last_block()
+    expected_account_states = get_account_states()
+    expected_schedule = dict(Schedule.objects.values_list('_id', 'node_identifier'))
+
+    path = tmp_path / 'checkpoint.json.gz'
+    out = StringIO()
+    call_command('export_checkpoint', str(path), stdout=out)
+    assert f'Checkpoint at block number {last_block._id}' in out.getvalue()
+
+    checkpoint = read_checkpoint(path)
+    assert checkpoint['block_number'] == last_block._id
+    assert checkpoint['block_hash'] == last_block.get_hash()
+
+    call_command('clear_blockchain')
+    assert not facade.has_blocks()
+
+    out = StringIO()
+    call_command('import_checkpoint', str(path), expected_hash=checkpoint['hash'], stdout=out)
+    assert f'Loaded checkpoint at block number {last_block._id}' in out.getvalue()
+
+    assert list(Block.objects.values_list('_id', flat=True)) == [last_block._id]
+    assert get_account_states() == expected_account_states
+    assert dict(Schedule.objects.values_list('_id', 'node_identifier')) == expected_schedule
+    assert facade.get_chain_tip() == (last_block._id, last_block.get_hash())
+
+    # Blockchain continues from the checkpoint block
+    add_coin_transfer_block(
+        treasury_account_key_pair, primary_validator_key_pair, regular_node.identifier, self_node.identifier
+    )
+    assert facade.get_next_block_number() == last_block._id + 2
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_import_checkpoint_validates_checkpoint(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    call_command('export_checkpoint', str(path), stdout=StringIO())
+    checkpoint = read_checkpoint(path)
+    call_command('clear_blockchain')
+
+    # Valid hash does not prove the checkpoint is genuine, so it must be obtained from a trusted source
+    with pytest.raises(CommandError, match='--expected-hash'):
+        call_command('import_checkpoint', str(path), stdout=StringIO())
+
+    with pytest.raises(CheckpointError, match='Expected checkpoint hash is required'):
+        BlockchainFacade.get_instance().load_checkpoint(checkpoint, None)
+
+    tampered_checkpoint = dict(checkpoint, accounts=dict(checkpoint['accounts']))
+    account_number = next(iter(tampered_checkpoint['accounts']))
+    tampered_checkpoint['accounts'][account_number] = dict(tampered_checkpoint['accounts'][account_number], balance=1)
+    write_checkpoint(tampered_checkpoint, path)
+    out = StringIO()
+    with pytest.raises(SystemExit):
+        call_command('import_checkpoint', str(path), expected_hash=checkpoint['hash'], stdout=out)
+    assert 'Checkpoint hash is not valid' in out.getvalue()
+
+    tampered_checkpoint['hash'] = make_checkpoint_hash(tampered_checkpoint)
+    write_checkpoint(tampered_checkpoint, path)
+    out = StringIO()
+    with pytest.raises(SystemExit):
+        call_command('import_checkpoint', str(path), expected_hash=checkpoint['hash'], stdout=out)
+    assert f'Expected checkpoint hash {checkpoint["hash"]}' in out.getvalue()
+    assert not BlockchainFacade.get_instance().has_blocks()
+
+    # Checkpoint cannot be loaded on top of existing blocks
+    write_checkpoint(checkpoint, path)
+    call_command('import_checkpoint', str(path), expected_hash=checkpoint['hash'], stdout=StringIO())
+    out = StringIO()
+    with pytest.raises(SystemExit):
+        call_command('import_checkpoint', str(path), expected_hash=checkpoint['hash'], stdout=out)
+    assert 'Checkpoint can only be loaded into empty blockchain' in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_interrupted_checkpoint_loading_leaves_blockchain_empty():
+    checkpoint = make_checkpoint()
+    expected_account_states = get_account_states()
+    call_command('clear_blockchain')
+
+    def take_over_before_block_is_written(name):
+        # Schedule is written right before the checkpoint block
+        if Schedule.objects.exists():
+            raise BlockchainIsNotLockedError
+
+    facade = BlockchainFacade.get_instance()
+    with patch('node.blockchain.facade.validate_fencing_token', side_effect=take_over_before_block_is_written):
+        with pytest.raises(BlockchainIsNotLockedError):
+            facade.load_checkpoint(checkpoint, checkpoint['hash'])
+
+    # Account states are written, but the checkpoint block is not, so the checkpoint can be loaded again
+    assert get_account_states() == expected_account_states
+    assert not facade.has_blocks()
+
+    facade.load_checkpoint(checkpoint, checkpoint['hash'])
+    assert get_account_states() == expected_account_states
+    assert facade.get_next_block_number() == checkpoint['block_number'] + 1
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_checkpoint_cannot_be_loaded_in_transaction():
+    checkpoint = make_checkpoint()
+    with pytest.raises(DatabaseTransactionError, match='Checkpoint cannot be loaded in a transaction'):
+        BlockchainFacade.get_instance().load_checkpoint(checkpoint, checkpoint['hash'])
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_checkpoint_is_made_periodically(
+    settings, tmp_path, primary_validator_key_pair, treasury_account_key_pair, regular_node, self_node
+):
+    facade = BlockchainFacade.get_instance()
+    next_block_number = facade.get_next_block_number()
+    settings.CHECKPOINT_PATH = str(tmp_path)
+    settings.CHECKPOINT_INTERVAL = next_block_number
+
+    facade.add_block_from_signed_change_request(
+        signed_change_request=make_coin_transfer_signed_change_request(
+            treasury_account_key_pair, regular_node.identifier, self_node.identifier
+        ),
+        signing_key=primary_validator_key_pair.private,
+    )
+
+    paths = list(tmp_path.iterdir())
+    assert [path.name for path in paths] == [f'checkpoint-{next_block_number:020d}.json.gz']
+    checkpoint = read_checkpoint(paths[0])
+    assert checkpoint['block_number'] == next_block_number
+    assert checkpoint['accounts'] == {
+        account_number: dict(zip(('balance', 'account_lock', 'node'), account_state))
+        for account_number, account_state in get_account_states().items()
+    }
@@ -0,0 +1,62 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import Block, BlockConfirmation, PendingBlock
+from node.blockchain.utils.compression import BodyFormat, get_body_format
+from node.core.database import get_collection, get_session
+
+
+def get_stored_body_formats(model):
+    return {
+        document['_id']: get_body_format(document['body'])
+        for document in get_collection(model).find(session=get_session())
+    }
+
+
+@pytest.mark.usefixtures('rich_blockchain', 'pending_block_confirmations')
+def test_compress_bodies():
+    models = (Block, PendingBlock, BlockConfirmation)
+    expected_bodies = {model: dict(model.objects.values_list('_id', 'body')) for model in models}
+    assert all(expected_bodies.values())
+    assert set(get_stored_body_formats(Block).values()) == {None}
+
+    out = StringIO()
+    call_command('compress_bodies', format='zlib', batch_size=2, stdout=out)
+    assert f'Converted {Block.objects.count()} Block bod(y/ies)' in out.getvalue()
+    for model in models:
+        assert set(get_stored_body_formats(model).values()) == {BodyFormat.ZLIB}
+        assert dict(model.objects.values_list('_id', 'body')) == expected_bodies[model]
+
+    blocks = Block.objects.repository.get_blocks()
+    assert [block.body for block in blocks] == list(expected_bodies[Block].values())
+    assert all(block.make_hash() == block.hash for block in blocks)
+
+    # Idempotency
+    out = StringIO()
+    call_command('compress_bodies', format='zlib', stdout=out)
+    assert 'Converted 0 Block bod(y/ies)' in out.getvalue()
+
+    call_command('compress_bodies', format='none', stdout=StringIO())
+    for model in models:
+        assert set(get_stored_body_formats(model).values()) == {None}
+        assert dict(model.objects.values_list('_id', 'body')) == expected_bodies[model]
+
+
+@pytest.mark.django_db
+def test_new_bodies_are_stored_compressed(settings, node_declaration_block_message, primary_validator_key_pair):
+    settings.BODY_COMPRESSION = 'zlib'
+    block = BlockchainFacade.get_instance().add_block_from_block_message(
+        message=node_declaration_block_message,
+        signing_key=primary_validator_key_pair.private,
+        validate=False,
+    )
+    block_number = block.get_block_number()
+
+    assert get_stored_body_formats(Block)[block_number] == BodyFormat.ZLIB
+    orm_block = Block.objects.get(_id=block_number)
+    assert orm_block.body == block.json()
+    assert orm_block.get_block() == block
+    assert Block.objects.get_block_by_number(block_number).body == block.json()
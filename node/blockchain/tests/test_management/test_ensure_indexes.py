@@ -0,0 +1,86 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from node.blockchain.indexes import HOT_QUERIES, INDEXES
+from node.blockchain.models import AccountState, BlockConfirmation
+from node.core.database import get_collection
+from node.core.indexes import HotQuery, Index, IndexStatus, delete_duplicates, ensure_index, is_collection_scan
+
+
+@pytest.mark.django_db
+def test_ensure_indexes():
+    out = StringIO()
+    call_command('ensure_indexes', stdout=out)
+    assert 'All hot queries are covered by indexes' in out.getvalue()
+
+    for model, indexes in INDEXES.items():
+        for index in indexes:
+            assert ensure_index(model, index, create=False) == IndexStatus.EXISTS
+
+    assert not any(is_collection_scan(query) for query in HOT_QUERIES)
+
+    # Idempotency
+    out = StringIO()
+    call_command('ensure_indexes', stdout=out)
+    assert 'index: created' not in out.getvalue()
+    assert 'All hot queries are covered by indexes' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_ensure_index_reports_missing_index_and_collection_scan():
+    index = Index(('balance',))
+    query = HotQuery('AccountState by balance', AccountState, {'balance': 0})
+    assert ensure_index(AccountState, index, create=False) == IndexStatus.MISSING
+    assert is_collection_scan(query)
+
+    try:
+        assert ensure_index(AccountState, index) == IndexStatus.CREATED
+        assert ensure_index(AccountState, index) == IndexStatus.EXISTS
+        assert not is_collection_scan(query)
+    finally:
+        get_collection(AccountState).drop_index(index.get_keys(AccountState))
+
+
+@pytest.mark.django_db
+def test_ensure_index_reports_conflict_with_non_unique_index():
+    assert ensure_index(AccountState, Index(('node',))) in (IndexStatus.CREATED, IndexStatus.EXISTS)
+    assert ensure_index(AccountState, Index(('node',), unique=True), create=False) == IndexStatus.CONFLICT
+
+
+@pytest.mark.django_db
+def test_ensure_indexes_fails_in_strict_mode_only():
+    with patch('node.blockchain.management.commands.ensure_indexes.ensure_index', return_value=IndexStatus.FAILED):
+        out = StringIO()
+        call_command('ensure_indexes', stdout=out)
+        assert 'index: failed' in out.getvalue()
+
+        with pytest.raises(SystemExit) as exc_info:
+            call_command('ensure_indexes', strict=True, stdout=StringIO())
+
+    assert exc_info.value.code == 1
+
+
+@pytest.mark.django_db
+def test_unique_index_is_created_once_duplicates_are_deleted():
+    index = Index(('hash', 'signer'), unique=True)
+    collection = get_collection(BlockConfirmation)
+    # Inserted in reverse `_id` order, so the newest document is not the one with the greatest `_id`
+    ids = [f'duplicate-{number}' for number in reversed(range(3))]
+    collection.insert_many([{
+        '_id': id_,
+        'number': number,
+        'hash': '0' * 128,
+        'signer': '0' * 64
+    } for number, id_ in enumerate(ids)])
+    try:
+        assert ensure_index(BlockConfirmation, index) == IndexStatus.FAILED
+        assert delete_duplicates(BlockConfirmation, index.fields) == ['duplicate-1', 'duplicate-2']
+        assert ensure_index(BlockConfirmation, index) == IndexStatus.CREATED
+        assert collection.distinct('_id', {'_id': {'$in': ids}}) == ['duplicate-0']
+    finally:
+        collection.delete_many({'_id': {'$in': ids}})
+        if ensure_index(BlockConfirmation, index, create=False) == IndexStatus.EXISTS:
+            collection.drop_index(index.get_keys(BlockConfirmation))
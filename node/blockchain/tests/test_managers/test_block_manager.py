@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from node.blockchain.models import Block
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.repositories.archive import get_block_archive
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+@pytest.mark.parametrize('is_mongo_connection', (True, False))
+def test_block_manager_reads(is_mongo_connection):
+    blocks = list(Block.objects.order_by('_id'))
+    assert blocks
+
+    with patch('node.blockchain.models.block.is_mongo_connection', return_value=is_mongo_connection):
+        assert (Block.objects.repository is not None) == is_mongo_connection
+
+        last_block = Block.objects.get_last_block()
+        assert (last_block._id, last_block.hash, last_block.body) == (blocks[-1]._id, blocks[-1].hash, blocks[-1].body)
+        assert Block.objects.get_next_block_number() == blocks[-1]._id + 1
+
+        block = Block.objects.get_block_by_number(1)
+        assert (block._id, block.hash, block.body) == (blocks[1]._id, blocks[1].hash, blocks[1].body)
+        assert Block.objects.get_block_by_number(blocks[-1]._id + 1) is None
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_block_repository_ranges():
+    blocks = list(Block.objects.order_by('_id'))
+    repository = BlockRepository()
+
+    assert [block._id for block in repository.get_blocks()] == [block._id for block in blocks]
+    assert [block._id for block in repository.get_blocks(min_number=1, max_number=3)] == [1, 2, 3]
+    assert [block._id for block in repository.get_blocks(offset=1, limit=2)] == [1, 2]
+    assert repository.get_blocks(limit=0) == []
+    assert repository.get_block_bodies(min_number=2, limit=1) == [blocks[2].body]
+    assert repository.get_block_body(0) == blocks[0].body
+    assert repository.get_block_body(len(blocks)) is None
+
+
+@pytest.mark.django_db
+def test_block_repository_empty_blockchain():
+    repository = BlockRepository()
+    assert repository.get_last_block() is None
+    assert repository.get_last_block_number() is None
+    assert repository.get_next_block_number() == 0
+    assert repository.get_blocks() == []
+
+
+@pytest.mark.django_db
+def test_block_manager_repository_is_cached(settings, tmp_path):
+    settings.BLOCK_ARCHIVE_PATH = None
+    repository = Block.objects.repository
+    assert Block.objects.repository is repository
+    assert repository.archive is None
+
+    # Cached repository follows block archive settings
+    settings.BLOCK_ARCHIVE_PATH = str(tmp_path / 'archive')
+    assert Block.objects.repository is repository
+    assert repository.archive is get_block_archive()
+    assert repository.archive.path == tmp_path / 'archive'
@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+import pytest
+
+from node.blockchain.repositories.archive import BlockArchive, get_block_archive
+
+SEGMENT_SIZE = 3
+
+
+def make_body(number):
+    return f'{{"message":{{"number":{number}}}}}'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return BlockArchive(tmp_path / 'archive', SEGMENT_SIZE)
+
+
+def test_empty_archive(archive):
+    assert archive.get_first_block_number() is None
+    assert archive.get_next_block_number() is None
+    assert not archive.has_block(0)
+    assert archive.get_body(0) is None
+    assert list(archive.iter_bodies(0, 10)) == []
+
+
+def test_append_and_read(archive):
+    archive.append(0, [make_body(number) for number in range(2)])
+    archive.append(2, [make_body(number) for number in range(2, 8)])
+    assert archive.get_next_block_number() == 8
+    assert archive.get_segment_first_block_numbers() == [0, 3, 6]
+
+    for number in range(8):
+        assert archive.has_block(number)
+        assert bytes(archive.get_body(number)) == make_body(number).encode()
+
+    assert not archive.has_block(8)
+    assert archive.get_body(8) is None
+    assert [bytes(body) for body in archive.iter_bodies(2, 6)
+            ] == [make_body(number).encode() for number in range(2, 7)]
+    assert [bytes(body) for body in archive.iter_bodies(5, 100)
+            ] == [make_body(number).encode() for number in range(5, 8)]
+
+    # Other instance (process) sees the same blocks
+    other_archive = BlockArchive(archive.path, SEGMENT_SIZE)
+    assert other_archive.get_next_block_number() == 8
+    assert bytes(other_archive.get_body(7)) == make_body(7).encode()
+
+    # Growing segment is remapped
+    assert bytes(archive.get_body(6)) == make_body(6).encode()
+    other_archive.append(8, [make_body(8)])
+    assert bytes(archive.get_body(8)) == make_body(8).encode()
+
+
+def test_append_out_of_order_is_rejected(archive):
+    archive.append(0, [make_body(0)])
+    with pytest.raises(ValueError, match='Expected block number 1 to be archived next'):
+        archive.append(2, [make_body(2)])
+
+
+def test_interrupted_append_is_discarded(archive):
+    archive.append(0, [make_body(0)])
+    segment = archive.get_segment(0)
+    with open(segment.data_path, 'ab') as data_file:
+        data_file.write(b'{"partially written')
+
+    assert archive.get_next_block_number() == 1
+    archive.append(1, [make_body(1)])
+    assert [bytes(body) for body in archive.iter_bodies(0, 1)] == [make_body(0).encode(), make_body(1).encode()]
+
+
+def test_interrupted_index_write_is_discarded(archive):
+    archive.append(0, [make_body(0)])
+    segment = archive.get_segment(0)
+    with open(segment.index_path, 'ab') as index_file:
+        index_file.write(b'\x01\x02')  # partial index entry
+
+    assert archive.get_next_block_number() == 1
+    archive.append(1, [make_body(1)])
+    assert [bytes(body) for body in archive.iter_bodies(0, 1)] == [make_body(0).encode(), make_body(1).encode()]
+
+
+def test_archive_starting_from_non_genesis_block(archive):
+    # Blockchain bootstrapped from a checkpoint
+    archive.append(10, [make_body(number) for number in range(10, 12)])
+    archive.append(12, [make_body(number) for number in range(12, 17)])
+    assert archive.get_first_block_number() == 10
+    assert archive.get_next_block_number() == 17
+    assert archive.get_segment_first_block_numbers() == [10, 13, 16]
+
+    assert not archive.has_block(9)
+    assert archive.get_body(9) is None
+    assert [bytes(body) for body in archive.iter_bodies(0, 100)
+            ] == [make_body(number).encode() for number in range(10, 17)]
+    assert [bytes(body) for body in archive.iter_bodies(12, 14)
+            ] == [make_body(number).encode() for number in range(12, 15)]
+
+    other_archive = BlockArchive(archive.path, SEGMENT_SIZE)
+    assert bytes(other_archive.get_body(16)) == make_body(16).encode()
+    with pytest.raises(ValueError, match='Expected block number 17 to be archived next'):
+        other_archive.append(0, [make_body(0)])
+
+
+def test_clear(archive):
+    archive.append(0, [make_body(number) for number in range(5)])
+    archive.clear()
+    assert archive.get_next_block_number() is None
+    archive.append(0, [make_body(0)])
+    assert bytes(archive.get_body(0)) == make_body(0).encode()
+
+
+def test_archive_replaced_by_other_process_is_remapped(archive):
+    archive.append(0, [make_body(number) for number in range(2)])
+    assert bytes(archive.get_body(1)) == make_body(1).encode()
+
+    other_archive = BlockArchive(archive.path, SEGMENT_SIZE)
+    other_archive.clear()
+    other_archive.append(0, [f'{{"replaced":{number}}}' for number in range(3)])
+
+    assert archive.get_next_block_number() == 3
+    assert bytes(archive.get_body(1)) == b'{"replaced":1}'
+
+
+def test_archive_directory_is_listed_on_change_only(archive):
+    archive.append(0, [make_body(number) for number in range(2)])
+    assert archive.get_next_block_number() == 2
+
+    list_directory = archive.get_segment_first_block_numbers
+    with patch.object(archive, 'get_segment_first_block_numbers', wraps=list_directory) as list_directory_mock:
+        assert archive.get_next_block_number() == 2
+        assert archive.has_block(1)
+        list_directory_mock.assert_not_called()
+
+        # New segment file changes the directory
+        archive.append(2, [make_body(number) for number in range(2, 4)])
+        assert archive.get_next_block_number() == 4
+        list_directory_mock.assert_called_once_with()
+
+
+def test_get_block_archive(settings, tmp_path):
+    settings.BLOCK_ARCHIVE_PATH = None
+    assert get_block_archive() is None
+
+    settings.BLOCK_ARCHIVE_PATH = str(tmp_path)
+    archive = get_block_archive()
+    assert archive.path == tmp_path
+    assert get_block_archive() is archive
@@ -1,6 +1,8 @@
 import json
+from io import StringIO
 
 import pytest
+from django.core.management import call_command
 
 from node.blockchain.models import Block
 from node.blockchain.types import Type
@@ -84,3 +86,35 @@ def test_retrieve_block(api_client):
     response = api_client.get('/api/blocks/1/')
     assert response.status_code == 200
     assert response.json() == json.loads(Block.objects.get(_id=1).body)
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_retrieve_last_block(api_client):
+    last_block = Block.objects.get_last_block()
+    response = api_client.get('/api/blocks/last/')
+    assert response.status_code == 200
+    assert response.json() == json.loads(last_block.body)
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+@pytest.mark.parametrize('block_id', ('1000', 'invalid'))
+def test_retrieve_not_existing_block(api_client, block_id):
+    response = api_client.get(f'/api/blocks/{block_id}/')
+    assert response.status_code == 404
+
+
+@pytest.mark.usefixtures('rich_blockchain')
+def test_read_compressed_blocks(api_client, settings):
+    expected_blocks = [json.loads(block.body) for block in Block.objects.order_by('_id')]
+    settings.BODY_COMPRESSION = 'zlib'
+    call_command('compress_bodies', stdout=StringIO())
+
+    response = api_client.get('/api/blocks/')
+    assert response.status_code == 200
+    assert response.streaming
+    assert json.loads(b''.join(response.streaming_content)) == {'results': expected_blocks}
+
+    response = api_client.get('/api/blocks/1/')
+    assert response.status_code == 200
+    assert response.streaming
+    assert json.loads(b''.join(response.streaming_content)) == expected_blocks[1]
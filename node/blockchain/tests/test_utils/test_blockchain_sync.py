@@ -1,13 +1,51 @@
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
 from node.blockchain.facade import BlockchainFacade
-from node.blockchain.inner_models import NodeDeclarationBlock
+from node.blockchain.inner_models import (
+    NodeDeclarationBlock, NodeDeclarationBlockMessage, NodeDeclarationSignedChangeRequest,
+    NodeDeclarationSignedChangeRequestMessage
+)
+from node.blockchain.mixins.crypto import HashableStringWrapper
 from node.blockchain.models import Block as ORMBlock
 from node.blockchain.tests.factories.block import make_block
-from node.blockchain.tests.factories.block_message.node_declaration import make_node_declaration_block_message
 from node.blockchain.utils.blockchain_sync import sync_with_address, sync_with_node
+from node.core.exceptions import BlockchainSyncError
+
+
+def make_node_declaration_blocks(count, node, node_key_pair, signing_key):
+    """
+    Make blocks on top of local blockchain the way the node we sync with has made them (blocks are fetched ahead
+    of adding them, so they cannot be made from local blockchain state on the fly)
+    """
+    facade = BlockchainFacade.get_instance()
+    number = facade.get_next_block_number()
+    identifier = facade.get_next_block_identifier()
+    account_lock = facade.get_account_lock(node.identifier)
+
+    blocks = []
+    for _ in range(count):
+        request = NodeDeclarationSignedChangeRequest.create_from_signed_change_request_message(
+            message=NodeDeclarationSignedChangeRequestMessage(node=node, account_lock=account_lock),
+            signing_key=node_key_pair.private,
+        )
+        block_message = NodeDeclarationBlockMessage(
+            number=number,
+            identifier=identifier,
+            timestamp=datetime.utcnow(),
+            request=request,
+            update=NodeDeclarationBlockMessage.make_block_message_update(request, facade),
+        )
+        block = make_block(block_message, signing_key, block_class=NodeDeclarationBlock)
+        blocks.append(block)
+
+        number += 1
+        identifier = HashableStringWrapper(block.json()).make_hash()
+        account_lock = request.make_hash()
+
+    return blocks
 
 
 @pytest.mark.django_db
@@ -26,20 +64,13 @@ def test_sync_with_address(
 ):
     facade = BlockchainFacade.get_instance()
     start_block_number = facade.get_next_block_number()
-    signing_key = primary_validator_key_pair.private
-
-    expected_blocks = []
+    expected_blocks = make_node_declaration_blocks(
+        5, regular_node, regular_node_key_pair, primary_validator_key_pair.private
+    )
 
     def raw_block_generator(self, address, block_number_min, block_number_max):
         assert block_number_max - block_number_min + 1 == 5
-        for expected_block_number in range(block_number_min, block_number_max + 1):
-            block = make_block(
-                make_node_declaration_block_message(regular_node, regular_node_key_pair, facade),
-                signing_key,
-                block_class=NodeDeclarationBlock
-            )
-            expected_blocks.append(block)
-            assert block.get_block_number() == expected_block_number
+        for block in expected_blocks:
             yield block.dict()
 
     with patch('node.core.clients.node.NodeClient.yield_blocks_dict', new=raw_block_generator):
@@ -55,3 +86,46 @@ def test_sync_with_address(
     assert facade.get_next_block_number() == start_block_number + 5
     actual_blocks = ORMBlock.objects.filter(_id__in=range(start_block_number, start_block_number + 5)).order_by('_id')
     assert expected_blocks == [block.get_block() for block in actual_blocks]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('rich_blockchain', 'force_smart_mocked_node_client')
+def test_sync_with_address_verifies_signatures(
+    test_server_address, primary_validator_key_pair, regular_node, regular_node_key_pair
+):
+    facade = BlockchainFacade.get_instance()
+    start_block_number = facade.get_next_block_number()
+    blocks = make_node_declaration_blocks(3, regular_node, regular_node_key_pair, primary_validator_key_pair.private)
+    block_dicts = [block.dict() for block in blocks]
+    block_dicts[1]['signature'] = blocks[0].signature
+
+    with patch('node.core.clients.node.NodeClient.yield_blocks_dict', return_value=iter(block_dicts)):
+        generator = sync_with_address(test_server_address, to_block_number=start_block_number + 2)
+        assert next(generator) == (start_block_number, pytest.approx(1 / 3))
+        with pytest.raises(BlockchainSyncError) as exc_info:
+            next(generator)
+
+    assert exc_info.value.__cause__.messages == ['Invalid signature']
+    # Blocks preceding the invalid one are added
+    assert facade.get_next_block_number() == start_block_number + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('rich_blockchain', 'force_smart_mocked_node_client')
+def test_sync_with_address_adds_blocks_preceding_malformed_one(
+    test_server_address, primary_validator_key_pair, regular_node, regular_node_key_pair
+):
+    facade = BlockchainFacade.get_instance()
+    start_block_number = facade.get_next_block_number()
+    blocks = make_node_declaration_blocks(3, regular_node, regular_node_key_pair, primary_validator_key_pair.private)
+    block_dicts = [block.dict() for block in blocks]
+    del block_dicts[1]['message']
+
+    with patch('node.core.clients.node.NodeClient.yield_blocks_dict', return_value=iter(block_dicts)):
+        generator = sync_with_address(test_server_address, to_block_number=start_block_number + 2)
+        assert next(generator) == (start_block_number, pytest.approx(1 / 3))
+        with pytest.raises(BlockchainSyncError) as exc_info:
+            next(generator)
+
+    assert exc_info.value.args == ('Could not add block: %s', block_dicts[1])
+    assert facade.get_next_block_number() == start_block_number + 1
@@ -0,0 +1,78 @@
+from unittest.mock import Mock, patch
+
+from node.blockchain.constants import BLOCK_LOCK
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.models import Block as ORMBlock
+from node.blockchain.types import ChainTip
+from node.blockchain.utils.cache_invalidation import CacheInvalidationBus
+from node.blockchain.utils.lock import call_lock_acquired_handlers
+from node.core.utils.cryptography import get_signing_key
+from node.core.utils.misc import SENTINEL
+
+CHAIN_TIP_1 = ChainTip(number=1, hash='1' * 128)
+CHAIN_TIP_2 = ChainTip(number=2, hash='2' * 128)
+
+
+def test_handle_change():
+    callback = Mock()
+    bus = CacheInvalidationBus(callback, polling_interval_seconds=0.001)
+
+    bus.handle_change({'operationType': 'insert', 'fullDocument': {'_id': 1, 'hash': '1' * 128}})
+    callback.assert_called_once_with(CHAIN_TIP_1)
+
+    callback.reset_mock()
+    bus.handle_change({'operationType': 'delete', 'documentKey': {'_id': 1}})
+    callback.assert_called_once_with()
+
+
+def test_poll():
+    callback = Mock()
+    bus = CacheInvalidationBus(callback, polling_interval_seconds=0.001)
+    chain_tips = iter((None, CHAIN_TIP_1, CHAIN_TIP_1, CHAIN_TIP_2))
+
+    def get_committed_chain_tip():
+        chain_tip = next(chain_tips)
+        if chain_tip == CHAIN_TIP_2:
+            bus.stop()
+        return chain_tip
+
+    with patch('node.blockchain.utils.cache_invalidation.get_committed_chain_tip', get_committed_chain_tip):
+        bus.poll()
+
+    assert [call.args for call in callback.call_args_list] == [(CHAIN_TIP_1,), (CHAIN_TIP_2,)]
+
+
+def test_on_blockchain_change():
+    facade = BlockchainFacade(signing_key=get_signing_key())
+    with patch.object(BlockchainFacade, '_instance', facade), patch.object(facade, '_chain_tip', CHAIN_TIP_1):
+        # The change is already reflected in the cache
+        BlockchainFacade.on_blockchain_change(CHAIN_TIP_1)
+        assert facade._chain_tip == CHAIN_TIP_1
+
+        # Block added by another process
+        BlockchainFacade.on_blockchain_change(CHAIN_TIP_2)
+        assert facade._chain_tip is SENTINEL
+
+        # Unknown change
+        facade._chain_tip = CHAIN_TIP_2
+        BlockchainFacade.on_blockchain_change()
+        assert facade._chain_tip is SENTINEL
+
+
+def test_cache_is_revalidated_on_block_lock_acquired():
+    facade = BlockchainFacade(signing_key=get_signing_key())
+    facade._values['schedule_snapshot'] = Mock()
+    with patch.object(BlockchainFacade, '_instance', facade), patch.object(facade, '_chain_tip', CHAIN_TIP_1):
+        with patch.object(ORMBlock.objects, 'get_chain_tip', return_value=CHAIN_TIP_1) as get_chain_tip_mock:
+            call_lock_acquired_handlers(BLOCK_LOCK)
+
+        get_chain_tip_mock.assert_called_once_with(is_committed=True)
+        assert facade._chain_tip == CHAIN_TIP_1
+        assert 'schedule_snapshot' in facade._values
+
+        # Block was added by another process, but the notification has not been delivered yet
+        with patch.object(ORMBlock.objects, 'get_chain_tip', return_value=CHAIN_TIP_2):
+            call_lock_acquired_handlers(BLOCK_LOCK)
+
+        assert facade._chain_tip is SENTINEL
+        assert facade._values == {}
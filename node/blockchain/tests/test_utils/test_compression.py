@@ -0,0 +1,65 @@
+import json
+import zlib
+
+import pytest
+
+from node.blockchain.utils.compression import (
+    BodyFormat, compress_body, decompress_body, get_body_format, iter_body_chunks
+)
+
+BODY = json.dumps(
+    {
+        'message': {
+            'number': 1,
+            'type': 0,
+            'update': {
+                'accounts': {
+                    f'{number:064x}': {
+                        'account_lock': f'{number:064x}',
+                        'balance': number * 1000
+                    } for number in range(100)
+                }
+            },
+        },
+        'signature': 'a' * 128,
+        'signer': 'b' * 64,
+    },
+    separators=(',', ':'),
+    sort_keys=True,
+)
+
+
+@pytest.fixture(params=list(BodyFormat))
+def body_format(request):
+    if request.param == BodyFormat.ZSTD:
+        pytest.importorskip('zstandard')
+
+    return request.param
+
+
+def test_uncompressed_body():
+    assert compress_body(BODY, None) == BODY
+    assert compress_body(BODY.encode(), None) == BODY
+    assert get_body_format(BODY) is None
+    assert get_body_format(BODY.encode()) is None
+    assert decompress_body(BODY) == BODY
+    assert decompress_body(BODY.encode()) == BODY
+    assert decompress_body(None) is None
+    assert list(iter_body_chunks(BODY)) == [BODY]
+
+
+def test_compressed_body(body_format):
+    stored_body = compress_body(BODY, body_format)
+    assert isinstance(stored_body, bytes)
+    assert len(stored_body) < len(BODY)
+    assert get_body_format(stored_body) == body_format
+    assert decompress_body(stored_body) == BODY
+
+    chunks = list(iter_body_chunks(stored_body, chunk_size=100))
+    assert len(chunks) > 1
+    assert b''.join(chunks) == BODY.encode()
+
+
+def test_preset_dictionary_improves_compression_of_small_body():
+    body = '{"message":{"number":5,"type":2},"signature":"' + 'a' * 128 + '","signer":"' + 'b' * 64 + '"}'
+    assert len(compress_body(body, BodyFormat.ZLIB)) < len(zlib.compress(body.encode()))
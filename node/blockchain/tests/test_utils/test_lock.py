@@ -1,10 +1,16 @@
+import threading
 import time
+from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings
 from pymongo import MongoClient
 
-from node.blockchain.utils.lock import create_lock, lock
+from node.blockchain.utils.lock import (
+    LeaseKeeper, create_lock, delete_lock, get_held_lease, get_now, hold_lock, is_locked, lock, validate_fencing_token,
+    validate_is_locked
+)
 from node.core.database import get_database
 from node.core.exceptions import BlockchainIsNotLockedError, BlockchainLockingError, BlockchainUnlockingError
 
@@ -110,3 +116,159 @@ def test_cannot_create_lock_twice_with_longer_timeout():
 
     end = time.time()
     assert 0.1 <= end - start <= 0.2
+
+
+@pytest.mark.django_db
+def test_expired_lock_is_taken_over():
+    lease = create_lock('mylock')
+    get_database().lock.update_one({'_id': 'mylock'}, {'$set': {'expires_at': get_now() - timedelta(seconds=1)}})
+    assert not is_locked('mylock')
+
+    new_lease = create_lock('mylock')
+    assert new_lease.owner != lease.owner
+    assert is_locked('mylock')
+
+    # Former holder cannot release the lock it does not hold anymore
+    assert delete_lock('mylock', lease.owner).deleted_count == 0
+    assert delete_lock('mylock', new_lease.owner).deleted_count == 1
+
+
+@pytest.mark.django_db
+def test_lock_waiter_is_woken_up_on_release():
+    lease = create_lock('mylock')
+    release_timer = threading.Timer(0.05, delete_lock, args=('mylock', lease.owner))
+    release_timer.start()
+
+    start = time.time()
+    new_lease = create_lock('mylock', timeout_seconds=5)
+    end = time.time()
+    release_timer.join()
+
+    assert new_lease.owner != lease.owner
+    assert 0.05 <= end - start <= 0.5
+    delete_lock('mylock', new_lease.owner)
+
+
+@pytest.mark.django_db
+def test_ensure_locked_does_not_query_database_if_lock_is_held():
+
+    @lock('mylock')
+    def expect_locked_function():
+        assert has_lock('mylock')
+
+    @lock('mylock')
+    def locked_function():
+        with patch('node.blockchain.utils.lock.is_locked') as is_locked_mock:
+            expect_locked_function(expect_locked=True)
+
+        is_locked_mock.assert_not_called()
+
+    locked_function()
+
+    # Ownership is not leaked after release
+    with pytest.raises(BlockchainIsNotLockedError):
+        expect_locked_function(expect_locked=True)
+
+
+@pytest.mark.django_db
+def test_ensure_locked_if_lock_is_held_by_other_thread():
+
+    @lock('mylock')
+    def expect_locked_function():
+        pass
+
+    @lock('mylock')
+    def locked_function():
+        thread_errors = []
+
+        def run():
+            try:
+                expect_locked_function(expect_locked=True)
+            except Exception as ex:
+                thread_errors.append(ex)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        # The other thread does not own the lock, but it falls back to database check that finds the lock
+        assert thread_errors == []
+
+    locked_function()
+
+
+@pytest.mark.django_db
+def test_lease_is_renewed():
+    lease = create_lock('mylock')
+    expires_at = get_now() + timedelta(seconds=1)
+    get_database().lock.update_one({'_id': 'mylock'}, {'$set': {'expires_at': expires_at}})
+
+    LeaseKeeper(renewal_interval_seconds=1).renew(lease)
+    assert not lease.is_lost
+    assert lease.expires_at > expires_at
+    assert get_database().lock.find_one({'_id': 'mylock'})['expires_at'] > expires_at
+    delete_lock('mylock', lease.owner)
+
+
+@pytest.mark.django_db
+def test_lock_fails_if_lease_is_lost():
+
+    @lock('mylock')
+    def locked_function():
+        lease = get_held_lease('mylock')
+        # Other process takes over the lock (as if the lease was not renewed in time)
+        get_database().lock.update_one({'_id': 'mylock'}, {'$set': {'owner': 'other'}})
+        LeaseKeeper(renewal_interval_seconds=1).renew(lease)
+        assert lease.is_lost
+        with pytest.raises(BlockchainIsNotLockedError, match='Lease of lock mylock was lost'):
+            validate_is_locked('mylock')
+
+    with pytest.raises(BlockchainUnlockingError):
+        locked_function()
+
+    # Lock of the new holder is kept
+    assert has_lock('mylock')
+    delete_lock('mylock', 'other')
+
+
+@pytest.mark.django_db
+def test_hold_lock_fails_if_lock_is_released_by_other_process():
+    with pytest.raises(BlockchainUnlockingError):
+        with hold_lock('mylock', 'test_site'):
+            get_database().lock.delete_one({'_id': 'mylock'})
+
+    assert not has_lock('mylock')
+
+
+@pytest.mark.django_db
+def test_fencing_token_increases_with_each_acquisition():
+    lease = create_lock('mylock')
+    delete_lock('mylock', lease.owner)
+    new_lease = create_lock('mylock')
+    assert new_lease.fencing_token > lease.fencing_token
+    assert get_database().lock.find_one({'_id': 'mylock'})['fencing_token'] == new_lease.fencing_token
+
+    get_database().lock.update_one({'_id': 'mylock'}, {'$set': {'expires_at': get_now() - timedelta(seconds=1)}})
+    taken_over_lease = create_lock('mylock')
+    assert taken_over_lease.fencing_token > new_lease.fencing_token
+    delete_lock('mylock', taken_over_lease.owner)
+
+
+@pytest.mark.django_db
+def test_hold_lock_writer_is_fenced_after_takeover():
+    with pytest.raises(BlockchainIsNotLockedError, match='Lock mylock is not held'):
+        validate_fencing_token('mylock')
+
+    with pytest.raises(BlockchainIsNotLockedError, match='Lease of lock mylock was lost'):
+        with hold_lock('mylock', 'test_site') as lease:
+            validate_fencing_token('mylock')
+
+            # Other process takes over the lock before the lease keeper notices the lease is lost
+            new_values = {'owner': 'other', 'fencing_token': lease.fencing_token + 1}
+            get_database().lock.update_one({'_id': 'mylock'}, {'$set': new_values})
+            assert lease.is_valid()
+            validate_fencing_token('mylock')
+
+    assert lease.is_lost
+    # Lock of the new holder is kept
+    assert has_lock('mylock')
+    delete_lock('mylock', 'other')
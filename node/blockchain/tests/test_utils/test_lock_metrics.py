@@ -0,0 +1,84 @@
+import pytest
+from django.contrib.auth.models import User
+
+from node.blockchain.utils.lock import lock
+from node.blockchain.utils.lock_metrics import (
+    BUCKET_KEYS, SiteMetrics, decode_field_name, encode_field_name, flush_lock_metrics, get_lock_metrics,
+    get_percentile_ms, reset_lock_metrics
+)
+from node.core.exceptions import BlockchainLockingError
+
+
+@pytest.fixture
+def clean_lock_metrics():
+    reset_lock_metrics()
+    yield
+    reset_lock_metrics()
+
+
+def test_get_percentile_ms():
+    site_metrics = SiteMetrics()
+    for duration_ms in (0.5, 3, 3, 4, 15_000):
+        site_metrics.hold.observe(duration_ms)
+
+    buckets = dict(zip(BUCKET_KEYS, site_metrics.hold.bucket_counts))
+    assert buckets['le_1'] == 1
+    assert buckets['le_5'] == 3
+    assert buckets['le_inf'] == 1
+
+    assert get_percentile_ms(buckets, 5, 15_000, 50) == 5
+    assert get_percentile_ms(buckets, 5, 15_000, 99) == 15_000
+    assert get_percentile_ms({}, 0, 0, 50) is None
+
+
+@pytest.mark.parametrize('value', ('node.blockchain.facade.add_block', 'site.$with.%2E.escapes', '100%'))
+def test_field_name_encoding(value):
+    field_name = encode_field_name(value)
+    assert '.' not in field_name and '$' not in field_name
+    assert decode_field_name(field_name) == value
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('clean_lock_metrics')
+def test_lock_metrics(settings, api_client):
+    settings.LOCK_DEFAULT_TIMEOUT_SECONDS = 0.01
+
+    @lock('mylock')
+    def inner_function():
+        pass
+
+    @lock('mylock')
+    def outer_function():
+        with pytest.raises(BlockchainLockingError):
+            inner_function()
+
+    outer_function()
+    outer_function()
+
+    # Metrics are flushed in background periodically, we do not wait for it
+    flush_lock_metrics()
+
+    inner_site = f'{__name__}.test_lock_metrics.<locals>.inner_function'
+    outer_site = f'{__name__}.test_lock_metrics.<locals>.outer_function'
+    metrics = {item['site']: item for item in get_lock_metrics()}
+    assert metrics.keys() == {inner_site, outer_site}
+
+    outer_metrics = metrics[outer_site]
+    assert outer_metrics['lock'] == 'mylock'
+    assert outer_metrics['wait']['count'] == 2
+    assert outer_metrics['hold']['count'] == 2
+    assert outer_metrics['hold']['max_ms'] >= 10
+    assert outer_metrics['failures'] == 0
+
+    inner_metrics = metrics[inner_site]
+    assert inner_metrics['wait']['count'] == 0
+    assert inner_metrics['failures'] == 2
+    assert inner_metrics['blocked_by'] == {outer_site: 2}
+
+    response = api_client.get('/api/lock-metrics/')
+    assert response.status_code == 403
+
+    api_client.force_authenticate(User(username='admin', is_staff=True))
+    response = api_client.get('/api/lock-metrics/')
+    assert response.status_code == 200
+    assert response.json() == get_lock_metrics()
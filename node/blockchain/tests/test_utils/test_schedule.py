@@ -0,0 +1,87 @@
+import pytest
+from django.db import transaction
+
+from node.blockchain.facade import BlockchainFacade
+from node.blockchain.tests.base import run_in_thread
+from node.blockchain.types import NodeRole
+from node.blockchain.utils.schedule import ScheduleSnapshot
+
+SCHEDULE = {
+    '10': '1' * 64,
+    '20': '2' * 64,
+    '30': '1' * 64,
+}
+
+
+@pytest.mark.parametrize(
+    'block_number, expected', (
+        (0, None),
+        (9, None),
+        (10, '1' * 64),
+        (19, '1' * 64),
+        (20, '2' * 64),
+        (29, '2' * 64),
+        (30, '1' * 64),
+        (1000, '1' * 64),
+    )
+)
+def test_get_primary_validator_identifier(block_number, expected):
+    assert ScheduleSnapshot(SCHEDULE).get_primary_validator_identifier(block_number) == expected
+
+
+@pytest.mark.parametrize(
+    'node_identifier, block_number, expected', (
+        ('1' * 64, 10, NodeRole.PRIMARY_VALIDATOR),
+        ('2' * 64, 10, NodeRole.CONFIRMATION_VALIDATOR),
+        ('1' * 64, 20, NodeRole.CONFIRMATION_VALIDATOR),
+        ('2' * 64, 20, NodeRole.PRIMARY_VALIDATOR),
+        ('2' * 64, 30, NodeRole.REGULAR_NODE),
+        ('3' * 64, 10, NodeRole.REGULAR_NODE),
+    )
+)
+def test_get_node_role(node_identifier, block_number, expected):
+    assert ScheduleSnapshot(SCHEDULE).get_node_role(node_identifier, block_number) == expected
+
+
+def test_get_validator_identifiers():
+    schedule_snapshot = ScheduleSnapshot(SCHEDULE)
+    assert schedule_snapshot.get_validator_identifiers() == {'1' * 64, '2' * 64}
+    assert schedule_snapshot.get_confirmation_validator_identifiers(20) == {'1' * 64}
+    assert schedule_snapshot.get_confirmation_validator_identifiers(0) == {'1' * 64, '2' * 64}
+
+
+def test_empty_schedule():
+    schedule_snapshot = ScheduleSnapshot({})
+    assert len(schedule_snapshot) == 0
+    assert schedule_snapshot.get_primary_validator_identifier(0) is None
+    assert schedule_snapshot.get_node_role('1' * 64, 0) == NodeRole.REGULAR_NODE
+
+
+@pytest.mark.usefixtures('base_blockchain')
+def test_schedule_snapshot_is_cached(django_assert_num_queries):
+    facade = BlockchainFacade.get_instance()
+    with django_assert_num_queries(1):
+        schedule_snapshot = facade.get_schedule_snapshot()
+
+    assert schedule_snapshot == ScheduleSnapshot.from_database()
+    with django_assert_num_queries(0):
+        assert facade.get_schedule_snapshot() is schedule_snapshot
+
+    facade.update_write_through_cache_schedule(SCHEDULE)
+    assert facade.get_schedule_snapshot() == ScheduleSnapshot(SCHEDULE)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('committed_blockchain')
+def test_uncommitted_schedule_snapshot_is_not_shared():
+    facade = BlockchainFacade.get_instance()
+    schedule_snapshot = facade.get_schedule_snapshot()
+    assert schedule_snapshot != ScheduleSnapshot(SCHEDULE)
+
+    with transaction.atomic():
+        facade.update_write_through_cache_schedule(SCHEDULE)
+        assert facade.get_schedule_snapshot() == ScheduleSnapshot(SCHEDULE)
+        assert run_in_thread(facade.get_schedule_snapshot) == schedule_snapshot
+
+    assert facade.get_schedule_snapshot() == ScheduleSnapshot(SCHEDULE)
+    assert run_in_thread(facade.get_schedule_snapshot) == ScheduleSnapshot(SCHEDULE)
@@ -84,3 +84,8 @@ class Signature(hexstr128):
 class KeyPair(NamedTuple):
     public: AccountNumber
     private: SigningKey
+
+
+class ChainTip(NamedTuple):
+    number: int
+    hash: Hash  # noqa: A003
@@ -1,13 +1,15 @@
 import logging
+from itertools import islice
 from typing import Optional
 
 from django.db import transaction
 
 from node.blockchain.facade import BlockchainFacade
 from node.blockchain.inner_models import Block
-from node.core.clients.node import NodeClient
+from node.core.clients.node import LIST_BLOCKS_LIMIT, NodeClient
 from node.core.database import is_in_transaction
-from node.core.exceptions import BlockchainSyncError
+from node.core.exceptions import BlockchainSyncError, ValidationError
+from node.core.utils.signature_verification import parse_with_batch_signature_verification
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,19 @@ def get_default_to_block_number(address, to_block_number) -> int:
     return last_block_number
 
 
+def yield_parsed_blocks(block_dicts, window_size=LIST_BLOCKS_LIMIT):
+    """
+    Yield (block dict, block, whether its signatures are valid) in the original order. Signatures of each window of
+    blocks (a page of the node API by default) are verified at once in parallel, since blocks do not depend on local
+    blockchain state until they are added. Parsing exception is yielded instead of block that could not be parsed.
+    """
+    iterator = iter(block_dicts)
+    while window := list(islice(iterator, window_size)):
+        parsed_blocks = parse_with_batch_signature_verification(Block.parse_obj, window)
+        for block_dict, (block, is_signature_valid) in zip(window, parsed_blocks):
+            yield block_dict, block, is_signature_valid
+
+
 def sync_with_address(address: str, to_block_number: Optional[int] = None):
     facade = BlockchainFacade.get_instance()
     start_block_number = facade.get_next_block_number()
@@ -33,9 +48,14 @@ def sync_with_address(address: str, to_block_number: Optional[int] = None):
     block_generator = NodeClient.get_instance().yield_blocks_dict(
         address, block_number_min=start_block_number, block_number_max=to_block_number
     )
-    for block in block_generator:
+    for block, block_obj, is_signature_valid in yield_parsed_blocks(block_generator):
         try:
-            block_obj = Block.parse_obj(block)
+            if isinstance(block_obj, Exception):
+                raise block_obj
+
+            if not is_signature_valid:
+                raise ValidationError('Invalid signature')
+
             block_number = block_obj.get_block_number()
             if block_number < start_block_number:
                 logger.warning(
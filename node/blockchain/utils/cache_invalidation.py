@@ -0,0 +1,132 @@
+import logging
+import os
+import threading
+from typing import Callable, Optional
+
+from django.conf import settings
+from pymongo.errors import OperationFailure, PyMongoError
+
+from node.blockchain.types import ChainTip
+from node.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# "The $changeStream stage is only supported on replica sets"
+CHANGE_STREAM_NOT_SUPPORTED_CODE = 40573
+
+# We do not need block body to find out chain tip
+CHANGE_STREAM_PIPELINE = [{'$project': {'fullDocument.body': 0}}]
+
+_bus: Optional['CacheInvalidationBus'] = None
+_bus_lock = threading.Lock()
+
+
+def get_block_collection():
+    from node.blockchain.models import Block
+    return get_database()[Block._meta.db_table]
+
+
+def get_committed_chain_tip() -> Optional[ChainTip]:
+    document = get_block_collection().find_one({}, {'_id': 1, 'hash': 1}, sort=[('_id', -1)])
+    return None if document is None else ChainTip(number=document['_id'], hash=document.get('hash'))
+
+
+class CacheInvalidationBus(threading.Thread):
+    """
+    Background thread that notifies about blockchain changes committed by any process.
+
+    `callback` is called with committed chain tip after a block is added and without arguments after other
+    changes (like blockchain clearing), so in-process cache could be invalidated. Block collection change
+    stream is used if supported (replica set), otherwise the last block is polled.
+    """
+
+    def __init__(self, callback: Callable, polling_interval_seconds: float):
+        super().__init__(name='cache-invalidation-bus', daemon=True)
+        self.callback = callback
+        self.polling_interval_seconds = polling_interval_seconds
+        self.pid = os.getpid()
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        try:
+            self.watch()
+        except OperationFailure as ex:
+            if ex.code != CHANGE_STREAM_NOT_SUPPORTED_CODE:
+                raise
+
+            logger.info('Change streams are not supported, falling back to polling for cache invalidation')
+            self.poll()
+
+    def watch(self):
+        resume_token = None
+        max_await_time_ms = int(self.polling_interval_seconds * 1000)
+        while not self.stop_event.is_set():
+            try:
+                with get_block_collection().watch(
+                    CHANGE_STREAM_PIPELINE, resume_after=resume_token, max_await_time_ms=max_await_time_ms
+                ) as stream:
+                    while stream.alive and not self.stop_event.is_set():
+                        if change := stream.try_next():
+                            self.handle_change(change)
+                        resume_token = stream.resume_token
+            except OperationFailure as ex:
+                if ex.code == CHANGE_STREAM_NOT_SUPPORTED_CODE:
+                    raise
+
+                self.handle_error(ex)
+                resume_token = None
+            except PyMongoError as ex:
+                self.handle_error(ex)
+
+    def poll(self):
+        last_chain_tip = None
+        while not self.stop_event.wait(self.polling_interval_seconds):
+            try:
+                chain_tip = get_committed_chain_tip()
+            except PyMongoError as ex:
+                self.handle_error(ex)
+                continue
+
+            if chain_tip != last_chain_tip:
+                self.callback(chain_tip)
+                last_chain_tip = chain_tip
+
+    def handle_change(self, change):
+        if change['operationType'] == 'insert':
+            document = change['fullDocument']
+            self.callback(ChainTip(number=document['_id'], hash=document.get('hash')))
+        else:
+            self.callback()
+
+    def handle_error(self, ex):
+        logger.warning('Error while watching for blockchain changes: %r', ex)
+        # We could have missed some changes
+        self.callback()
+        self.stop_event.wait(self.polling_interval_seconds)
+
+
+def ensure_cache_invalidation_bus_started(callback):
+    global _bus
+
+    # The thread does not survive fork (Celery prefork workers), so we check the process it was started in
+    if (bus := _bus) and bus.pid == os.getpid() and bus.is_alive():
+        return
+
+    with _bus_lock:
+        if (bus := _bus) and bus.pid == os.getpid() and bus.is_alive():
+            return
+
+        _bus = CacheInvalidationBus(callback, settings.CACHE_INVALIDATION_POLLING_INTERVAL_SECONDS)
+        _bus.start()
+
+
+def stop_cache_invalidation_bus():
+    global _bus
+
+    with _bus_lock:
+        if bus := _bus:
+            bus.stop()
+            _bus = None
@@ -0,0 +1,107 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+
+from node.blockchain.constants import JSON_CRYPTO_KWARGS
+from node.blockchain.mixins.crypto import HashableStringWrapper
+from node.blockchain.repositories import BlockRepository
+from node.blockchain.types import Hash
+from node.core.database import get_collection, snapshot_session
+from node.core.exceptions import CheckpointError
+
+CHECKPOINT_VERSION = 1
+ACCOUNT_STATE_FIELDS = ('balance', 'account_lock', 'node')
+
+
+def make_checkpoint_hash(checkpoint: dict) -> Hash:
+    content = {key: value for key, value in checkpoint.items() if key != 'hash'}
+    return HashableStringWrapper(json.dumps(content, **JSON_CRYPTO_KWARGS)).make_hash()
+
+
+def get_account_states(session) -> dict[str, dict]:
+    from node.blockchain.models import AccountState
+
+    # Raw query is used for performance reasons (there may be millions of accounts)
+    documents = get_collection(AccountState).find({}, session=session)
+    return {document['_id']: {field: document.get(field) for field in ACCOUNT_STATE_FIELDS} for document in documents}
+
+
+def get_schedule(session) -> dict[str, str]:
+    from node.blockchain.models import Schedule
+
+    documents = get_collection(Schedule).find({}, session=session)
+    return {str(document['_id']): document['node_identifier'] for document in documents}
+
+
+def make_checkpoint() -> Optional[dict]:
+    """
+    Return snapshot of account states and schedule along with the last block they are valid for.
+
+    Everything is read at the same point in time (see `snapshot_session()`), so the snapshot is consistent even if
+    blocks are being added, and reading millions of accounts is not limited by transaction lifetime.
+    """
+    with snapshot_session() as session:
+        if (last_block := BlockRepository(session=session).get_last_block()) is None:
+            return None
+
+        checkpoint = {
+            'version': CHECKPOINT_VERSION,
+            'block_number': last_block._id,
+            'block_hash': last_block.get_hash(),
+            'block': last_block.body,
+            'accounts': get_account_states(session),
+            'schedule': get_schedule(session),
+        }
+
+    checkpoint['hash'] = make_checkpoint_hash(checkpoint)
+    return checkpoint
+
+
+def validate_checkpoint(checkpoint: dict, expected_hash: Hash):
+    """
+    Validate checkpoint against `expected_hash` obtained from a trusted source. Account states are not covered by
+    block signatures, so anyone could make a checkpoint with a valid hash and a signed block, and the trusted hash
+    is the only way to tell it is genuine.
+    """
+    if not expected_hash:
+        raise CheckpointError('Expected checkpoint hash is required')
+
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise CheckpointError(f'Unsupported checkpoint version: {checkpoint.get("version")}')
+
+    hash_ = make_checkpoint_hash(checkpoint)
+    if checkpoint.get('hash') != hash_:
+        raise CheckpointError('Checkpoint hash is not valid')
+
+    if hash_ != expected_hash:
+        raise CheckpointError(f'Expected checkpoint hash {expected_hash}, but got {hash_}')
+
+    if HashableStringWrapper(checkpoint['block']).make_hash() != checkpoint['block_hash']:
+        raise CheckpointError('Checkpoint block hash is not valid')
+
+
+def open_checkpoint_file(path, mode, is_gzipped):
+    return gzip.open(path, mode) if is_gzipped else open(path, mode)
+
+
+def write_checkpoint(checkpoint: dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Checkpoint is written under temporary name and renamed, so partially written checkpoints are never seen
+    temporary_path = path.with_name(path.name + '.tmp')
+    with open_checkpoint_file(temporary_path, 'wt', is_gzipped=path.suffix == '.gz') as file:
+        json.dump(checkpoint, file, separators=JSON_CRYPTO_KWARGS['separators'])
+
+    temporary_path.rename(path)
+
+
+def read_checkpoint(path) -> dict:
+    with open_checkpoint_file(path, 'rt', is_gzipped=Path(path).suffix == '.gz') as file:
+        return json.load(file)
+
+
+def get_checkpoint_path(block_number) -> Path:
+    return Path(settings.CHECKPOINT_PATH) / f'checkpoint-{block_number:020d}.json.gz'
@@ -0,0 +1,112 @@
+import zlib
+from enum import IntEnum
+from typing import Iterator, Optional, Union
+
+from django.conf import settings
+
+# Preset dictionary with fragments that repeat in every block, block confirmation and signed change request
+# (keys are sorted because of `JSON_CRYPTO_KWARGS`). zlib looks back from the end of the dictionary, so the most
+# frequent fragments go last. NEVER change it: it is required to decompress already stored bodies (introduce
+# a new `BodyFormat` with a new dictionary instead)
+BODY_DICTIONARY = (
+    '"addresses":["http://:8555/"],"fee":'
+    '"memo":null,"is_fee":false,"is_fee":true,"recipient":"'
+    '"accounts":{"update":{"schedule":{"node":null,"node":{"timestamp":"T00:00:00.000000",'
+    '"txs":[{"amount":,"type":2},"type":1},"type":3},"type":0},"request":{'
+    '"balance":,"balance_lock":"","account_lock":"","identifier":"'
+    '"hash":"","message":{"number":,"signature":"","signer":"'
+).encode()
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+DECOMPRESSION_CHUNK_SIZE = 64 * 1024
+
+RAW_JSON_FIRST_BYTES = frozenset(b'{[ \t\r\n')
+
+
+class BodyFormat(IntEnum):
+    """
+    Storage format of a body. Compressed bodies are stored as binary prefixed with the format byte, while
+    uncompressed ones are stored as JSON strings (as they used to be).
+    """
+    ZLIB = 1
+    ZSTD = 2
+
+
+_zstd_dictionary = None
+
+
+def get_zstd_dictionary():
+    global _zstd_dictionary
+
+    if _zstd_dictionary is None:
+        import zstandard  # optional dependency
+        _zstd_dictionary = zstandard.ZstdCompressionDict(BODY_DICTIONARY, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+
+    return _zstd_dictionary
+
+
+def get_configured_body_format() -> Optional[BodyFormat]:
+    if name := settings.BODY_COMPRESSION:
+        return BodyFormat[name.upper()]
+
+    return None
+
+
+def get_body_format(stored_body) -> Optional[BodyFormat]:
+    """
+    Return format of stored body or `None` for uncompressed body
+    """
+    if isinstance(stored_body, str) or not stored_body or stored_body[0] in RAW_JSON_FIRST_BYTES:
+        return None
+
+    return BodyFormat(stored_body[0])
+
+
+def compress_body(body: Union[str, bytes], body_format: Optional[BodyFormat]) -> Union[str, bytes]:
+    if body_format is None:
+        return body.decode() if isinstance(body, bytes) else body
+
+    data = body.encode() if isinstance(body, str) else body
+    if body_format == BodyFormat.ZLIB:
+        compressor = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS, zdict=BODY_DICTIONARY)
+        compressed_data = compressor.compress(data) + compressor.flush()
+    elif body_format == BodyFormat.ZSTD:
+        import zstandard  # optional dependency
+        compressed_data = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=get_zstd_dictionary()).compress(data)
+    else:
+        raise NotImplementedError(f'Unsupported body format: {body_format}')
+
+    return bytes((body_format,)) + compressed_data
+
+
+def iter_body_chunks(stored_body, chunk_size=DECOMPRESSION_CHUNK_SIZE) -> Iterator[Union[str, bytes]]:
+    """
+    Yield body in chunks decompressing it on the fly (it is neither decompressed nor parsed as a whole)
+    """
+    body_format = get_body_format(stored_body)
+    if body_format is None:
+        yield stored_body
+        return
+
+    data = memoryview(stored_body)[1:]
+    if body_format == BodyFormat.ZLIB:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS, zdict=BODY_DICTIONARY)
+        while data:
+            yield decompressor.decompress(data, chunk_size)
+            data = decompressor.unconsumed_tail
+
+        yield decompressor.flush()
+    elif body_format == BodyFormat.ZSTD:
+        import zstandard  # optional dependency
+        decompressor = zstandard.ZstdDecompressor(dict_data=get_zstd_dictionary())
+        yield from decompressor.read_to_iter(data, write_size=chunk_size)
+    else:
+        raise NotImplementedError(f'Unsupported body format: {body_format}')
+
+
+def decompress_body(stored_body) -> Optional[str]:
+    if stored_body is None or isinstance(stored_body, str):
+        return stored_body
+
+    return b''.join(iter_body_chunks(stored_body)).decode()
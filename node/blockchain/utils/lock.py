@@ -1,78 +1,420 @@
 import functools
 import logging
+import os
+import threading
 import time
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Callable, Optional
 
 from django.conf import settings
 from django.db import transaction
-from pymongo.errors import DuplicateKeyError
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError
 
+from node.blockchain.utils.cache_invalidation import CHANGE_STREAM_NOT_SUPPORTED_CODE
+from node.blockchain.utils.lock_metrics import record_lock_failure, record_lock_hold, record_lock_wait
 from node.core.database import get_database
 from node.core.exceptions import BlockchainIsNotLockedError, BlockchainLockingError, BlockchainUnlockingError
 
 logger = logging.getLogger(__name__)
 
+# Notified on every lock release in this process, so waiting threads retry without polling delay
+_released = threading.Condition()
+_are_change_streams_supported = True
+
+# Leases held in the current thread (or asyncio task), so nested `expect_locked` checks do not query the database
+_held_leases: ContextVar[dict[str, 'LockLease']] = ContextVar('held_leases', default={})
+
+# Handlers called once a lock is acquired (before the locked code runs) by lock name
+_acquired_handlers: dict[str, list[Callable]] = {}
+
+_keeper: Optional['LeaseKeeper'] = None
+_keeper_lock = threading.Lock()
+
+FENCING_TOKEN_INCREMENT = {'$inc': {'value': 1}}
+
+
+class LockLease:
+    """
+    Lock held by `owner` until `expires_at` (it is prolonged by `LeaseKeeper` while the lock is held).
+
+    `fencing_token` is greater than tokens of all former holders of the lock (see `validate_fencing_token()`).
+    """
+    __slots__ = ('name', 'owner', 'fencing_token', 'expires_at', 'is_lost')
+
+    def __init__(self, name: str, owner: str, fencing_token: int, expires_at: datetime):
+        self.name = name
+        self.owner = owner
+        self.fencing_token = fencing_token
+        self.expires_at = expires_at
+        # The lease could not be renewed in time and the lock could have been taken over by other process
+        self.is_lost = False
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}(name={self.name!r}, owner={self.owner!r}, '
+            f'fencing_token={self.fencing_token!r}, expires_at={self.expires_at!r})'
+        )
+
+    def is_valid(self) -> bool:
+        return not self.is_lost and self.expires_at > get_now()
+
 
 def get_lock_collection():
     return get_database().lock
 
 
+def get_lock_sequence_collection():
+    return get_database().lock_sequence
+
+
 def make_filter(name):
     return {'_id': name}
 
 
-def is_locked(name):
-    return bool(get_lock_collection().find_one(make_filter(name)))
+def get_now():
+    # Lease expiration is compared across processes, so we use UTC (it is also what MongoDB stores)
+    return datetime.utcnow()
 
 
-def insert_lock(name):
-    get_lock_collection().insert_one(make_filter(name))
+def is_expired(document, now=None) -> bool:
+    # Locks created before leases were introduced never expire
+    return (expires_at := document.get('expires_at')) is not None and expires_at <= (now or get_now())
 
 
-def create_lock(name, timeout_seconds: Optional[float] = None):
-    # TODO(dmu) HIGH: Make sure that timeout works correctly in conjunction with async behavior (Daphne)
-    #                 https://thenewboston.atlassian.net/browse/BC-258
-    if timeout_seconds is None:  # shortcut
-        try:
-            insert_lock(name)
-        except DuplicateKeyError:
-            raise BlockchainLockingError('Lock could not be acquired: %s', name)
+def is_locked(name):
+    document = get_lock_collection().find_one(make_filter(name))
+    return bool(document) and not is_expired(document)
+
+
+def get_lease_expires_at(now=None) -> datetime:
+    return (now or get_now()) + timedelta(seconds=settings.LOCK_LEASE_SECONDS)
+
+
+def get_next_fencing_token(name) -> int:
+    """
+    Return a number that is greater than any number returned for the lock before, so writes made by a holder
+    whose lease expired could be told apart from writes made by the next holder
+    """
+    document = get_lock_sequence_collection().find_one_and_update(
+        make_filter(name), FENCING_TOKEN_INCREMENT, upsert=True, return_document=ReturnDocument.AFTER
+    )
+    return document['value']
+
+
+def try_acquire_lock(name, site=None) -> Optional[LockLease]:
+    # The token is issued before the attempt, so the next holder gets a greater token even if this attempt
+    # succeeds and the lease is lost right after that
+    fencing_token = get_next_fencing_token(name)
+    now = get_now()
+    lease = LockLease(
+        name=name, owner=uuid.uuid4().hex, fencing_token=fencing_token, expires_at=get_lease_expires_at(now)
+    )
+    values = {
+        'owner': lease.owner,
+        'fencing_token': lease.fencing_token,
+        'expires_at': lease.expires_at,
+        # Call site that holds the lock is reported when others fail to acquire it
+        'site': site,
+    }
+    collection = get_lock_collection()
+    try:
+        collection.insert_one(dict(make_filter(name), **values))
+        return lease
+    except DuplicateKeyError:
+        pass
+
+    # The holder may have crashed without releasing the lock, so its lease is taken over once expired
+    expired_filter = dict(make_filter(name), expires_at={'$lte': now})
+    if collection.find_one_and_update(expired_filter, {'$set': values}):
+        logger.warning('Took over expired lock: %s', name)
+        return lease
+
+    return None
+
+
+def get_wait_seconds(name, timeout_moment) -> float:
+    wait_seconds = timeout_moment - time.time()
+    if (document := get_lock_collection().find_one(make_filter(name))) and document.get('expires_at'):
+        # No need to wait longer than the current lease lasts
+        wait_seconds = min(wait_seconds, (document['expires_at'] - get_now()).total_seconds())
+
+    return max(wait_seconds, 0)
+
+
+def wait_for_release_notification(wait_seconds):
+    with _released:
+        _released.wait(wait_seconds)
+
+
+def create_lock_waiting_for_change_stream(name, timeout_moment, site=None) -> Optional[LockLease]:
+    """
+    Try to acquire lock until `timeout_moment` waking up on lock document changes reported by change stream.
+
+    Change stream is opened before the attempt, so release between the attempt and waiting is not missed.
+    """
+    pipeline = [{'$match': {'documentKey._id': name}}]
+    while True:
+        wait_seconds = get_wait_seconds(name, timeout_moment)
+        with get_lock_collection().watch(pipeline, max_await_time_ms=max(int(wait_seconds * 1000), 1)) as stream:
+            if lease := try_acquire_lock(name, site):
+                return lease
 
-        return
+            if wait_seconds <= 0:
+                return None
 
-    sleep_seconds = timeout_seconds / 10
-    timeout_moment = time.time() + timeout_seconds
+            logger.debug('Waiting to acquire lock: %s', name)
+            stream.try_next()
+
+
+def create_lock_waiting_for_notification(name, timeout_moment, site=None) -> Optional[LockLease]:
+    """
+    Try to acquire lock until `timeout_moment` waking up on release in this process or polling for release
+    in other processes
+    """
     while True:
-        if not is_locked(name):
-            try:
-                insert_lock(name)
-                return
-            except DuplicateKeyError:
-                logger.warning('Could not manage to get the lock :(')
+        if lease := try_acquire_lock(name, site):
+            return lease
+
+        if (wait_seconds := get_wait_seconds(name, timeout_moment)) <= 0:
+            return None
 
         logger.debug('Waiting to acquire lock: %s', name)
-        time.sleep(sleep_seconds)
+        wait_for_release_notification(min(wait_seconds, settings.LOCK_POLLING_INTERVAL_SECONDS))
+
+
+def create_lock(name, timeout_seconds: Optional[float] = None, site: Optional[str] = None) -> LockLease:
+    global _are_change_streams_supported
+
+    if lease := try_acquire_lock(name, site):  # shortcut for not contended lock
+        return lease
+
+    if timeout_seconds is None:
+        raise BlockchainLockingError('Lock could not be acquired: %s', name)
+
+    timeout_moment = time.time() + timeout_seconds
+    if _are_change_streams_supported:
+        try:
+            lease = create_lock_waiting_for_change_stream(name, timeout_moment, site)
+        except OperationFailure as ex:
+            if ex.code != CHANGE_STREAM_NOT_SUPPORTED_CODE:
+                raise
+
+            logger.info('Change streams are not supported, falling back to polling for lock release')
+            _are_change_streams_supported = False
+
+    if not _are_change_streams_supported:
+        lease = create_lock_waiting_for_notification(name, timeout_moment, site)
 
-        if time.time() >= timeout_moment:  # this makes sure we have at least one iteration
-            break
+    if lease is None:
+        raise BlockchainLockingError('Blockchain locking timeout for lock: %s', name)
 
-    raise BlockchainLockingError('Blockchain locking timeout for lock: %s', name)
+    return lease
 
 
-def delete_lock(name):
+def delete_lock(name, owner: Optional[str] = None):
+    """
+    Release lock. If `owner` is given the lock is released only if it is still held by the owner (it may have been
+    taken over after the lease expired), otherwise it is released unconditionally
+    """
     logger.debug('Deleting lock: %s', name)
-    result = get_lock_collection().delete_one(make_filter(name))
+    filter_ = make_filter(name) if owner is None else dict(make_filter(name), owner=owner)
+    result = get_lock_collection().delete_one(filter_)
     if result.deleted_count < 1:
         logger.warning('Lock %s was not found', name)
     else:
         logger.debug('Deleted lock: %s', name)
+        with _released:
+            _released.notify_all()
+
     return result
 
 
+def renew_lease(lease: LockLease) -> bool:
+    """
+    Prolong `lease` if the lock is still held by its owner (return `False` otherwise)
+    """
+    expires_at = get_lease_expires_at()
+    filter_ = dict(make_filter(lease.name), owner=lease.owner)
+    if get_lock_collection().update_one(filter_, {'$set': {'expires_at': expires_at}}).matched_count < 1:
+        return False
+
+    lease.expires_at = expires_at
+    return True
+
+
+class LeaseKeeper(threading.Thread):
+    """
+    Background thread that renews leases of locks held in this process, so long operations (like genesis,
+    checkpoint loading or blockchain clearing) are not taken over by other processes. A lease that could not be
+    renewed is marked as lost, then the holder fails on the next lock validation or on release.
+    """
+
+    def __init__(self, renewal_interval_seconds: float):
+        super().__init__(name='lock-lease-keeper', daemon=True)
+        self.renewal_interval_seconds = renewal_interval_seconds
+        self.pid = os.getpid()
+        self.leases: set[LockLease] = set()
+        self.leases_lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def add(self, lease: LockLease):
+        with self.leases_lock:
+            self.leases.add(lease)
+
+    def discard(self, lease: LockLease):
+        with self.leases_lock:
+            self.leases.discard(lease)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.wait(self.renewal_interval_seconds):
+            with self.leases_lock:
+                leases = list(self.leases)
+
+            for lease in leases:
+                self.renew(lease)
+
+    def renew(self, lease: LockLease):
+        try:
+            is_renewed = renew_lease(lease)
+        except PyMongoError as ex:
+            # We will retry on the next iteration, the lease is still valid unless it has expired
+            logger.warning('Error while renewing lease of lock %s: %r', lease.name, ex)
+            is_renewed = lease.expires_at > get_now()
+
+        if not is_renewed:
+            logger.error('Lease of lock %s is lost', lease.name)
+            lease.is_lost = True
+            self.discard(lease)
+
+
+def get_lease_keeper() -> LeaseKeeper:
+    global _keeper
+
+    # The thread does not survive fork (Celery prefork workers), so we check the process it was started in
+    if (keeper := _keeper) and keeper.pid == os.getpid() and keeper.is_alive():
+        return keeper
+
+    with _keeper_lock:
+        if (keeper := _keeper) and keeper.pid == os.getpid() and keeper.is_alive():
+            return keeper
+
+        _keeper = keeper = LeaseKeeper(settings.LOCK_LEASE_RENEWAL_INTERVAL_SECONDS)
+        keeper.start()
+
+    return keeper
+
+
+def release_lock(lease: LockLease):
+    """
+    Release the lock held with `lease`. `BlockchainUnlockingError` is raised if the lease was lost (then
+    the lock could have been taken over by other process, so the holder's changes must not be committed)
+    """
+    delete_result = delete_lock(lease.name, lease.owner)
+    if lease.is_lost or delete_result.deleted_count < 1:
+        raise BlockchainUnlockingError(f'Lease of lock {lease.name} was lost')
+
+
 def delete_all_locks():
     return get_lock_collection().remove()
 
 
+def get_held_lease(name) -> Optional[LockLease]:
+    return _held_leases.get().get(name)
+
+
+@contextmanager
+def own_lease(lease: LockLease):
+    """
+    Register `lease` as held by the current thread (or asyncio task) and keep it renewed while in the context
+    """
+    token = _held_leases.set(dict(_held_leases.get(), **{lease.name: lease}))
+    keeper = get_lease_keeper()
+    keeper.add(lease)
+    try:
+        yield
+    finally:
+        keeper.discard(lease)
+        _held_leases.reset(token)
+
+
+def validate_is_locked(name):
+    if lease := get_held_lease(name):
+        # The lock is known to be held without a database query unless the lease is lost (then it could have
+        # been taken over by another process)
+        if not lease.is_valid():
+            raise BlockchainIsNotLockedError(f'Lease of lock {name} was lost')
+
+        return
+
+    # Lock may have been acquired with `create_lock()` directly
+    if not is_locked(name):
+        raise BlockchainIsNotLockedError
+
+
+def validate_fencing_token(name):
+    """
+    Validate that the lock is still held with the lease of the current thread (or asyncio task) by its fencing
+    token in the lock document.
+
+    Code holding the lock with `hold_lock()` writes outside a transaction (nothing is rolled back if the lease is
+    lost), so it must call this before each write step: the lock may be taken over before `LeaseKeeper` notices
+    the lease is lost.
+    """
+    if (lease := get_held_lease(name)) is None:
+        raise BlockchainIsNotLockedError(f'Lock {name} is not held')
+
+    if lease.is_valid():
+        filter_ = dict(make_filter(name), fencing_token=lease.fencing_token, expires_at={'$gt': get_now()})
+        if get_lock_collection().count_documents(filter_, limit=1):
+            return
+
+        lease.is_lost = True
+
+    raise BlockchainIsNotLockedError(f'Lease of lock {name} was lost')
+
+
+def get_lock_holder_site(name) -> Optional[str]:
+    document = get_lock_collection().find_one(make_filter(name), {'site': 1})
+    return document and document.get('site')
+
+
+def acquire_lock(name, site) -> LockLease:
+    """
+    Same as `create_lock()` with default timeout, but the failure is reported along with the call site holding the lock
+    """
+    try:
+        return create_lock(name, timeout_seconds=settings.LOCK_DEFAULT_TIMEOUT_SECONDS, site=site)
+    except BlockchainLockingError:
+        holder_site = get_lock_holder_site(name)
+        logger.warning('%s could not acquire lock %s held by %s', site, name, holder_site)
+        record_lock_failure(name, site, holder_site)
+        raise
+
+
+def add_lock_acquired_handler(name, handler: Callable):
+    """
+    Make `handler` be called every time lock `name` is acquired with `lock()` or `hold_lock()` (nobody else can
+    change the data guarded by the lock then, so in-memory state could be validated against the database)
+    """
+    _acquired_handlers.setdefault(name, []).append(handler)
+
+
+def call_lock_acquired_handlers(name):
+    for handler in _acquired_handlers.get(name, ()):
+        handler()
+
+
+def get_site(func) -> str:
+    return f'{func.__module__}.{func.__qualname__}'
+
+
 def lock(name, expect_locked=False):
     outer_expect_locked = expect_locked
 
@@ -87,26 +429,55 @@ def lock(name, expect_locked=False):
             inner_expect_locked = kwargs.pop('expect_locked', outer_expect_locked)
 
             if inner_expect_locked:
-                is_already_locked = is_locked(name)
-                if not is_already_locked:
-                    raise BlockchainIsNotLockedError
-
+                validate_is_locked(name)
                 return func(*args, **kwargs)
 
+            site = get_site(func)
+            start_time = time.perf_counter()
             try:
-                create_lock(name, timeout_seconds=settings.LOCK_DEFAULT_TIMEOUT_SECONDS)
-                transaction.get_connection().on_rollback(lambda: delete_lock(name))
+                lease = acquire_lock(name, site)
+                transaction.get_connection().on_rollback(lambda: delete_lock(name, lease.owner))
             except DuplicateKeyError:
                 raise BlockchainLockingError
 
-            return_value = func(*args, **kwargs)
-            delete_result = delete_lock(name)
+            acquired_time = time.perf_counter()
+            record_lock_wait(name, site, acquired_time - start_time)
+            try:
+                with own_lease(lease):
+                    call_lock_acquired_handlers(name)
+                    return_value = func(*args, **kwargs)
 
-            if delete_result.deleted_count < 1:
-                raise BlockchainUnlockingError
+                # If the lease was lost the exception makes the transaction roll back, so the changes do not
+                # interfere with changes of the new holder
+                release_lock(lease)
+            finally:
+                record_lock_hold(name, site, time.perf_counter() - acquired_time)
 
             return return_value
 
         return wrapper
 
     return decorator
+
+
+@contextmanager
+def hold_lock(name, site: str):
+    """
+    Hold lock for code that cannot run in a transaction (so the lock cannot be released on rollback).
+
+    The code must call `validate_fencing_token()` before each write step to stop once the lease is lost,
+    `BlockchainUnlockingError` is raised on exit if it was lost anyway.
+    """
+    lease = acquire_lock(name, site)
+    acquired_time = time.perf_counter()
+    try:
+        with own_lease(lease):
+            call_lock_acquired_handlers(name)
+            yield lease
+    except BaseException:
+        delete_lock(name, lease.owner)
+        raise
+    else:
+        release_lock(lease)
+    finally:
+        record_lock_hold(name, site, time.perf_counter() - acquired_time)
@@ -0,0 +1,256 @@
+import atexit
+import logging
+import math
+import os
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+from urllib.parse import unquote
+
+from django.conf import settings
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from node.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of histogram buckets in milliseconds (the last bucket is unbounded)
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10_000, math.inf)
+BUCKET_KEYS = tuple(f'le_{bound}' for bound in BUCKET_BOUNDS_MS)
+HISTOGRAM_NAMES = ('wait', 'hold')
+
+# Characters that cannot be used in MongoDB field names as is (`%` is the escape character itself)
+FIELD_NAME_ESCAPES = {'%': '%25', '.': '%2E', '$': '%24'}
+
+
+class Histogram:
+    __slots__ = ('bucket_counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKET_BOUNDS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms):
+        self.bucket_counts[bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+class SiteMetrics:
+    """
+    Metrics of a lock acquired at a call site that are not flushed to the database yet
+    """
+    __slots__ = ('wait', 'hold', 'failures', 'blocked_by')
+
+    def __init__(self):
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.failures = 0
+        self.blocked_by: Counter[str] = Counter()
+
+    def make_update(self) -> dict:
+        increments = {'failures': self.failures}
+        maximums = {}
+        for histogram_name in HISTOGRAM_NAMES:
+            histogram = getattr(self, histogram_name)
+            increments[f'{histogram_name}.count'] = histogram.count
+            increments[f'{histogram_name}.total_ms'] = histogram.total_ms
+            for key, bucket_count in zip(BUCKET_KEYS, histogram.bucket_counts):
+                if bucket_count:
+                    increments[f'{histogram_name}.buckets.{key}'] = bucket_count
+
+            maximums[f'{histogram_name}.max_ms'] = histogram.max_ms
+
+        for holder_site, count in self.blocked_by.items():
+            increments[f'blocked_by.{encode_field_name(holder_site)}'] = count
+
+        return {'$inc': increments, '$max': maximums}
+
+
+class LockMetricsBuffer:
+    """
+    Lock metrics collected in this process. They are periodically added up to `lock_metrics` collection by
+    `LockMetricsFlusher`, so metrics of all processes (API workers, Celery workers, management commands) could be
+    seen together.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.metrics: dict[tuple[str, str], SiteMetrics] = {}
+        self.lock = threading.Lock()
+
+    def get_site_metrics(self, name, site) -> SiteMetrics:
+        if (site_metrics := self.metrics.get((name, site))) is None:
+            self.metrics[(name, site)] = site_metrics = SiteMetrics()
+
+        return site_metrics
+
+    def record(self, name, site, histogram_name=None, duration_seconds=None, holder_site=None):
+        with self.lock:
+            site_metrics = self.get_site_metrics(name, site)
+            if histogram_name:
+                getattr(site_metrics, histogram_name).observe(duration_seconds * 1000)
+            else:
+                site_metrics.failures += 1
+                site_metrics.blocked_by[holder_site] += 1
+
+    def flush(self):
+        with self.lock:
+            metrics, self.metrics = self.metrics, {}
+
+        if not metrics:
+            return
+
+        requests = [
+            UpdateOne({'_id': make_id(name, site)}, site_metrics.make_update(), upsert=True)
+            for (name, site), site_metrics in metrics.items()
+        ]
+        try:
+            # Metrics are written regardless of transaction outcome, so no session here
+            get_lock_metrics_collection().bulk_write(requests, ordered=False)
+        except PyMongoError:
+            logger.warning('Could not flush lock metrics', exc_info=True)
+
+
+class LockMetricsFlusher(threading.Thread):
+    """
+    Background thread that flushes lock metrics of this process, so lock holders never wait for database writes
+    """
+
+    def __init__(self, buffer: LockMetricsBuffer, flush_interval_seconds: float):
+        super().__init__(name='lock-metrics-flusher', daemon=True)
+        self.buffer = buffer
+        self.flush_interval_seconds = flush_interval_seconds
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.wait(self.flush_interval_seconds):
+            try:
+                self.buffer.flush()
+            except Exception:
+                # The thread must survive, otherwise metrics would be piling up in memory
+                logger.exception('Error while flushing lock metrics')
+
+
+_buffer: Optional[LockMetricsBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_lock_metrics_collection():
+    return get_database().lock_metrics
+
+
+def make_id(name, site):
+    return {'lock': name, 'site': site}
+
+
+def encode_field_name(value: str) -> str:
+    return ''.join(FIELD_NAME_ESCAPES.get(char, char) for char in value)
+
+
+def decode_field_name(value: str) -> str:
+    return unquote(value)
+
+
+def get_buffer() -> LockMetricsBuffer:
+    global _buffer
+
+    # Metrics inherited from parent process (Celery prefork workers) are flushed by the parent, and the flusher
+    # thread does not survive fork, so both are made anew in a child process
+    if (buffer := _buffer) is None or buffer.pid != os.getpid():
+        with _buffer_lock:
+            if (buffer := _buffer) is None or buffer.pid != os.getpid():
+                _buffer = buffer = LockMetricsBuffer()
+                LockMetricsFlusher(buffer, settings.LOCK_METRICS_FLUSH_INTERVAL_SECONDS).start()
+
+    return buffer
+
+
+def record_lock_wait(name, site, duration_seconds):
+    if settings.LOCK_METRICS_ENABLED:
+        get_buffer().record(name, site, 'wait', duration_seconds)
+
+
+def record_lock_hold(name, site, duration_seconds):
+    if settings.LOCK_METRICS_ENABLED:
+        get_buffer().record(name, site, 'hold', duration_seconds)
+
+
+def record_lock_failure(name, site, holder_site):
+    if settings.LOCK_METRICS_ENABLED:
+        get_buffer().record(name, site, holder_site=holder_site or 'unknown')
+
+
+def flush_lock_metrics():
+    if (buffer := _buffer) and buffer.pid == os.getpid():
+        buffer.flush()
+
+
+def reset_lock_metrics():
+    flush_lock_metrics()
+    get_lock_metrics_collection().delete_many({})
+
+
+def get_percentile_ms(buckets: dict[str, int], count, max_ms, percentile) -> Optional[float]:
+    """
+    Return upper bound of the bucket the percentile falls into (observed maximum is the bound of the last bucket)
+    """
+    if not count:
+        return None
+
+    cumulative_count = 0
+    for bound, key in zip(BUCKET_BOUNDS_MS, BUCKET_KEYS):
+        cumulative_count += buckets.get(key, 0)
+        if cumulative_count >= count * percentile / 100:
+            return min(bound, max_ms)
+
+    return max_ms
+
+
+def make_histogram_summary(document: Optional[dict]) -> dict:
+    document = document or {}
+    buckets = document.get('buckets', {})
+    count = document.get('count', 0)
+    max_ms = document.get('max_ms', 0)
+    return {
+        'count': count,
+        'total_ms': document.get('total_ms', 0),
+        'max_ms': max_ms,
+        'p50_ms': get_percentile_ms(buckets, count, max_ms, 50),
+        'p95_ms': get_percentile_ms(buckets, count, max_ms, 95),
+        'p99_ms': get_percentile_ms(buckets, count, max_ms, 99),
+        'buckets': {key: buckets.get(key, 0) for key in BUCKET_KEYS},
+    }
+
+
+def get_lock_metrics() -> list[dict]:
+    """
+    Return lock metrics flushed by all processes ordered by total hold duration (the biggest lock consumers go
+    first). It is read-only, so metrics recorded during the last flush interval are not included.
+    """
+    metrics = []
+    for document in get_lock_metrics_collection().find():
+        blocked_by = {
+            decode_field_name(holder_site): count for holder_site, count in document.get('blocked_by', {}).items()
+        }
+        metrics.append({
+            'lock': document['_id']['lock'],
+            'site': document['_id']['site'],
+            'wait': make_histogram_summary(document.get('wait')),
+            'hold': make_histogram_summary(document.get('hold')),
+            'failures': document.get('failures', 0),
+            'blocked_by': dict(sorted(blocked_by.items(), key=lambda item: -item[1])),
+        })
+
+    return sorted(metrics, key=lambda item: -item['hold']['total_ms'])
+
+
+atexit.register(flush_lock_metrics)
@@ -9,6 +9,7 @@ from django.conf import settings
 
 from node.blockchain.inner_models import Block, Node
 from node.blockchain.models.node import Node as ORMNode
+from node.blockchain.types import Hash
 from node.core.clients.node import NodeClient
 from node.core.utils.cryptography import get_node_identifier
 from node.core.utils.misc import Wrapper
@@ -18,6 +19,7 @@ from ..constants import LAST_BLOCK_ID
 logger = logging.getLogger(__name__)
 
 node_block_cache: dict[tuple, Optional[Block]] = {}
+node_block_hash_cache: dict[tuple, Hash] = {}
 
 
 def get_nodes_from_json_file(path) -> Optional[list[Node]]:
@@ -75,6 +77,14 @@ def get_node_block(node: Node, block_number: Union[int, str]) -> Optional[Block]
     return block
 
 
+def get_node_block_hash(node: Node, block: Block) -> Hash:
+    key = (node.identifier, block.get_block_number())
+    if (block_hash := node_block_hash_cache.get(key)) is None:
+        node_block_hash_cache[key] = block_hash = block.make_hash()
+
+    return block_hash
+
+
 def get_available_nodes(nodes: list[Node]) -> list[Wrapper]:
     available_nodes = []
     for node in nodes:
@@ -97,7 +107,7 @@ def clusterize_nodes(node_wrappers: list[Wrapper]):
         block_number = last_block.get_block_number()
 
         # Add node to cluster (either to existing or making new one)
-        clusters[(block_number, last_block.make_hash())].add(node_wrapper)
+        clusters[(block_number, get_node_block_hash(node_wrapper.body, last_block))].add(node_wrapper)
 
         # See what hashes for the same block number do other nodes have
         for other_node_wrapper in islice(node_wrappers, node_index + 1, len(node_wrappers)):
@@ -108,7 +118,7 @@ def clusterize_nodes(node_wrappers: list[Wrapper]):
             assert block.get_block_number() == block_number
 
             # Add node to cluster (either to existing or making new one)
-            clusters[(block_number, block.make_hash())].add(other_node_wrapper)
+            clusters[(block_number, get_node_block_hash(other_node_wrapper.body, block))].add(other_node_wrapper)
 
     # Remove identical clusters (having exactly same nodes)
     reduced_clusters = set()
@@ -144,10 +154,12 @@ def clear_cache(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         node_block_cache.clear()
+        node_block_hash_cache.clear()
         try:
             return func(*args, **kwargs)
         finally:
             node_block_cache.clear()
+            node_block_hash_cache.clear()
 
     return wrapper
 
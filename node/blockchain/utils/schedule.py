@@ -0,0 +1,78 @@
+from bisect import bisect_right
+from typing import Mapping, Optional, Union
+
+from node.blockchain.types import AccountNumber, NodeRole
+
+
+class ScheduleSnapshot:
+    """
+    Immutable in-memory copy of primary validator schedule.
+
+    It answers primary validator, confirmation validator and regular node role questions for any block number
+    without database requests: schedule entry lookup is done with binary search over sorted block numbers.
+    """
+
+    __slots__ = ('_block_numbers', '_node_identifiers', '_last_block_numbers')
+
+    def __init__(self, schedule: Mapping[Union[int, str], AccountNumber]):
+        items = sorted((int(block_number), node_identifier) for block_number, node_identifier in schedule.items())
+        self._block_numbers = tuple(block_number for block_number, _ in items)
+        self._node_identifiers = tuple(node_identifier for _, node_identifier in items)
+
+        # The last block number each node is scheduled for (items are sorted, so the latest one wins)
+        self._last_block_numbers = {node_identifier: block_number for block_number, node_identifier in items}
+
+    @classmethod
+    def from_database(cls):
+        from node.blockchain.models import Schedule
+        return cls(dict(Schedule.objects.values_list('_id', 'node_identifier')))
+
+    def __len__(self):
+        return len(self._block_numbers)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScheduleSnapshot):
+            return NotImplemented
+
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.as_dict()!r})'
+
+    def as_dict(self) -> dict[int, AccountNumber]:
+        return dict(zip(self._block_numbers, self._node_identifiers))
+
+    def get_validator_identifiers(self) -> frozenset[AccountNumber]:
+        return frozenset(self._last_block_numbers)
+
+    def is_scheduled(self, node_identifier: AccountNumber) -> bool:
+        return node_identifier in self._last_block_numbers
+
+    def get_primary_validator_identifier(self, block_number: int) -> Optional[AccountNumber]:
+        """
+        Return identifier of the node scheduled to be primary validator for `block_number`
+        """
+        index = bisect_right(self._block_numbers, block_number)
+        return self._node_identifiers[index - 1] if index else None
+
+    def get_confirmation_validator_identifiers(self, block_number: int) -> frozenset[AccountNumber]:
+        """
+        Return identifiers of all scheduled nodes except primary validator for `block_number`
+        """
+        return self.get_validator_identifiers() - {self.get_primary_validator_identifier(block_number)}
+
+    def is_scheduled_after(self, node_identifier: AccountNumber, block_number: int) -> bool:
+        last_block_number = self._last_block_numbers.get(node_identifier)
+        return last_block_number is not None and last_block_number > block_number
+
+    def get_node_role(self, node_identifier: AccountNumber, block_number: int) -> NodeRole:
+        """
+        Return role of a declared node for `block_number`
+        """
+        if self.get_primary_validator_identifier(block_number) == node_identifier:
+            return NodeRole.PRIMARY_VALIDATOR
+
+        if self.is_scheduled_after(node_identifier, block_number):
+            return NodeRole.CONFIRMATION_VALIDATOR
+
+        return NodeRole.REGULAR_NODE
@@ -0,0 +1,73 @@
+import re
+
+from node.blockchain.constants import BLOCK_LOCK
+from node.blockchain.utils.lock import validate_fencing_token
+from node.core.database import copy_collection, get_database
+from node.core.exceptions import SnapshotError
+
+SNAPSHOT_PREFIX = 'snapshot__'
+SNAPSHOT_NAME_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+def get_blockchain_models():
+    # Collections that make up blockchain state (the ones `BlockchainFacade.clear()` clears)
+    from node.blockchain.models import AccountState, Block, Schedule
+    return Block, AccountState, Schedule
+
+
+def get_snapshot_collection_name(name, model):
+    return f'{SNAPSHOT_PREFIX}{name}__{model._meta.db_table}'
+
+
+def validate_snapshot_name(name):
+    if not SNAPSHOT_NAME_RE.match(name):
+        raise SnapshotError(f'Invalid snapshot name: {name!r} (only letters, digits, "_" and "-" are allowed)')
+
+
+def get_snapshot_names() -> list[str]:
+    collection_names = set(get_database().list_collection_names())
+    models = get_blockchain_models()
+    # Collection of the first model is used to find snapshots, the rest are required to be there too
+    suffix = f'__{models[0]._meta.db_table}'
+    names = (
+        collection_name[len(SNAPSHOT_PREFIX):-len(suffix)]
+        for collection_name in collection_names
+        if collection_name.startswith(SNAPSHOT_PREFIX) and collection_name.endswith(suffix)
+    )
+    return sorted(
+        name for name in names
+        if all(get_snapshot_collection_name(name, model) in collection_names for model in models[1:])
+    )
+
+
+def take_snapshot(name):
+    """
+    Copy blockchain collections to snapshot collections (existing snapshot with the same name is replaced). It must
+    be run with `BLOCK_LOCK` held by `hold_lock()`
+    """
+    validate_snapshot_name(name)
+    for model in get_blockchain_models():
+        validate_fencing_token(BLOCK_LOCK)  # stop once the lock is taken over
+        copy_collection(model._meta.db_table, get_snapshot_collection_name(name, model))
+
+
+def restore_snapshot(name):
+    """
+    Replace blockchain collections contents with snapshot contents (indexes are kept as they are). It must be run
+    with `BLOCK_LOCK` held by `hold_lock()`
+    """
+    if name not in get_snapshot_names():
+        raise SnapshotError(f'Snapshot {name!r} is not found')
+
+    for model in get_blockchain_models():
+        validate_fencing_token(BLOCK_LOCK)  # stop once the lock is taken over
+        copy_collection(get_snapshot_collection_name(name, model), model._meta.db_table)
+
+
+def delete_snapshot(name):
+    if name not in get_snapshot_names():
+        raise SnapshotError(f'Snapshot {name!r} is not found')
+
+    database = get_database()
+    for model in get_blockchain_models():
+        database.drop_collection(get_snapshot_collection_name(name, model))
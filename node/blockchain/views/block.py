@@ -1,6 +1,7 @@
 import django_filters
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend, RangeFilter
+from django_filters.utils import translate_validation
 from rest_framework import status
 from rest_framework.mixins import CreateModelMixin, ListModelMixin, RetrieveModelMixin
 from rest_framework.response import Response
@@ -8,6 +9,7 @@ from rest_framework.viewsets import GenericViewSet
 
 from node.blockchain.models import Block
 from node.blockchain.serializers.block import BlockSerializer
+from node.blockchain.utils.compression import get_body_format, iter_body_chunks
 from node.core.pagination import CustomLimitOffsetNoCountPagination
 
 from ..constants import LAST_BLOCK_ID
@@ -33,7 +35,32 @@ class BlockViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Generic
         super().create(request, *args, **kwargs)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @staticmethod
+    def make_response(chunks, is_streaming=False):
+        response_class = StreamingHttpResponse if is_streaming else HttpResponse
+        return response_class(chunks, content_type='application/json')
+
+    @staticmethod
+    def iter_list_response_chunks(bodies):
+        yield '{"results":['
+        for index, body in enumerate(bodies):
+            if index:
+                yield ','
+
+            yield from iter_body_chunks(body)
+
+        yield ']}'
+
+    def make_list_response(self, bodies: list):
+        # We use customized response formation to reduce amount of serialization / deserialization.
+        # Compressed bodies are decompressed on the fly while streaming the response
+        is_streaming = any(get_body_format(body) is not None for body in bodies)
+        return self.make_response(self.iter_list_response_chunks(bodies), is_streaming=is_streaming)
+
     def list(self, request, *args, **kwargs):  # noqa: A003
+        if repository := Block.objects.repository:
+            return self.list_from_repository(repository)
+
         queryset = self.filter_queryset(self.get_queryset())
 
         page = self.paginate_queryset(queryset)
@@ -42,11 +69,31 @@ class BlockViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Generic
         else:
             serializer = self.get_serializer(page, many=True)
 
-        # We use customized response formation to reduce amount of serialization / deserialization
-        response_body = '{"results":[' + ','.join(item['body'] for item in serializer.data) + ']}'
-        return HttpResponse(content=response_body, content_type='application/json')
+        return self.make_list_response([item['body'] for item in serializer.data])
+
+    def list_from_repository(self, repository):
+        request = self.request
+        filterset = DjangoFilterBackend().get_filterset(request, self.get_queryset(), self)
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+
+        block_number_range = filterset.form.cleaned_data.get('block_number')
+        paginator = self.paginator
+        # Stored bodies are read before streaming, because the session may be ended by then
+        stored_bodies = list(
+            repository.iter_stored_block_bodies(
+                min_number=block_number_range.start if block_number_range else None,
+                max_number=block_number_range.stop if block_number_range else None,
+                offset=paginator.get_offset(request),
+                limit=paginator.get_limit(request),
+            )
+        )
+        return self.make_list_response(stored_bodies)
 
     def retrieve(self, request, *args, **kwargs):
+        if repository := Block.objects.repository:
+            return self.retrieve_from_repository(repository)
+
         if self.kwargs.get('pk') == LAST_BLOCK_ID:
             instance = Block.objects.order_by('-_id').values('_id').first()
             if instance:
@@ -55,3 +102,18 @@ class BlockViewSet(CreateModelMixin, RetrieveModelMixin, ListModelMixin, Generic
 
         instance = self.get_object()
         return HttpResponse(content=instance.body, content_type='application/json')
+
+    def retrieve_from_repository(self, repository):
+        pk = self.kwargs.get('pk')
+        if pk == LAST_BLOCK_ID:
+            number = repository.get_last_block_number()
+        else:
+            try:
+                number = int(pk)
+            except ValueError:
+                number = None
+
+        if number is None or (stored_body := repository.get_stored_block_body(number)) is None:
+            raise Http404
+
+        return self.make_response(iter_body_chunks(stored_body), is_streaming=get_body_format(stored_body) is not None)
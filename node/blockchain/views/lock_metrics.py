@@ -0,0 +1,13 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from node.blockchain.utils.lock_metrics import get_lock_metrics
+
+
+class LockMetricsViewSet(ViewSet):
+    # Call sites reveal code internals, so they are for node operators only
+    permission_classes = (IsAdminUser,)
+
+    def list(self, request, *args, **kwargs):  # noqa: A003
+        return Response(get_lock_metrics())
@@ -33,6 +33,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'node.core.middleware.ReadOnlyRequestMiddleware',
 ]
 
 ROOT_URLCONF = 'node.config.urls'
@@ -81,6 +82,15 @@ DATABASES = {
             'password': 'root',
             'serverSelectionTimeoutMS': 30000,
             'connectTimeoutMS': 30000,
+            'socketTimeoutMS': None,  # no timeout
+            # Single client is shared by all threads of the process (see `node.core.database.get_pymongo_client()`)
+            'maxPoolSize': 100,
+            'minPoolSize': 0,
+            'maxIdleTimeMS': 300000,
+            'waitQueueTimeoutMS': 30000,
+            # Wire protocol compression: list of 'zstd' (requires `zstandard` package), 'zlib' or
+            # 'snappy' (requires `python-snappy` package), empty list disables it
+            'compressors': [],
         },
         'ATOMIC_REQUESTS': True,
         'CONN_MAX_AGE': 600,
@@ -12,8 +12,44 @@ IN_DOCKER = False
 NODE_LIST_JSON_PATH = None
 SYNC_BATCH_SIZE = 10
 SCHEDULE_CAPACITY = 20
+ACCOUNT_STATE_CACHE_SIZE = 10_000  # 0 disables the cache
+QUERY_TRANSLATION_CACHE_SIZE = 1000  # SQL to Mongo query translation cache size (0 disables the cache)
+BULK_WRITE_CHUNK_SIZE = 1000  # operations per bulk write command (see `bulk_upsert()`)
+
+# Storage format for new block, pending block and block confirmation bodies: `None` (uncompressed JSON), 'zlib' or
+# 'zstd' (requires `zstandard` package). Use `compress_bodies` command to convert already stored bodies
+BODY_COMPRESSION = None
+
+# Directory of append-only segment files for finalized blocks moved out of the database by `archive_blocks`
+# command (`None` disables the archive)
+BLOCK_ARCHIVE_PATH = None
+BLOCK_ARCHIVE_SEGMENT_SIZE = 100_000  # blocks per segment file (must not be changed for an existing archive)
+BLOCK_ARCHIVE_RECENT_BLOCK_COUNT = 10_000  # number of the latest blocks that are kept in the database
+
+# Directory for periodic account state checkpoints (see `import_checkpoint` command) made every
+# `CHECKPOINT_INTERVAL` blocks (`None` disables periodic checkpoints)
+CHECKPOINT_PATH = None
+CHECKPOINT_INTERVAL = 10_000
+
+# Batches of signatures (like the ones of block confirmations) are verified by a thread pool
+SIGNATURE_VERIFICATION_WORKERS = None  # `None` means the number of CPUs
+SIGNATURE_VERIFICATION_PARALLEL_THRESHOLD = 16  # smaller batches are verified in the calling thread
 
 SUPPRESS_WARNINGS_TB = True
 
 LOCK_DEFAULT_TIMEOUT_SECONDS = 1
+# Lock held longer than that is considered abandoned (the holder crashed) and can be taken over by other process
+LOCK_LEASE_SECONDS = 60
+# Leases of held locks are renewed in background, so only crashed holders lose them
+LOCK_LEASE_RENEWAL_INTERVAL_SECONDS = 20
+# Lock release is detected with change stream if supported (replica set), otherwise it is polled
+LOCK_POLLING_INTERVAL_SECONDS = 0.05
+# Lock wait and hold time histograms (see `lock_metrics` command), they are written to the database periodically
+LOCK_METRICS_ENABLED = True
+LOCK_METRICS_FLUSH_INTERVAL_SECONDS = 10
 USE_ON_COMMIT_HOOK = False
+
+# Invalidate in-process blockchain cache when other processes add blocks (notifications are asynchronous, so the cache
+# is also validated against the committed chain tip once BLOCK_LOCK is acquired)
+CACHE_INVALIDATION_ENABLED = True
+CACHE_INVALIDATION_POLLING_INTERVAL_SECONDS = 0.1
@@ -9,6 +9,9 @@ class CustomCommand(BaseCommand):
     def write_error(self, text):
         self.write(self.style.ERROR(text))
 
+    def write_warning(self, text):
+        self.write(self.style.WARNING(text))
+
     def write_success(self, text):
         self.write(self.style.SUCCESS(text))
 
@@ -4,6 +4,7 @@ from typing import Optional
 
 from django.db.utils import Error
 from djongo.base import DatabaseWrapper as DjongoDatabaseWrapper
+from djongo.base import DjongoClient
 from djongo.cursor import Cursor
 from djongo.database import DatabaseError
 from pymongo.client_session import ClientSession
@@ -11,6 +12,8 @@ from pymongo.read_concern import ReadConcern
 from pymongo.write_concern import WriteConcern
 
 from node.core.custom_djongo.query import CustomQuery
+from node.core.database import get_pymongo_client
+from node.core.exceptions import DatabaseTransactionError
 
 from . import InitSessionMixin
 from .features import DatabaseFeatures
@@ -18,14 +21,36 @@ from .features import DatabaseFeatures
 logger = logging.getLogger(__name__)
 
 
+class CustomDjongoClient(DjongoClient):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Table name -> whether the table has auto fields (see `CustomInsertQuery.execute()`). Like djongo cached
+        # collections it lives as long as the connection, so schema changes made by other processes (migrations)
+        # are picked up on reconnect. Schema changes made with the connection clear it.
+        self.auto_field_tables: dict[str, bool] = {}
+
+
 # TODO(dmu) MEDIUM: Implement a better support for MongoDB transactions
 class CustomCursor(InitSessionMixin, Cursor):
 
+    def __init__(self, *args, **kwargs):
+        self.is_read_only = kwargs.pop('is_read_only', False)
+        super().__init__(*args, **kwargs)
+
     def execute(self, sql, params=None):
         try:
             self.result = CustomQuery(
-                self.client_conn, self.db_conn, self.connection_properties, sql, params, session=self.session
+                self.client_conn,
+                self.db_conn,
+                self.connection_properties,
+                sql,
+                params,
+                session=self.session,
+                is_read_only=self.is_read_only,
             )
+        except DatabaseTransactionError:
+            raise
         except Exception as e:
             db_exe = DatabaseError()
             raise db_exe from e
@@ -37,9 +62,19 @@ class DatabaseWrapper(DjongoDatabaseWrapper):
     def __init__(self, *args, **kwargs):
         self.session: Optional[ClientSession] = None
         self.is_autocommit = False
+        # Read-only mode is used for safe requests: queries are run outside of session and transaction
+        self.is_read_only = False
         self.on_rollback_callables = deque()
         super().__init__(*args, **kwargs)
 
+    def get_new_connection(self, connection_params):
+        # Client connection parameters are taken from settings by `get_pymongo_client()`
+        name = connection_params['name']
+        self.client_connection = get_pymongo_client()
+        database = self.client_connection[name]
+        self.djongo_connection = CustomDjongoClient(database, connection_params['enforce_schema'])
+        return database
+
     def _abort_transaction(self):
         if (session := self.session) and session.in_transaction:
             session.abort_transaction()
@@ -56,7 +91,7 @@ class DatabaseWrapper(DjongoDatabaseWrapper):
 
     def _close(self):
         """
-        Closes the client connection to the database.
+        Ends the session. The client is shared by all threads, so it is not closed (unlike djongo does).
         """
         if session := self.session:
             if session.in_transaction:
@@ -65,24 +100,28 @@ class DatabaseWrapper(DjongoDatabaseWrapper):
 
             self._end_session()
 
-        super()._close()
-
     def _rollback(self):
         logger.debug('Rolling back...')
         if self.is_autocommit:
             self.on_rollback_callables.clear()
             return
 
+        if self.is_read_only and not self.session:
+            self._run_on_rollback_callables()
+            return
+
         self._abort_transaction()
         self._end_session()
+        self._run_on_rollback_callables()
 
+    def _run_on_rollback_callables(self):
         on_rollback_callables = self.on_rollback_callables
         while on_rollback_callables:
             on_rollback_callables.popleft()()
 
     def _commit(self):
         logger.debug('Committing...')
-        if self.is_autocommit:
+        if self.is_autocommit or (self.is_read_only and not self.session):
             self.on_rollback_callables.clear()
             return
 
@@ -110,7 +149,7 @@ class DatabaseWrapper(DjongoDatabaseWrapper):
 
     def create_cursor(self, name=None):
         logger.debug('Create cursor in wrapper: %s (session: %s)', id(self), id(self.session))
-        if (session := self.session) is None and not self.is_autocommit:
+        if (session := self.session) is None and not self.is_autocommit and not self.is_read_only:
             self.session = session = self.client_connection.start_session()
 
             # Starting transactions with non-default concerns to achieve READ COMMITTED isolation level as per
@@ -123,7 +162,13 @@ class DatabaseWrapper(DjongoDatabaseWrapper):
             assert session.in_transaction
             logger.debug('Started transaction for session: %s', id(session))
 
-        return CustomCursor(self.client_connection, self.connection, self.djongo_connection, session=session)
+        return CustomCursor(
+            self.client_connection,
+            self.connection,
+            self.djongo_connection,
+            session=session,
+            is_read_only=self.is_read_only,
+        )
 
     def on_rollback(self, callable_):
         self.on_rollback_callables.append(callable_)
@@ -1,12 +1,42 @@
 import logging
+import threading
 
+import djongo
+from django.conf import settings
+from djongo.exceptions import MigrationError, SQLDecodeError
 from djongo.sql2mongo.query import DeleteQuery, InsertQuery, Query, SelectQuery, UpdateQuery
 from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+from sqlparse import parse as sqlparse
+
+from node.core.exceptions import DatabaseTransactionError
+from node.core.utils.collections import LRUCache
 
 from . import InitSessionMixin
 
 logger = logging.getLogger(__name__)
 
+CACHEABLE_STATEMENT_TYPES = frozenset(('SELECT', 'UPDATE', 'INSERT', 'DELETE'))
+
+_translation_cache = LRUCache(0)
+_translation_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> LRUCache:
+    global _translation_cache
+
+    # We respect settings changes (for instance, in unittests)
+    if (cache := _translation_cache).maxsize != (maxsize := settings.QUERY_TRANSLATION_CACHE_SIZE):
+        with _translation_cache_lock:
+            if (cache := _translation_cache).maxsize != maxsize:
+                _translation_cache = cache = LRUCache(maxsize)
+
+    return cache
+
+
+def get_translation_cache_info() -> dict[str, int]:
+    return get_translation_cache().get_info()
+
 
 class CustomUpdateQuery(InitSessionMixin, UpdateQuery):
 
@@ -28,9 +58,15 @@ class CustomInsertQuery(InitSessionMixin, InsertQuery):
         docs = []
         num = len(self._values)
 
-        filter_ = {'name': self.left_table, 'auto': {'$exists': True}}
-        update = {'$inc': {'auto.seq': num}}
-        auto = self.db['__schema__'].find_one_and_update(filter_, update, return_document=ReturnDocument.AFTER)
+        # Most of our tables have explicit `_id`, so we skip auto fields sequence update for them
+        auto_field_tables = self.connection_properties.auto_field_tables
+        if auto_field_tables.get(self.left_table, True):
+            filter_ = {'name': self.left_table, 'auto': {'$exists': True}}
+            update = {'$inc': {'auto.seq': num}}
+            auto = self.db['__schema__'].find_one_and_update(filter_, update, return_document=ReturnDocument.AFTER)
+            auto_field_tables[self.left_table] = bool(auto)
+        else:
+            auto = None
 
         for i, val in enumerate(self._values):
             ins = {}
@@ -83,17 +119,81 @@ class CustomSelectQuery(InitSessionMixin, SelectQuery):
 
 class CustomQuery(InitSessionMixin, Query):
 
+    def __init__(self, *args, **kwargs):
+        # Queries of read-only mode are run without session (see `node.core.database.read_only_mode()`), so writes
+        # would not be atomic even inside an atomic block
+        self.is_read_only = kwargs.pop('is_read_only', False)
+        super().__init__(*args, **kwargs)
+
+    def parse(self):
+        """
+        Same as `Query.parse()`, but the parsed statement is cached by SQL text (see `parse_statements()`)
+        """
+        logger.debug(f'sql_command: {self._sql}\nparams: {self._params}')
+        statement = self.parse_statements()
+
+        if len(statement) > 1:
+            raise SQLDecodeError(self._sql)
+
+        statement = statement[0]
+        sm_type = statement.get_type()
+
+        try:
+            handler = self.FUNC_MAP[sm_type]
+        except KeyError:
+            logger.debug('\n Not implemented {} {}'.format(sm_type, statement))
+            raise SQLDecodeError(f'{sm_type} command not implemented for SQL {self._sql}')
+
+        try:
+            return handler(self, statement)
+        except (MigrationError, DatabaseTransactionError):
+            raise
+        except OperationFailure as e:
+            raise SQLDecodeError(err_sql=self._sql, params=self._params, version=djongo.__version__) from e
+        except SQLDecodeError as e:
+            e.err_sql = self._sql
+            e.params = self._params
+            e.version = djongo.__version__
+            raise e
+        except Exception as e:
+            raise SQLDecodeError(err_sql=self._sql, params=self._params, version=djongo.__version__) from e
+
+    def parse_statements(self):
+        """
+        Parse SQL text with caching of the parsed statements.
+
+        Parameters are substituted with placeholders in SQL text, so the parsed statement is a template that
+        is bound to parameters when Mongo query is built from it (parsing is the most expensive part).
+        """
+        cache = get_translation_cache()
+        if not cache.maxsize:
+            return sqlparse(self._sql)
+
+        if (statements := cache.get(self._sql)) is None:
+            statements = sqlparse(self._sql)
+            if len(statements) == 1 and statements[0].get_type() in CACHEABLE_STATEMENT_TYPES:
+                cache.set(self._sql, statements)
+
+        return statements
+
+    def ensure_writable(self):
+        if self.is_read_only:
+            raise DatabaseTransactionError(f'Writing is not allowed in read-only mode: {self._sql}')
+
     def _update(self, sm):
+        self.ensure_writable()
         query = CustomUpdateQuery(self.db, self.connection_properties, sm, self._params, session=self.session)
         query.execute()
         return query
 
     def _delete(self, sm):
+        self.ensure_writable()
         query = CustomDeleteQuery(self.db, self.connection_properties, sm, self._params, session=self.session)
         query.execute()
         return query
 
     def _insert(self, sm):
+        self.ensure_writable()
         query = CustomInsertQuery(self, self.db, self.connection_properties, sm, self._params, session=self.session)
         query.execute()
         return query
@@ -101,10 +201,25 @@ class CustomQuery(InitSessionMixin, Query):
     def _select(self, sm):
         return CustomSelectQuery(self.db, self.connection_properties, sm, self._params, session=self.session)
 
+    def _create(self, sm):
+        self.connection_properties.auto_field_tables.clear()  # schema is changed
+        return super()._create(sm)
+
+    def _alter(self, sm):
+        self.connection_properties.auto_field_tables.clear()  # schema is changed
+        return super()._alter(sm)
+
+    def _drop(self, sm):
+        self.connection_properties.auto_field_tables.clear()  # schema is changed
+        return super()._drop(sm)
+
 
 CustomQuery.FUNC_MAP.update({
     'SELECT': CustomQuery._select,
     'UPDATE': CustomQuery._update,
     'INSERT': CustomQuery._insert,
     'DELETE': CustomQuery._delete,
+    'CREATE': CustomQuery._create,
+    'ALTER': CustomQuery._alter,
+    'DROP': CustomQuery._drop,
 })
@@ -1,14 +1,21 @@
 import functools
+import os
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from typing import Optional
 
 from django.conf import settings
 from django.db import transaction
-from pymongo import MongoClient
+from pymongo import DeleteMany, IndexModel, MongoClient, UpdateOne
 from pymongo.errors import OperationFailure
 
 from node.core.exceptions import DatabaseTransactionError
 
-thread_storage = threading.local()
+_client: Optional[MongoClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
 
 
 def is_in_transaction():
@@ -27,10 +34,175 @@ def ensure_in_transaction(func):
     return wrapper
 
 
-def get_pymongo_client():
-    if (client := getattr(thread_storage, 'pymongo_client', None)) is None:
-        client_settings = settings.DATABASES['default']['CLIENT']
-        thread_storage.pymongo_client = client = MongoClient(**client_settings)
+@contextmanager
+def read_only_mode():
+    """
+    Run queries without session and transaction (they see committed data only), so reads do not compete with
+    block-writing transaction. Atomic blocks are still allowed, but writes fail with `DatabaseTransactionError`.
+    """
+    connection = transaction.get_connection()
+    if not is_mongo_connection(connection):
+        yield
+        return
+
+    is_read_only = connection.is_read_only
+    connection.is_read_only = True
+    try:
+        yield
+    finally:
+        connection.is_read_only = is_read_only
+
+
+def is_mongo_connection(connection=None):
+    connection = connection or transaction.get_connection()
+    return connection.vendor == 'djongo'
+
+
+def get_session():
+    """
+    Return session of the active transaction (if any) to be used along with raw pymongo queries
+    """
+    connection = transaction.get_connection()
+    if connection.session is None:
+        # Session is started lazily on cursor creation (see `DatabaseWrapper.create_cursor()`)
+        connection.cursor()
+
+    return connection.session
+
+
+@contextmanager
+def snapshot_session():
+    """
+    Yield session for raw pymongo queries to read data at the same point in time: session of the active
+    transaction (if any) or snapshot session. Unlike transaction, snapshot session is not limited by transaction
+    lifetime (but by `minSnapshotHistoryWindowInSeconds`), so it suits long reads.
+    """
+    if is_in_transaction() and (session := get_session()) is not None:
+        yield session
+        return
+
+    with get_pymongo_client().start_session(snapshot=True) as session:
+        yield session
+
+
+def get_collection(model):
+    """
+    Return collection of the model via the same client as ORM uses, so it can be used along with `get_session()`
+    """
+    connection = transaction.get_connection()
+    connection.ensure_connection()
+    return connection.connection[model._meta.db_table]
+
+
+def bulk_upsert(model, updates: dict, delete_pks=(), chunk_size: Optional[int] = None):
+    """
+    Upsert `model` documents with unordered bulk writes in the active transaction (if any).
+
+    `updates` maps primary key to field values to be set. Fields missing in the values are set to their defaults
+    for inserted documents only (as `get_or_create()` would do). Documents with `delete_pks` primary keys are
+    deleted within the first bulk write.
+
+    Writes are sent in chunks of `chunk_size` (`BULK_WRITE_CHUNK_SIZE` setting by default) operations to keep
+    each command small. Outside transaction every chunk is committed on its own, so large loads (like checkpoint
+    import) should be run outside transaction to stay within transaction time limit.
+    """
+    if not updates and not delete_pks:
+        return
+
+    connection = transaction.get_connection()
+    pk_field = model._meta.pk
+    fields = {field.name: field for field in model._meta.concrete_fields if not field.primary_key}
+    default_values = {name: field.get_db_prep_save(field.get_default(), connection) for name, field in fields.items()}
+
+    def iter_requests():
+        if delete_pks:
+            yield DeleteMany({
+                pk_field.column: {
+                    '$in': [pk_field.get_db_prep_save(pk, connection) for pk in delete_pks]
+                }
+            })
+
+        for pk, values in updates.items():
+            update = {
+                '$set': {
+                    fields[name].column: fields[name].get_db_prep_save(value, connection)
+                    for name, value in values.items()
+                }
+            }
+            if set_on_insert := {
+                fields[name].column: value for name, value in default_values.items() if name not in values
+            }:
+                update['$setOnInsert'] = set_on_insert
+
+            yield UpdateOne({pk_field.column: pk_field.get_db_prep_save(pk, connection)}, update, upsert=True)
+
+    collection = get_collection(model)
+    session = get_session()
+    requests = iter_requests()
+    chunk_size = chunk_size or settings.BULK_WRITE_CHUNK_SIZE
+    while chunk := list(islice(requests, chunk_size)):
+        collection.bulk_write(chunk, ordered=False, session=session)
+
+
+def get_index_models(collection) -> list[IndexModel]:
+    """
+    Return definitions of existing `collection` indexes (except primary key index) to recreate them later
+    """
+    index_models = []
+    for name, info in collection.index_information().items():
+        if name == '_id_':
+            continue
+
+        options = {key: value for key, value in info.items() if key not in ('key', 'v', 'ns')}
+        index_models.append(IndexModel(info['key'], name=name, **options))
+
+    return index_models
+
+
+def recreate_collection(model):
+    """
+    Drop `model` collection and create an empty one with the same indexes (that is much faster than deleting
+    documents one by one, but it cannot be done in a transaction)
+    """
+    if is_in_transaction():
+        raise DatabaseTransactionError('Collections cannot be dropped in a transaction')
+
+    collection = get_collection(model)
+    index_models = get_index_models(collection)
+    collection.drop()
+
+    collection = collection.database.create_collection(collection.name)
+    if index_models:
+        collection.create_indexes(index_models)
+
+
+def copy_collection(source_name, target_name):
+    """
+    Replace `target_name` collection documents with the documents of `source_name` collection on the database
+    side. Indexes of existing target collection are kept
+    """
+    database = get_database()
+    database[source_name].aggregate([{'$out': target_name}])
+    if target_name not in database.list_collection_names(filter={'name': target_name}):
+        # Empty source collection may not produce the target one
+        database.create_collection(target_name)
+
+
+def get_pymongo_client() -> MongoClient:
+    """
+    Return process-wide MongoDB client shared by all threads (it is thread-safe and maintains connection pool).
+
+    It is used by ORM (see `DatabaseWrapper.get_new_connection()`), locks and raw repositories.
+    """
+    global _client, _client_pid
+
+    # MongoClient is not fork-safe, so child processes (like Celery prefork workers) need their own clients
+    if (client := _client) is None or _client_pid != os.getpid():
+        with _client_lock:
+            if (client := _client) is None or _client_pid != os.getpid():
+                # djongo relies on ordered documents
+                _client = client = MongoClient(**settings.DATABASES['default']['CLIENT'], document_class=OrderedDict)
+                _client_pid = os.getpid()
 
     return client
 
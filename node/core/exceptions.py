@@ -70,3 +70,11 @@ class BlockchainUnlockingError(BlockchainError):
 
 class DatabaseTransactionError(NodeError):
     pass
+
+
+class CheckpointError(BlockchainError):
+    pass
+
+
+class SnapshotError(BlockchainError):
+    pass
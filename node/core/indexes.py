@@ -0,0 +1,138 @@
+import logging
+from enum import Enum
+from typing import Any, NamedTuple, Optional
+
+from pymongo.errors import OperationFailure
+
+from node.core.database import get_collection
+
+logger = logging.getLogger(__name__)
+
+
+class IndexStatus(Enum):
+    EXISTS = 'exists'
+    CREATED = 'created'
+    MISSING = 'missing'
+    CONFLICT = 'conflict'
+    FAILED = 'failed'
+
+
+class Index(NamedTuple):
+    """
+    MongoDB index declaration: `fields` are model field names (optionally prefixed with '-' for descending order)
+    """
+    fields: tuple[str, ...]
+    unique: bool = False
+
+    def get_keys(self, model) -> list[tuple[str, int]]:
+        keys = []
+        for field_name in self.fields:
+            direction = -1 if field_name.startswith('-') else 1
+            keys.append((model._meta.get_field(field_name.lstrip('-')).column, direction))
+
+        return keys
+
+
+class HotQuery(NamedTuple):
+    title: str
+    model: Any
+    filter: dict  # noqa: A003
+    sort: Optional[list[tuple[str, int]]] = None
+
+
+def get_existing_indexes(model) -> dict[tuple[tuple[str, int], ...], dict]:
+    return {
+        tuple((name, int(direction))
+              for name, direction in info['key']): info
+        for info in get_collection(model).index_information().values()
+    }
+
+
+def ensure_index(model, index: Index, create=True, replace=False) -> IndexStatus:
+    """
+    Create `index` unless an index with the same keys exists (it may be created by migrations under other name).
+
+    Existing non-unique index conflicts with unique `index`, it is replaced only if `replace` is set.
+    """
+    keys = index.get_keys(model)
+    collection = get_collection(model)
+    if info := get_existing_indexes(model).get(tuple(keys)):
+        # Existing unique index serves queries as well as non-unique one would do
+        if not index.unique or info.get('unique'):
+            return IndexStatus.EXISTS
+
+        if not (create and replace):
+            return IndexStatus.CONFLICT
+
+        collection.drop_index(keys)
+
+    if not create:
+        return IndexStatus.MISSING
+
+    # Index creation is not allowed in multi-document transaction for existing collections, so no session here
+    try:
+        collection.create_index(keys, unique=index.unique)
+    except OperationFailure:
+        # For instance, unique index cannot be built if there are duplicates
+        logger.warning('Could not create %s %s index', model.__name__, index.fields, exc_info=True)
+        return IndexStatus.FAILED
+
+    return IndexStatus.CREATED
+
+
+def delete_duplicates(model, fields: tuple[str, ...]) -> list[Any]:
+    """
+    Delete documents having the same `fields` values as another document keeping the newest one, so unique index
+    could be built. Return `_id`s of deleted documents.
+
+    Duplicates could only be inserted concurrently (`update_or_create()` fails once there are duplicates), so
+    the newest document is the one inserted last, that is the last one in natural (insertion) order.
+    """
+    columns = [model._meta.get_field(field_name).column for field_name in fields]
+    sort_stage = {'$sort': {'_id': 1}}  # for `_id`s to be listed in the same order every time
+    group_stage = {'$group': {'_id': {column: f'${column}' for column in columns}, 'ids': {'$push': '$_id'}}}
+    duplicates_stage = {'$match': {'ids.1': {'$exists': True}}}  # groups of more than one document
+    collection = get_collection(model)
+    pipeline = [sort_stage, group_stage, duplicates_stage]
+    duplicate_ids = [id_ for group in collection.aggregate(pipeline, allowDiskUse=True) for id_ in group['ids']]
+    if not duplicate_ids:
+        return []
+
+    newest_ids = {}
+    documents = collection.find({'_id': {'$in': duplicate_ids}}, dict.fromkeys(columns, 1)).sort('$natural', 1)
+    for document in documents:
+        newest_ids[tuple(document.get(column) for column in columns)] = document['_id']
+
+    kept_ids = set(newest_ids.values())
+    deleted_ids = [id_ for id_ in duplicate_ids if id_ not in kept_ids]
+    collection.delete_many({'_id': {'$in': deleted_ids}})
+    return deleted_ids
+
+
+def explain(query: HotQuery) -> dict:
+    cursor = get_collection(query.model).find(query.filter)
+    if query.sort:
+        cursor = cursor.sort(query.sort)
+
+    return cursor.explain()
+
+
+def get_plan_stages(plan: dict):
+    yield plan['stage']
+    if input_stage := plan.get('inputStage'):
+        yield from get_plan_stages(input_stage)
+
+    for input_stage in plan.get('inputStages', ()):
+        yield from get_plan_stages(input_stage)
+
+
+def is_collection_scan(query: HotQuery) -> bool:
+    try:
+        winning_plan = explain(query)['queryPlanner']['winningPlan']
+        # Slot-based execution engine (MongoDB 5.0+) nests the plan
+        winning_plan = winning_plan.get('queryPlan', winning_plan)
+    except OperationFailure:
+        logger.warning('Could not explain %s query', query.title, exc_info=True)
+        return False
+
+    return 'COLLSCAN' in get_plan_stages(winning_plan)
@@ -1,8 +1,11 @@
 import logging
 from time import time
 
+from node.core.database import read_only_mode
+
 SKIPPED_REQUEST_MEDIA_TYPES = ('multipart/form-data',)
 SKIPPED_RESPONSE_MEDIA_TYPES = ('text/html', 'text/javascript')
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
 
 logger = logging.getLogger(__name__)
 
@@ -76,3 +79,21 @@ class LoggingMiddleware:
         logger.debug('%s RESPONSE: HTTP%s %s (%s)', request_description, response.status_code, body, duration)
 
         return response
+
+
+class ReadOnlyRequestMiddleware:
+    """
+    Serve requests with safe methods without database session and transaction (see `read_only_mode()`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.method not in SAFE_METHODS:
+            return self.get_response(request)
+
+        with read_only_mode():
+            response = self.get_response(request)
+
+        return response
@@ -16,6 +16,7 @@ def cleanup_for_rollback_and_commit_tests():
 def test_settings(settings):
     with override_settings(
         USE_ON_COMMIT_HOOK=False,
+        CACHE_INVALIDATION_ENABLED=False,
         SECRET_KEY='b27c612c6cbeac10c8788fbc95b29f563cc0ea2eb7d6be08',
         NODE_SIGNING_KEY='a025da120a1c95b27f17bb9442af9c27d3a357733aa150b458f21682a2d539a9',
         CELERY_BROKER_URL='memory://',
@@ -1,6 +1,6 @@
 import pytest
 
-from node.core.utils.collections import deep_get, deep_set
+from node.core.utils.collections import LRUCache, deep_get, deep_set
 
 
 def test_deep_get():
@@ -64,3 +64,27 @@ def test_deep_set(target, keys, value):
     else:
         deep_set(target, keys, value)
         assert deep_get(target, keys) == value
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # `a` becomes the most recently used
+
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    assert cache.pop('a') == 1
+    assert len(cache) == 1
+    assert cache.get_info() == {'hits': 3, 'misses': 1, 'size': 1, 'maxsize': 2}
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(0)
+    cache.set('a', 1)
+    assert len(cache) == 0
+    assert cache.get('a') is None
@@ -0,0 +1,38 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from node.blockchain.models.account_state import AccountState
+
+
+@pytest.mark.django_db
+def test_auto_field_tables_cache():
+    connection.ensure_connection()
+    auto_field_tables = connection.djongo_connection.auto_field_tables
+    auto_field_tables.clear()
+    user_model = get_user_model()
+
+    AccountState.objects.create(_id='0' * 64, balance=10)
+    AccountState.objects.create(_id='1' * 64, balance=20)
+    assert auto_field_tables[AccountState._meta.db_table] is False
+    assert AccountState.objects.count() == 2
+
+    user1 = user_model.objects.create(username='user1')
+    user2 = user_model.objects.create(username='user2')
+    assert auto_field_tables[user_model._meta.db_table] is True
+    assert user2.id == user1.id + 1
+
+
+@pytest.mark.django_db
+def test_auto_field_tables_cache_is_per_connection():
+    connection.ensure_connection()
+    AccountState.objects.create(_id='0' * 64, balance=10)
+    assert connection.djongo_connection.auto_field_tables
+
+    # New connection (like the one opened after other process applied migrations) does not reuse the cache
+    connection_copy = connection.copy()
+    try:
+        connection_copy.ensure_connection()
+        assert connection_copy.djongo_connection.auto_field_tables == {}
+    finally:
+        connection_copy.close()
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+
+from node.core.database import get_pymongo_client
+
+
+def test_pymongo_client_is_shared_by_threads():
+    client = get_pymongo_client()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: get_pymongo_client(), range(8)))
+
+    assert all(thread_client is client for thread_client in clients)
+
+
+def test_pymongo_client_is_recreated_after_fork():
+    client = get_pymongo_client()
+    with patch('node.core.database._client', client), patch('node.core.database._client_pid', -1):
+        child_client = get_pymongo_client()
+
+    assert child_client is not client
+    assert get_pymongo_client() is client
+    child_client.close()
+
+
+@pytest.mark.django_db
+def test_orm_uses_shared_pymongo_client():
+    connection.ensure_connection()
+    assert connection.client_connection is get_pymongo_client()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_closing_orm_connection_keeps_shared_pymongo_client_open():
+    connection.ensure_connection()
+    client = get_pymongo_client()
+    with patch.object(client, 'close') as close_mock:
+        connection.close()
+
+    close_mock.assert_not_called()
+    connection.ensure_connection()
+    assert connection.client_connection is client
@@ -0,0 +1,32 @@
+from node.core.utils.cryptography import (
+    NodeSigner, derive_public_key, generate_key_pair, generate_signature, get_node_identifier, get_node_signer,
+    is_signature_valid
+)
+
+
+def test_node_signer():
+    key_pair = generate_key_pair()
+    signer = NodeSigner(key_pair.private)
+    assert signer.identifier == key_pair.public
+
+    signature = signer.sign(b'message')
+    assert signature == generate_signature(key_pair.private, b'message')
+    assert is_signature_valid(key_pair.public, b'message', signature)
+
+    messages = [str(number).encode() for number in range(5)]
+    signatures = signer.sign_many(messages)
+    assert signatures == [signer.sign(message) for message in messages]
+    assert all(
+        is_signature_valid(key_pair.public, message, signature) for message, signature in zip(messages, signatures)
+    )
+
+
+def test_get_node_signer(settings):
+    signer = get_node_signer()
+    assert get_node_signer() is signer
+    assert signer.identifier == derive_public_key(settings.NODE_SIGNING_KEY) == get_node_identifier()
+
+    key_pair = generate_key_pair()
+    settings.NODE_SIGNING_KEY = key_pair.private
+    assert get_node_signer() is not signer
+    assert get_node_identifier() == key_pair.public
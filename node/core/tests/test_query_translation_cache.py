@@ -0,0 +1,47 @@
+from unittest.mock import Mock, patch
+
+import djongo
+import pytest
+from djongo.exceptions import SQLDecodeError
+from pymongo.errors import OperationFailure
+
+from node.blockchain.models.account_state import AccountState
+from node.core.custom_djongo.query import CustomQuery, get_translation_cache_info
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('cache_size', (0, 100))
+def test_query_translation_cache(settings, cache_size):
+    settings.QUERY_TRANSLATION_CACHE_SIZE = cache_size
+    AccountState.objects.create(_id='0' * 64, balance=10)
+    AccountState.objects.create(_id='1' * 64, balance=20)
+    info = get_translation_cache_info()
+
+    # Same query shape with different parameters
+    assert AccountState.objects.get(_id='0' * 64).balance == 10
+    assert AccountState.objects.get(_id='1' * 64).balance == 20
+
+    new_info = get_translation_cache_info()
+    assert new_info['maxsize'] == cache_size
+    if cache_size:
+        assert new_info['hits'] - info['hits'] >= 1  # the second query is translated from cache
+        assert (new_info['hits'] + new_info['misses']) - (info['hits'] + info['misses']) == 2
+    else:
+        assert new_info['size'] == 0
+
+
+@pytest.mark.parametrize('cache_size', (0, 100))
+@pytest.mark.parametrize('error', (OperationFailure('failure'), SQLDecodeError(), ValueError('error')))
+def test_query_translation_errors_are_handled_like_djongo_does(settings, cache_size, error):
+    settings.QUERY_TRANSLATION_CACHE_SIZE = cache_size
+    sql = 'SELECT "account_state"."_id" FROM "account_state" WHERE "account_state"."_id" = %s'
+
+    with patch.dict(CustomQuery.FUNC_MAP, {'SELECT': Mock(side_effect=error)}):
+        with pytest.raises(SQLDecodeError) as exc_info:
+            CustomQuery(None, None, None, sql, ['0' * 64])
+
+    assert exc_info.value.err_sql == sql.replace('%s', '%(0)s')
+    assert exc_info.value.params == ['0' * 64]
+    assert exc_info.value.version == djongo.__version__
+    if not isinstance(error, SQLDecodeError):
+        assert exc_info.value.__cause__ is error
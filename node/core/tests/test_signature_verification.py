@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from node.blockchain.inner_models import BlockConfirmation
+from node.core.utils.cryptography import generate_key_pair, generate_signature, is_signature_valid
+from node.core.utils.signature_verification import (
+    deferred_signature_verification, parse_with_batch_signature_verification, verify_signatures
+)
+
+
+def make_items(count):
+    key_pair = generate_key_pair()
+    items = []
+    for number in range(count):
+        message = str(number).encode()
+        items.append((key_pair.public, message, generate_signature(key_pair.private, message)))
+
+    return items
+
+
+def test_verify_signatures(settings):
+    settings.SIGNATURE_VERIFICATION_WORKERS = 4
+    settings.SIGNATURE_VERIFICATION_PARALLEL_THRESHOLD = 2
+
+    items = make_items(50)
+    public_key, message, signature = items[10]
+    items[10] = (public_key, b'tampered', signature)
+    items[20] = (generate_key_pair().public, *items[20][1:])
+    items[30] = ('not a hex', *items[30][1:])
+    items.append(items[0])
+
+    expected_results = [is_signature_valid(*item) for item in items]
+    assert expected_results.count(False) == 3
+    assert verify_signatures(items) == expected_results
+    assert verify_signatures([]) == []
+
+
+def test_duplicate_signatures_are_verified_once(settings):
+    settings.SIGNATURE_VERIFICATION_PARALLEL_THRESHOLD = 100
+    items = make_items(2) * 3
+    with patch('node.core.utils.signature_verification.is_signature_valid', return_value=True) as mock:
+        assert verify_signatures(items) == [True] * 6
+
+    assert mock.call_count == 2
+
+
+def test_parse_with_batch_signature_verification():
+    key_pair = generate_key_pair()
+    block_confirmations = [BlockConfirmation.create(number, 'a' * 64, key_pair.private) for number in range(5)]
+    # Signature of other confirmation does not match the message
+    block_confirmations[3] = block_confirmations[3].copy(update={'signature': block_confirmations[4].signature})
+    bodies = [block_confirmation.json() for block_confirmation in block_confirmations]
+
+    parsed = parse_with_batch_signature_verification(BlockConfirmation.parse_raw, bodies)
+    assert [block_confirmation.get_number() for block_confirmation, _ in parsed] == list(range(5))
+    assert [is_signature_valid for _, is_signature_valid in parsed] == [True, True, True, False, True]
+
+
+def test_parse_with_batch_signature_verification_returns_parsing_exception():
+    key_pair = generate_key_pair()
+    bodies = [BlockConfirmation.create(number, 'a' * 64, key_pair.private).json() for number in range(3)]
+    bodies[1] = '{}'
+
+    parsed = parse_with_batch_signature_verification(BlockConfirmation.parse_raw, bodies)
+    assert parsed[0][0].get_number() == 0
+    assert isinstance(parsed[1][0], ValidationError)
+    assert parsed[2][0].get_number() == 2
+    assert [is_signature_valid for _, is_signature_valid in parsed] == [True, False, True]
+
+
+def test_deferred_signature_verification():
+    key_pair = generate_key_pair()
+    body = BlockConfirmation.create(1, 'a' * 64, key_pair.private).json()
+    with deferred_signature_verification() as items:
+        block_confirmation = BlockConfirmation.parse_raw(body)
+
+    assert items == [(
+        key_pair.public, block_confirmation.message.make_binary_representation_for_cryptography(),
+        block_confirmation.signature
+    )]
@@ -1,8 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 from django.db import transaction
 
 from node.blockchain.models.account_state import AccountState
-from node.core.database import ensure_in_transaction
+from node.core.database import ensure_in_transaction, read_only_mode
 from node.core.exceptions import DatabaseTransactionError
 
 
@@ -62,3 +64,56 @@ def test_ensure_in_transaction():
 
     with pytest.raises(DatabaseTransactionError, match='Expected to have an active transaction'):
         test_me()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_for_rollback_and_commit_tests')
+def test_read_only_mode():
+    with transaction.atomic():
+        AccountState.objects.create(_id='0' * 64, account_lock='0' * 64)
+
+    connection = transaction.get_connection()
+    with read_only_mode():
+        assert connection.is_read_only
+        with transaction.atomic():
+            assert AccountState.objects.count() == 1
+            assert connection.session is None
+
+    assert not connection.is_read_only
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_for_rollback_and_commit_tests')
+def test_writing_in_read_only_mode_fails():
+    with transaction.atomic():
+        AccountState.objects.create(_id='0' * 64, account_lock='0' * 64)
+
+    with read_only_mode():
+        with transaction.atomic():
+            with pytest.raises(DatabaseTransactionError, match='Writing is not allowed in read-only mode'):
+                AccountState.objects.create(_id='1' * 64, account_lock='1' * 64)
+
+            with pytest.raises(DatabaseTransactionError, match='Writing is not allowed in read-only mode'):
+                AccountState.objects.filter(_id='0' * 64).update(account_lock='2' * 64)
+
+            with pytest.raises(DatabaseTransactionError, match='Writing is not allowed in read-only mode'):
+                AccountState.objects.filter(_id='0' * 64).delete()
+
+    assert list(AccountState.objects.values_list('_id', 'account_lock')) == [('0' * 64, '0' * 64)]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('cleanup_for_rollback_and_commit_tests')
+def test_safe_requests_are_not_transactional(api_client):
+    connection = transaction.get_connection()
+    with transaction.atomic():
+        AccountState.objects.create(_id='0' * 64, account_lock='1' * 64)
+
+    with patch.object(
+        connection.client_connection, 'start_session', wraps=connection.client_connection.start_session
+    ) as mock:
+        response = api_client.get(f'/api/account-states/{"0" * 64}/')
+
+    assert response.status_code == 200
+    assert response.json()['account_lock'] == '1' * 64
+    mock.assert_not_called()
@@ -1,5 +1,8 @@
 import json
+import threading
+from functools import lru_cache
 from hashlib import sha3_256
+from typing import Iterable, Optional
 
 from django.conf import settings
 from nacl.exceptions import CryptoError
@@ -10,13 +13,25 @@ from node.blockchain.types import AccountNumber, Hash, KeyPair, Signature, Signi
 
 from .misc import bytes_to_hex, hex_to_bytes
 
+VERIFY_KEY_CACHE_SIZE = 4096
+SIGNING_KEY_CACHE_SIZE = 128
+
+_node_signer: Optional['NodeSigner'] = None
+_node_signer_lock = threading.Lock()
+
+
+@lru_cache(maxsize=SIGNING_KEY_CACHE_SIZE)
+def get_nacl_signing_key(signing_key: SigningKey) -> NaClSigningKey:
+    # Decoding key and deriving its verify key is the most expensive part of signing a short message
+    return NaClSigningKey(hex_to_bytes(signing_key))
+
 
 def generate_signature(signing_key: SigningKey, message: bytes) -> Signature:
-    return NaClSigningKey(hex_to_bytes(signing_key)).sign(message).signature.hex()
+    return get_nacl_signing_key(signing_key).sign(message).signature.hex()
 
 
 def derive_public_key(signing_key: SigningKey) -> AccountNumber:
-    return AccountNumber(bytes_to_hex(NaClSigningKey(hex_to_bytes(signing_key)).verify_key))
+    return AccountNumber(bytes_to_hex(get_nacl_signing_key(signing_key).verify_key))
 
 
 def normalize_dict(dict_: dict) -> bytes:
@@ -31,19 +46,58 @@ def get_signing_key():
     return settings.NODE_SIGNING_KEY
 
 
+class NodeSigner:
+    """
+    Signer with key material decoded once (use `get_node_signer()` to get the one of this node)
+    """
+
+    def __init__(self, signing_key: SigningKey):
+        self.signing_key = signing_key
+        self._nacl_signing_key = NaClSigningKey(hex_to_bytes(signing_key))
+        self.identifier = AccountNumber(bytes_to_hex(self._nacl_signing_key.verify_key))
+
+    def sign(self, message: bytes) -> Signature:
+        return self._nacl_signing_key.sign(message).signature.hex()
+
+    def sign_many(self, messages: Iterable[bytes]) -> list[Signature]:
+        sign = self._nacl_signing_key.sign
+        return [sign(message).signature.hex() for message in messages]
+
+
+def get_node_signer() -> NodeSigner:
+    """
+    Return process-wide signer of `NODE_SIGNING_KEY` (it is replaced if the setting changes)
+    """
+    global _node_signer
+
+    signing_key = get_signing_key()
+    if (signer := _node_signer) is None or signer.signing_key != signing_key:
+        with _node_signer_lock:
+            if (signer := _node_signer) is None or signer.signing_key != signing_key:
+                _node_signer = signer = NodeSigner(signing_key)
+
+    return signer
+
+
 def get_node_identifier():
-    return derive_public_key(get_signing_key())
+    return get_node_signer().identifier
+
+
+@lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def get_verify_key(verify_key: AccountNumber) -> VerifyKey:
+    # The number of signers (nodes and active accounts) is limited, so their keys are reused
+    return VerifyKey(hex_to_bytes(verify_key))
 
 
 def is_signature_valid(verify_key: AccountNumber, message: bytes, signature: Signature) -> bool:
     try:
-        verify_key_bytes = hex_to_bytes(verify_key)
+        nacl_verify_key = get_verify_key(verify_key)
         signature_bytes = hex_to_bytes(signature)
-    except ValueError:
+    except (ValueError, TypeError):
         return False
 
     try:
-        VerifyKey(verify_key_bytes).verify(message, signature_bytes)
+        nacl_verify_key.verify(message, signature_bytes)
     except CryptoError:
         return False
 
@@ -0,0 +1,126 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+
+from node.blockchain.types import AccountNumber, Signature
+
+from .cryptography import is_signature_valid
+
+SignatureItem = tuple[AccountNumber, bytes, Signature]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+# Signatures collected instead of being verified (see `deferred_signature_verification()`)
+_deferred_items: ContextVar[Optional[list[SignatureItem]]] = ContextVar('deferred_signature_items', default=None)
+
+
+def get_worker_count() -> int:
+    return settings.SIGNATURE_VERIFICATION_WORKERS or os.cpu_count() or 1
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return process-wide thread pool for signature verification (PyNaCl releases GIL while verifying, so threads
+    verify signatures on all cores)
+    """
+    global _executor, _executor_pid
+
+    # Threads do not survive fork (Celery prefork workers), so child processes need their own pool
+    if (executor := _executor) is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if (executor := _executor) is None or _executor_pid != os.getpid():
+                _executor = executor = ThreadPoolExecutor(
+                    get_worker_count(), thread_name_prefix='signature-verification'
+                )
+                _executor_pid = os.getpid()
+
+    return executor
+
+
+def verify_chunk(items: list[SignatureItem]) -> list[bool]:
+    return [is_signature_valid(*item) for item in items]
+
+
+def iter_chunks(items, chunk_size):
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def verify_signatures(items: Iterable[SignatureItem]) -> list[bool]:
+    """
+    Verify batch of (verify key, message, signature) items and return validity of each of them.
+
+    Large batches are verified in parallel by the thread pool. Duplicate items are verified once.
+    """
+    items = list(items)
+    unique_items = list(dict.fromkeys(items))
+    if len(unique_items) < settings.SIGNATURE_VERIFICATION_PARALLEL_THRESHOLD or get_worker_count() == 1:
+        results = verify_chunk(unique_items)
+    else:
+        # Several chunks per worker even out uneven verification durations
+        chunk_size = max(len(unique_items) // (get_worker_count() * 4), 1)
+        chunks_results = get_executor().map(verify_chunk, iter_chunks(unique_items, chunk_size))
+        results = [is_valid for chunk_results in chunks_results for is_valid in chunk_results]
+
+    validity = dict(zip(unique_items, results))
+    return [validity[item] for item in items]
+
+
+def verify_signature(verify_key: AccountNumber, message: bytes, signature: Signature) -> bool:
+    """
+    Verify signature unless verification is deferred, then the signature is collected to be verified later
+    along with others (and `True` is returned)
+    """
+    if (deferred_items := _deferred_items.get()) is not None:
+        deferred_items.append((verify_key, message, signature))
+        return True
+
+    return is_signature_valid(verify_key, message, signature)
+
+
+@contextmanager
+def deferred_signature_verification():
+    """
+    Collect signatures passed to `verify_signature()` in the context instead of verifying them. The caller is
+    responsible for verifying the yielded list of items.
+    """
+    items: list[SignatureItem] = []
+    token = _deferred_items.set(items)
+    try:
+        yield items
+    finally:
+        _deferred_items.reset(token)
+
+
+def parse_with_batch_signature_verification(parse: Callable, sources: Iterable) -> list[tuple[Any, bool]]:
+    """
+    Parse each of `sources` with `parse` verifying signatures of all parsed objects at once in parallel.
+
+    Return (parsed object, whether all its signatures are valid) pairs, so the caller decides how to handle
+    objects with invalid signatures (they are not rejected on parsing). If parsing of a source fails the exception
+    is returned instead of the object (with `False` validity), so other sources are still processed.
+    """
+    items: list[SignatureItem] = []
+    parsed = []
+    for source in sources:
+        with deferred_signature_verification() as object_items:
+            try:
+                obj = parse(source)
+            except Exception as ex:
+                parsed.append((ex, None, None))
+                continue
+
+        parsed.append((obj, len(items), len(items) + len(object_items)))
+        items.extend(object_items)
+
+    results = verify_signatures(items)
+    return [(obj, start is not None and all(results[start:end])) for obj, start, end in parsed]
@@ -12,6 +12,9 @@ $RUN_MANAGE_PY collectstatic --no-input
 echo 'Running migrations...'
 $RUN_MANAGE_PY migrate --no-input
 
+echo 'Ensuring indexes...'
+$RUN_MANAGE_PY ensure_indexes  # problems are reported as warnings (see `--strict`)
+
 echo 'Asserting block lock is not set...'
 $RUN_MANAGE_PY assert_is_not_locked block
 